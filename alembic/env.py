@@ -1,9 +1,9 @@
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
-from sqlalchemy import pool
+from sqlalchemy import engine_from_config, pool
 
 from alembic import context
+from fund_lens_models.base import load_all_models
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -18,8 +18,9 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
-from fund_lens_models.base import Base
-target_metadata = Base.metadata
+# The model packages load lazily; load_all_models() imports every model
+# module so autogenerate sees the whole schema.
+target_metadata = load_all_models()
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
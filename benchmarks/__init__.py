@@ -0,0 +1,7 @@
+"""Benchmarks for fund_lens_models (not shipped with the package).
+
+Run from the repository root, e.g. ``python -m benchmarks.suite`` or
+``python -m benchmarks.gold_indexes``; ``python -m benchmarks.import_time``
+times the package's import paths. :mod:`benchmarks.synthetic` generates the
+seeded data the suite loads.
+"""
@@ -0,0 +1,226 @@
+"""Compare the legacy single-column and workload-derived ``gold_contribution`` indexes.
+
+For each index set the table is recreated, loaded with the same synthetic
+rows in bulk batches (measuring insert throughput, which pays for every
+index), analyzed, and then the API query workload is timed. The plan of each
+query is recorded so the index actually chosen is visible. Results are
+printed as JSON.
+
+    python -m benchmarks.gold_indexes --rows 200000
+    python -m benchmarks.gold_indexes --url postgresql+psycopg://localhost/bench
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    Engine,
+    create_engine,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.schema import CreateTable, DropTable
+
+from fund_lens_models.dimensions import DIMENSION_TABLES
+from fund_lens_models.gold import GoldContribution
+from fund_lens_models.gold.earmarks import earmark_pairs
+
+# Columns that carried index=True before the workload-derived index set
+LEGACY_INDEXED_COLUMNS = (
+    "source_system",
+    "source_transaction_id",
+    "contribution_date",
+    "contributor_id",
+    "recipient_committee_id",
+    "recipient_candidate_id",
+    "conduit_committee_id",
+    "is_earmark_receipt",
+    "contribution_type",
+    "election_year",
+    "election_cycle",
+)
+
+CYCLES = (2020, 2022, 2024)
+CONTRIBUTION_TYPES = ("DIRECT", "EARMARKED", "IN_KIND", "TRANSFER")
+
+
+def generate_rows(count: int, seed: int) -> list[dict[str, Any]]:
+    """Deterministic synthetic gold contributions with a skewed recipient mix."""
+    rng = random.Random(seed)
+    now = date(2024, 11, 5)
+    rows = []
+    for i in range(count):
+        cycle = rng.choice(CYCLES)
+        day = date(cycle - 1, 1, 1) + timedelta(days=rng.randrange(730))
+        committee = int(rng.paretovariate(1.2)) % 2000 + 1
+        earmark = rng.random() < 0.15
+        rows.append(
+            {
+                "source_system": "MD_STATE" if i % 10 == 0 else "FEC",
+                "source_sub_id": str(i),
+                "source_transaction_id": f"SA11AI_{i // 2}{'E' if i % 2 else ''}",
+                "contribution_date": min(day, now),
+                "amount": Decimal(rng.choice((5, 10, 25, 50, 100, 250, 500, 1000, 2900))),
+                "contributor_id": rng.randrange(1, count // 4 + 2),
+                "recipient_committee_id": committee,
+                "recipient_candidate_id": committee if committee % 3 else None,
+                "conduit_committee_id": 1 if earmark else None,
+                "is_earmark_receipt": earmark and i % 2 == 0,
+                "contribution_type": rng.choice(CONTRIBUTION_TYPES),
+                "election_year": cycle,
+                "election_cycle": cycle,
+            }
+        )
+    return rows
+
+
+def _create(conn: Connection, index_set: str) -> None:
+    table = GoldContribution.__table__
+    # The coded columns reference the dim_* lookup tables (seeded on create)
+    for lookup in DIMENSION_TABLES.values():
+        lookup.create(conn, checkfirst=True)
+    conn.execute(DropTable(table, if_exists=True))
+    conn.execute(CreateTable(table))
+    if index_set == "workload":
+        for index in table.indexes:
+            index.create(conn)
+    else:
+        # Plain DDL so the legacy indexes are not attached to the shared Table
+        for column in LEGACY_INDEXED_COLUMNS:
+            conn.execute(text(f"CREATE INDEX ix_legacy_{column} ON {table.name} ({column})"))
+
+
+def _queries(sample: dict[str, Any]) -> dict[str, Callable[[], Any]]:
+    gold = GoldContribution
+    countable = ~gold.is_earmark_receipt
+    committee, candidate = sample["recipient_committee_id"], sample["recipient_candidate_id"]
+    cycle, day = sample["election_cycle"], sample["contribution_date"]
+    return {
+        "candidate_cycle_total": lambda: select(
+            func.sum(gold.amount), func.count(gold.contributor_id.distinct())
+        ).where(gold.recipient_candidate_id == candidate, gold.election_cycle == cycle, countable),
+        "committee_cycle_total": lambda: select(func.sum(gold.amount), func.count()).where(
+            gold.recipient_committee_id == committee, gold.election_cycle == cycle, countable
+        ),
+        "committee_listing": lambda: select(gold.id, gold.amount)
+        .where(gold.recipient_committee_id == committee)
+        .order_by(gold.contribution_date.desc())
+        .limit(50),
+        "contributor_history": lambda: select(gold.id, gold.amount)
+        .where(gold.contributor_id == sample["contributor_id"])
+        .order_by(gold.contribution_date),
+        "deep_keyset_page": lambda: select(gold.id)
+        .where(tuple_(gold.contribution_date, gold.id) > tuple_(day, sample["id"]))
+        .order_by(gold.contribution_date, gold.id)
+        .limit(50),
+        "conduit_cycle_total": lambda: select(func.sum(gold.amount)).where(
+            gold.conduit_committee_id == 1, gold.election_cycle == cycle
+        ),
+        # Cycle-wide stages: earmark pairing and the Parquet export's partition
+        # listing and per-partition scan (without the dimension joins)
+        "earmark_pairs": lambda: earmark_pairs(cycle),
+        "export_partitions": lambda: select(gold.election_cycle, gold.source_system)
+        .where(gold.election_cycle.in_([cycle]))
+        .distinct()
+        .order_by(gold.election_cycle, gold.source_system),
+        "export_partition_scan": lambda: select(
+            gold.id, gold.contribution_date, gold.amount, gold.contributor_id
+        ).where(gold.election_cycle == cycle, gold.source_system == "FEC"),
+    }
+
+
+def _plan(conn: Connection, statement: Any) -> str:
+    compiled = statement.compile(conn, compile_kwargs={"literal_binds": True})
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    rows = conn.execute(text(prefix + str(compiled))).all()
+    return " | ".join(str(row[-1]) for row in rows)
+
+
+def run_index_set(
+    engine: Engine, index_set: str, rows: list[dict[str, Any]], batch_size: int, repeat: int
+) -> dict[str, Any]:
+    with engine.begin() as conn:
+        _create(conn, index_set)
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        for start in range(0, len(rows), batch_size):
+            conn.execute(insert(GoldContribution), rows[start : start + batch_size])
+    insert_seconds = time.perf_counter() - started
+
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+        sample = dict(
+            conn.execute(
+                select(GoldContribution.__table__)
+                .where(GoldContribution.recipient_candidate_id.is_not(None))
+                .order_by(GoldContribution.id.desc())
+                .limit(1)
+            )
+            .mappings()
+            .one()
+        )
+        queries = {}
+        for name, build in _queries(sample).items():
+            statement = build()
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                conn.execute(statement).all()
+                timings.append(time.perf_counter() - started)
+            queries[name] = {
+                "median_ms": round(statistics.median(timings) * 1000, 3),
+                "plan": _plan(conn, statement),
+            }
+    return {
+        "insert_rows_per_second": round(len(rows) / insert_seconds),
+        "insert_seconds": round(insert_seconds, 3),
+        "queries": queries,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Database URL (default: temporary SQLite file)")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{Path(tmp) / 'gold_indexes.db'}"
+        engine = create_engine(url)
+        rows = generate_rows(args.rows, args.seed)
+        results = {
+            "dialect": engine.dialect.name,
+            "rows": args.rows,
+            "index_sets": {
+                index_set: run_index_set(engine, index_set, rows, args.batch_size, args.repeat)
+                for index_set in ("legacy", "workload")
+            },
+        }
+        with engine.begin() as conn:
+            conn.execute(DropTable(GoldContribution.__table__, if_exists=True))
+        engine.dispose()
+    json.dump(results, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Import-time benchmark for the public import paths of fund_lens_models.
+
+Each statement runs in a fresh interpreter with ``python -X importtime``; the
+cumulative time of its top-level imports is summed, less the same sum for an
+empty statement (interpreter startup imports), and ``sys.modules`` is
+inspected afterwards to show which model modules the statement pulled in::
+
+    python -m benchmarks.import_time --rounds 10 --output import_time.json
+    python -m benchmarks.import_time --statement "from fund_lens_models.search import search_names"
+
+Results are JSON; ``--baseline`` adds each statement's median ratio against an
+earlier result file.
+"""
+
+import argparse
+import ast
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+STATEMENTS = (
+    "import fund_lens_models",
+    "from fund_lens_models.enums import USState",
+    "from fund_lens_models.gold import GoldContribution",
+    "from fund_lens_models.silver import SilverFECContribution",
+    "from fund_lens_models.bronze import BronzeFECScheduleA",
+    "from fund_lens_models import Base",
+    "from fund_lens_models.database import get_session",
+)
+
+# Printed by the child after the statement: loaded fund_lens_models modules
+_REPORT_MODULES = (
+    "import sys; print(sorted(m for m in sys.modules if m.startswith('fund_lens_models')))"
+)
+
+
+def _parse_importtime(stderr: str) -> int:
+    """Sum the cumulative microseconds of top-level imports in ``-X importtime`` output."""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented under their parent; count top-level ones only
+        if not name.startswith(" ") or name[1:2] == " ":
+            continue
+        try:
+            total += int(cumulative)
+        except ValueError:  # header line
+            continue
+    return total
+
+
+def measure(statement: str) -> tuple[int, list[str]]:
+    """Import time (microseconds) and loaded package modules for one fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{statement}\n{_REPORT_MODULES}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The report line itself imports nothing new, so it does not skew the total
+    return _parse_importtime(completed.stderr), ast.literal_eval(completed.stdout)
+
+
+def run(statements: tuple[str, ...] = STATEMENTS, rounds: int = 5) -> dict[str, Any]:
+    startup = statistics.median(measure("pass")[0] for _ in range(rounds))
+    results: dict[str, Any] = {}
+    for statement in statements:
+        timings = []
+        modules: list[str] = []
+        for _ in range(rounds):
+            micros, modules = measure(statement)
+            timings.append(max(micros - startup, 0) / 1_000_000)
+        results[statement] = {
+            "rounds": rounds,
+            "min": round(min(timings), 6),
+            "max": round(max(timings), 6),
+            "median": round(statistics.median(timings), 6),
+            "modules": modules,
+        }
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "startup_seconds": round(startup / 1_000_000, 6),
+        "statements": results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, float | None]:
+    """Median import time of ``current`` divided by ``baseline`` per statement."""
+    ratios: dict[str, float | None] = {}
+    for statement, result in current["statements"].items():
+        before = baseline.get("statements", {}).get(statement)
+        if before and before["median"]:
+            ratios[statement] = round(result["median"] / before["median"], 3)
+        else:
+            ratios[statement] = None
+    return ratios
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--statement", action="append", dest="statements", help="Only time this statement"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    statements = tuple(args.statements) if args.statements else STATEMENTS
+    results = run(statements, args.rounds)
+    if args.baseline:
+        results["comparison"] = compare(json.loads(args.baseline.read_text()), results)
+
+    text = json.dumps(results, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,409 @@
+"""End-to-end benchmark scenarios over a synthetic dataset, one per pipeline stage.
+
+Each scenario has an untimed setup that puts the database in its starting
+state and a timed run that returns the number of rows it processed. Runs
+are repeated ``--rounds`` times and summarized like pytest-benchmark
+(min/max/mean/stddev/median seconds plus rows per second). Scenarios build
+on each other in order: bronze loads feed the silver transforms, which feed
+contributor de-duplication, and so on::
+
+    python -m benchmarks.suite --scale 100000 --output results.json
+    python -m benchmarks.suite --url postgresql+psycopg://localhost/bench --scale 1000000
+    python -m benchmarks.suite --scale 100000 --baseline results.json  # compare versions
+
+Results are JSON; ``--baseline`` adds each scenario's median ratio against an
+earlier result file.
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy import Engine, create_engine, delete, func, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.synthetic import DEFAULT_SEED, SyntheticDataset
+from fund_lens_models.base import Base
+from fund_lens_models.bronze.copy_load import copy_upsert
+from fund_lens_models.bronze.fec import BronzeFECCandidate, BronzeFECCommittee, BronzeFECScheduleA
+from fund_lens_models.bronze.hashing import filter_new_rows, iter_hashed_csv
+from fund_lens_models.bronze.maryland import BronzeMarylandContribution
+from fund_lens_models.bulk import bulk_upsert, upsert_fec_schedule_a
+from fund_lens_models.gold.aggregates import rebuild_daily_rollup, refresh_fundraising_totals
+from fund_lens_models.gold.dedup import MARYLAND_SOURCE, deduplicate_contributors
+from fund_lens_models.gold.earmarks import resolve_earmarks
+from fund_lens_models.gold.models import (
+    GoldCandidate,
+    GoldCandidateCycleTotal,
+    GoldCommittee,
+    GoldCommitteeCycleTotal,
+    GoldContribution,
+)
+from fund_lens_models.pagination import paginate
+from fund_lens_models.silver.enrichment import CommitteeEnrichmentCache
+from fund_lens_models.silver.fec import SilverFECContribution
+from fund_lens_models.silver.fec_transform import WATERMARK_NAME, transform_fec_contributions
+from fund_lens_models.silver.maryland import SilverMarylandContribution
+from fund_lens_models.silver.maryland_cleaning import clean_contributions
+from fund_lens_models.silver.watermark import SilverTransformWatermark
+
+DEFAULT_BATCH_SIZE = 5000
+_PAGES = 20
+
+
+@dataclass
+class Context:
+    """State shared by the scenarios of one run."""
+
+    engine: Engine
+    session_factory: sessionmaker[Session]
+    dataset: SyntheticDataset
+    workdir: Path
+    batch_size: int
+
+    @property
+    def maryland_csv(self) -> Path:
+        return self.workdir / "maryland.csv"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A timed ``run`` (returning rows processed) and its untimed ``setup``."""
+
+    name: str
+    layer: str
+    run: Callable[[Context], int]
+    setup: Callable[[Context], None] | None = None
+    requires: str | None = None  # Optional module the scenario needs
+
+
+def _clear(ctx: Context, *models: type[Base]) -> None:
+    with ctx.session_factory.begin() as session:
+        for model in models:
+            session.execute(delete(model))
+
+
+# Bronze
+
+
+def _setup_bronze(ctx: Context) -> None:
+    _clear(ctx, BronzeFECScheduleA, BronzeFECCommittee, BronzeFECCandidate)
+    with ctx.session_factory.begin() as session:
+        bulk_upsert(session, BronzeFECCandidate, ctx.dataset.fec_candidates(), ("candidate_id",))
+        bulk_upsert(session, BronzeFECCommittee, ctx.dataset.fec_committees(), ("committee_id",))
+
+
+def _bronze_fec_upsert(ctx: Context) -> int:
+    rows = 0
+    for batch in ctx.dataset.fec_schedule_a(ctx.batch_size):
+        with ctx.session_factory.begin() as session:
+            rows += upsert_fec_schedule_a(session, batch, batch_size=ctx.batch_size).total
+    return rows
+
+
+def _bronze_fec_copy(ctx: Context) -> int:
+    # COPY + staging merge on PostgreSQL, executemany upserts on SQLite
+    with ctx.session_factory.begin() as session:
+        batches = ctx.dataset.fec_schedule_a(ctx.batch_size)
+        rows = (row for batch in batches for row in batch)
+        return copy_upsert(session, BronzeFECScheduleA, rows, batch_size=ctx.batch_size).total
+
+
+def _setup_maryland(ctx: Context) -> None:
+    _clear(ctx, BronzeMarylandContribution)
+    if not ctx.maryland_csv.exists():
+        ctx.dataset.write_maryland_csv(ctx.maryland_csv)
+
+
+def _bronze_maryland_load(ctx: Context) -> int:
+    rows = 0
+    extra = {"source_system": MARYLAND_SOURCE}
+    for chunk in iter_hashed_csv(ctx.maryland_csv, chunk_size=ctx.batch_size, extra=extra):
+        with ctx.session_factory.begin() as session:
+            new = filter_new_rows(session, BronzeMarylandContribution, chunk)
+            bulk_upsert(session, BronzeMarylandContribution, new, ("content_hash",))
+        rows += len(chunk)
+    return rows
+
+
+# Silver
+
+
+def _setup_silver_fec(ctx: Context) -> None:
+    _clear(ctx, SilverFECContribution)
+    with ctx.session_factory.begin() as session:
+        session.execute(
+            delete(SilverTransformWatermark).where(SilverTransformWatermark.name == WATERMARK_NAME)
+        )
+
+
+def _silver_fec_transform(ctx: Context) -> int:
+    with ctx.session_factory() as session:
+        cache = CommitteeEnrichmentCache.load(session)
+    # Bronze loads have committed and nothing writes concurrently; reach past this millisecond
+    result = transform_fec_contributions(
+        ctx.session_factory,
+        chunk_size=ctx.batch_size,
+        enricher=cache.enrich,
+        safety_lag=timedelta(seconds=-1),
+    )
+    return result.rows_read
+
+
+def _silver_maryland_clean(ctx: Context) -> int:
+    bronze = BronzeMarylandContribution
+    columns = [c for c in bronze.__table__.c if c.name not in ("id", "created_at", "updated_at")]
+    rows = 0
+    with ctx.session_factory.begin() as session:
+        result = session.execute(
+            select(*columns).order_by(bronze.id).execution_options(yield_per=ctx.batch_size)
+        )
+        names = list(result.keys())
+        for chunk in result.partitions():
+            # Already columnar: one tuple per bronze column
+            cleaned = clean_contributions(dict(zip(names, zip(*chunk, strict=True), strict=True)))
+            bulk_upsert(session, SilverMarylandContribution, cleaned.rows, ("source_content_hash",))
+            rows += len(chunk)
+    return rows
+
+
+# Gold
+
+
+def _gold_dedup(ctx: Context) -> int:
+    with ctx.session_factory.begin() as session:
+        return deduplicate_contributors(session, rebuild=True).source_rows
+
+
+def _setup_gold_load(ctx: Context) -> None:
+    _clear(ctx, GoldContribution, GoldCommittee, GoldCandidate)
+    with ctx.session_factory.begin() as session:
+        bulk_upsert(session, GoldCommittee, ctx.dataset.gold_committees(), ("id",))
+        bulk_upsert(session, GoldCandidate, ctx.dataset.gold_candidates(), ("id",))
+
+
+def _gold_contribution_upsert(ctx: Context) -> int:
+    rows = 0
+    for batch in ctx.dataset.gold_contributions(ctx.batch_size):
+        with ctx.session_factory.begin() as session:
+            key = ("source_system", "source_sub_id")
+            rows += bulk_upsert(session, GoldContribution, batch, key).total
+    return rows
+
+
+def _setup_earmarks(ctx: Context) -> None:
+    with ctx.session_factory.begin() as session:
+        session.execute(
+            update(GoldContribution).values(is_earmark_receipt=False, conduit_committee_id=None)
+        )
+
+
+def _gold_earmarks(ctx: Context) -> int:
+    pairs = 0
+    for cycle in ctx.dataset.cycles:
+        with ctx.session_factory.begin() as session:
+            pairs += resolve_earmarks(session, cycle).pairs
+    return pairs
+
+
+def _gold_totals(ctx: Context) -> int:
+    with ctx.session_factory.begin() as session:
+        result = refresh_fundraising_totals(session, full=True)
+    return sum(result.groups_refreshed.values())
+
+
+def _gold_daily_rollup(ctx: Context) -> int:
+    cycles = ctx.dataset.cycles
+    return rebuild_daily_rollup(
+        ctx.session_factory, date(min(cycles) - 1, 1, 1), date(max(cycles), 12, 31)
+    )
+
+
+# Queries and exports
+
+
+def _api_queries(ctx: Context) -> int:
+    gold = GoldContribution
+    queries = 0
+    with ctx.session_factory() as session:
+        for committee in range(1, 11):
+            session.get(GoldCommitteeCycleTotal, (committee, ctx.dataset.cycles[-1]))
+            session.get(GoldCandidateCycleTotal, (committee, ctx.dataset.cycles[-1]))
+            session.execute(
+                select(func.sum(gold.amount), func.count()).where(
+                    gold.recipient_committee_id == committee, ~gold.is_earmark_receipt
+                )
+            ).one()
+            queries += 3
+        cursor = None
+        for _ in range(_PAGES):
+            page = paginate(session, gold, (gold.contribution_date, gold.id), cursor=cursor)
+            cursor = page.next_cursor
+            queries += 1
+            session.expunge_all()
+            if cursor is None:
+                break
+    return queries
+
+
+def _export(ctx: Context) -> int:
+    from fund_lens_models.export import export_parquet
+
+    output = ctx.workdir / "export"
+    result = export_parquet(ctx.engine.url, output, batch_size=ctx.batch_size)
+    return result.rows
+
+
+SCENARIOS = (
+    Scenario("bronze_fec_schedule_a_upsert", "bronze", _bronze_fec_upsert, _setup_bronze),
+    Scenario("bronze_fec_schedule_a_copy", "bronze", _bronze_fec_copy, _setup_bronze),
+    Scenario("bronze_md_csv_hash_load", "bronze", _bronze_maryland_load, _setup_maryland),
+    Scenario("silver_fec_transform", "silver", _silver_fec_transform, _setup_silver_fec),
+    Scenario(
+        "silver_md_clean",
+        "silver",
+        _silver_maryland_clean,
+        lambda ctx: _clear(ctx, SilverMarylandContribution),
+    ),
+    Scenario("gold_contributor_dedup", "gold", _gold_dedup),
+    Scenario("gold_contribution_upsert", "gold", _gold_contribution_upsert, _setup_gold_load),
+    Scenario("gold_earmark_resolution", "gold", _gold_earmarks, _setup_earmarks),
+    Scenario("gold_cycle_totals_refresh", "aggregate", _gold_totals),
+    Scenario("gold_daily_rollup_rebuild", "aggregate", _gold_daily_rollup),
+    Scenario("api_queries", "query", _api_queries),
+    Scenario("parquet_export", "export", _export, requires="pyarrow"),
+)
+
+
+def _summary(timings: list[float], rows: int) -> dict[str, Any]:
+    median = statistics.median(timings)
+    return {
+        "rounds": len(timings),
+        "rows": rows,
+        "min": round(min(timings), 6),
+        "max": round(max(timings), 6),
+        "mean": round(statistics.fmean(timings), 6),
+        "stddev": round(statistics.stdev(timings), 6) if len(timings) > 1 else 0.0,
+        "median": round(median, 6),
+        "rows_per_second": round(rows / median) if median else None,
+    }
+
+
+def run_scenarios(
+    ctx: Context, rounds: int = 3, only: set[str] | None = None
+) -> Iterator[tuple[Scenario, dict[str, Any]]]:
+    """Run every scenario (or those named in ``only``, with their predecessors' data).
+
+    Scenarios not selected still run once, untimed, so later ones have input.
+    """
+    for scenario in SCENARIOS:
+        if scenario.requires and importlib.util.find_spec(scenario.requires) is None:
+            yield scenario, {"skipped": f"{scenario.requires} is not installed"}
+            continue
+        selected = only is None or scenario.name in only
+        timings = []
+        rows = 0
+        for _ in range(rounds if selected else 1):
+            if scenario.setup is not None:
+                scenario.setup(ctx)
+            started = time.perf_counter()
+            rows = scenario.run(ctx)
+            timings.append(time.perf_counter() - started)
+        if selected:
+            yield scenario, {"layer": scenario.layer, **_summary(timings, rows)}
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, float]:
+    """Median-time ratio (current / baseline) per scenario present in both results."""
+    ratios = {}
+    for name, result in current["scenarios"].items():
+        previous = baseline["scenarios"].get(name, {})
+        if "median" in result and previous.get("median"):
+            ratios[name] = round(result["median"] / previous["median"], 3)
+    return ratios
+
+
+def run(
+    url: str | None,
+    scale: int,
+    seed: int = DEFAULT_SEED,
+    rounds: int = 3,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    only: set[str] | None = None,
+) -> dict[str, Any]:
+    """Create a fresh schema, run the scenarios and return the JSON-ready results."""
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        engine = create_engine(url or f"sqlite:///{workdir / 'bench.db'}")
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        ctx = Context(
+            engine=engine,
+            session_factory=sessionmaker(bind=engine),
+            dataset=SyntheticDataset(scale, seed),
+            workdir=workdir,
+            batch_size=batch_size,
+        )
+        try:
+            scenarios = {
+                scenario.name: result for scenario, result in run_scenarios(ctx, rounds, only)
+            }
+        finally:
+            if url:
+                Base.metadata.drop_all(engine)
+            engine.dispose()
+    return {
+        "metadata": {
+            "dialect": engine.dialect.name,
+            "scale": scale,
+            "seed": seed,
+            "rounds": rounds,
+            "batch_size": batch_size,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+        },
+        "scenarios": scenarios,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Database URL (default: temporary SQLite file)")
+    parser.add_argument("--scale", type=int, default=10_000, help="Schedule A rows (1e4 to 1e7)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--scenario", action="append", dest="scenarios", help="Only time this scenario"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    only = set(args.scenarios) if args.scenarios else None
+    results = run(args.url, args.scale, args.seed, args.rounds, args.batch_size, only)
+    if args.baseline:
+        results["comparison"] = compare(json.loads(args.baseline.read_text()), results)
+
+    text = json.dumps(results, indent=2, default=str) + "\n"
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""Seeded synthetic FEC and Maryland data at configurable scale.
+
+Every stream is generated lazily from a seed, so a dataset of 10 million
+contributions never has to exist in memory and two runs with the same seed
+produce identical rows. The distributions are shaped like the real sources:
+
+* a Pareto-skewed recipient mix (a few committees take most contributions);
+* a contributor pool smaller than the contribution count, with repeat
+  donors, name variants (middle initials) and shared employers, so
+  contributor de-duplication has realistic blocks;
+* conduit earmarks: a receipt with ``other_id`` set to the conduit and its
+  ``E``-suffixed earmark record;
+* Maryland MDCRIS CSV rows with string dates, ``$1,234.00`` amounts and
+  unparsed addresses.
+
+Gold rows are projections of the same contribution stream, so gold keys line
+up with the bronze ``sub_id`` and transaction ids.
+"""
+
+import csv
+import random
+from collections.abc import Iterator
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from fund_lens_models.bronze.hashing import CONTRIBUTION_CSV_COLUMNS
+from fund_lens_models.enums import FEC_OFFICES
+
+FIRST_NAMES = (
+    "JAMES", "MARY", "ROBERT", "PATRICIA", "JOHN", "JENNIFER", "MICHAEL", "LINDA", "DAVID",
+    "ELIZABETH", "WILLIAM", "BARBARA", "RICHARD", "SUSAN", "JOSEPH", "JESSICA", "THOMAS",
+    "SARAH", "CHARLES", "KAREN", "MARIA", "DANIEL", "NANCY", "MATTHEW", "LISA",
+)  # fmt: skip
+LAST_NAMES = (
+    "SMITH", "JOHNSON", "WILLIAMS", "BROWN", "JONES", "GARCIA", "MILLER", "DAVIS", "RODRIGUEZ",
+    "MARTINEZ", "HERNANDEZ", "LOPEZ", "GONZALEZ", "WILSON", "ANDERSON", "THOMAS", "TAYLOR",
+    "MOORE", "JACKSON", "MARTIN", "LEE", "PEREZ", "THOMPSON", "WHITE", "HARRIS", "SANCHEZ",
+    "CLARK", "RAMIREZ", "LEWIS", "ROBINSON", "WALKER", "YOUNG", "ALLEN", "KING", "WRIGHT",
+    "SCOTT", "TORRES", "NGUYEN", "HILL", "FLORES", "GREEN", "ADAMS", "NELSON", "BAKER",
+)  # fmt: skip
+PLACES = (
+    ("BALTIMORE", "MD", "21201"), ("ANNAPOLIS", "MD", "21401"), ("ROCKVILLE", "MD", "20850"),
+    ("SILVER SPRING", "MD", "20910"), ("BETHESDA", "MD", "20814"), ("ARLINGTON", "VA", "22201"),
+    ("WASHINGTON", "DC", "20001"), ("NEW YORK", "NY", "10001"), ("CHICAGO", "IL", "60601"),
+    ("LOS ANGELES", "CA", "90012"), ("HOUSTON", "TX", "77002"), ("PHILADELPHIA", "PA", "19103"),
+)  # fmt: skip
+EMPLOYERS = (
+    "SELF-EMPLOYED", "RETIRED", "NOT EMPLOYED", "JOHNS HOPKINS UNIVERSITY", "STATE OF MARYLAND",
+    "LOCKHEED MARTIN", "MARRIOTT INTERNATIONAL", "T. ROWE PRICE", "UNIVERSITY OF MARYLAND",
+    "FEDERAL GOVERNMENT", "KAISER PERMANENTE", "ACME CONSULTING LLC",
+)  # fmt: skip
+OCCUPATIONS = (
+    "RETIRED", "ATTORNEY", "PHYSICIAN", "TEACHER", "ENGINEER", "CONSULTANT", "NURSE",
+    "EXECUTIVE", "PROFESSOR", "SOFTWARE DEVELOPER", "NOT EMPLOYED", "OWNER",
+)  # fmt: skip
+AMOUNTS = (5, 10, 15, 25, 27, 50, 100, 100, 150, 250, 500, 1000, 2800, 3300)
+PARTIES = ("DEM", "REP", "IND", "LIB", "GRE")
+OFFICES = ("H", "S", "P")
+# FEC codes on bronze rows -> normalized gold values
+GOLD_OFFICES = {office.value: gold.value for office, gold in FEC_OFFICES.items()}
+GOLD_COMMITTEE_TYPES = {"H": "CANDIDATE", "Q": "PAC", "V": "PAC"}
+
+DEFAULT_SEED = 2024
+DEFAULT_CYCLES = (2020, 2022, 2024)
+CONDUIT_COMMITTEE_ID = "C00401224"
+EARMARK_RATE = 0.12
+SOURCE_SYSTEM = "FEC"
+
+
+class SyntheticDataset:
+    """A deterministic synthetic dataset of ``scale`` FEC contribution records.
+
+    ``scale`` counts bronze Schedule A rows (an earmarked contribution is two
+    rows); the Maryland stream has ``scale // 4`` rows. Dimension sizes grow
+    with scale.
+    """
+
+    def __init__(
+        self,
+        scale: int = 10_000,
+        seed: int = DEFAULT_SEED,
+        cycles: tuple[int, ...] = DEFAULT_CYCLES,
+    ) -> None:
+        self.scale = scale
+        self.seed = seed
+        self.cycles = cycles
+        self.committee_count = max(20, scale // 500)
+        self.candidate_count = max(10, self.committee_count // 2)
+        self.contributor_count = max(50, scale // 4)
+        self.maryland_count = max(10, scale // 4)
+        self._contributors = self._contributor_pool()
+
+    def _rng(self, stream: str) -> random.Random:
+        # One independent generator per stream, so streams can be read in any order
+        return random.Random(f"{self.seed}:{stream}")
+
+    def _contributor_pool(self) -> list[tuple[str, str, str, str, str, str, str]]:
+        rng = self._rng("contributors")
+        pool = []
+        for _ in range(self.contributor_count):
+            city, state, zip5 = rng.choice(PLACES)
+            pool.append(
+                (
+                    rng.choice(FIRST_NAMES),
+                    rng.choice(LAST_NAMES),
+                    city,
+                    state,
+                    zip5 + f"{rng.randrange(10000):04d}",
+                    rng.choice(EMPLOYERS),
+                    rng.choice(OCCUPATIONS),
+                )
+            )
+        return pool
+
+    @staticmethod
+    def committee_fec_id(index: int) -> str:
+        return f"C{index + 1:08d}"
+
+    @staticmethod
+    def candidate_fec_id(index: int) -> str:
+        return f"H{index + 1:08d}"
+
+    def _candidate_of(self, committee: int) -> int | None:
+        # Two of every three committees are principal campaign committees
+        return committee % self.candidate_count if committee % 3 else None
+
+    def fec_candidates(self) -> list[dict[str, Any]]:
+        """Bronze ``bronze_fec_candidate`` rows."""
+        rng = self._rng("candidates")
+        return [
+            {
+                "candidate_id": self.candidate_fec_id(i),
+                "source_system": SOURCE_SYSTEM,
+                "name": f"{rng.choice(LAST_NAMES)}, {rng.choice(FIRST_NAMES)}",
+                "office": rng.choice(OFFICES),
+                "state": rng.choice(PLACES)[1],
+                "party": rng.choice(PARTIES),
+                "cycles": list(self.cycles),
+                "is_active": True,
+            }
+            for i in range(self.candidate_count)
+        ]
+
+    def fec_committees(self) -> list[dict[str, Any]]:
+        """Bronze ``bronze_fec_committee`` rows, including the conduit committee."""
+        rng = self._rng("committees")
+        rows = []
+        for i in range(self.committee_count):
+            candidate = self._candidate_of(i)
+            rows.append(
+                {
+                    "committee_id": self.committee_fec_id(i),
+                    "source_system": SOURCE_SYSTEM,
+                    "name": f"{rng.choice(LAST_NAMES)} FOR {rng.choice(('CONGRESS', 'AMERICA', 'MARYLAND'))}",
+                    "committee_type": "H" if candidate is not None else "Q",
+                    "designation": "P" if candidate is not None else "U",
+                    "party": rng.choice(PARTIES),
+                    "state": rng.choice(PLACES)[1],
+                    "candidate_ids": (
+                        [self.candidate_fec_id(candidate)] if candidate is not None else None
+                    ),
+                    "cycles": list(self.cycles),
+                    "is_active": True,
+                }
+            )
+        rows.append(
+            {
+                "committee_id": CONDUIT_COMMITTEE_ID,
+                "source_system": SOURCE_SYSTEM,
+                "name": "ACTBLUE",
+                "committee_type": "V",
+                "designation": "U",
+                "state": "MA",
+                "cycles": list(self.cycles),
+                "is_active": True,
+            }
+        )
+        return rows
+
+    def contributions(self) -> Iterator[dict[str, Any]]:
+        """The neutral contribution stream that bronze and gold rows are projected from."""
+        rng = self._rng("schedule_a")
+        emitted = 0
+        transaction = 0
+        while emitted < self.scale:
+            cycle = rng.choice(self.cycles)
+            committee = int(rng.paretovariate(1.1)) % self.committee_count
+            contributor = int(rng.paretovariate(0.8)) % self.contributor_count
+            contribution_date = date(cycle - 1, 1, 1) + timedelta(days=rng.randrange(730))
+            amount = Decimal(rng.choice(AMOUNTS))
+            transaction += 1
+            transaction_id = f"SA11AI.{transaction}"
+            base = {
+                "cycle": cycle,
+                "committee": committee,
+                "candidate": self._candidate_of(committee),
+                "contributor": contributor,
+                "middle_initial": rng.choice("ABCDEFGHJKLMNPRSTW") if rng.random() < 0.1 else None,
+                "contribution_date": contribution_date,
+                "amount": amount,
+            }
+            if rng.random() < EARMARK_RATE and emitted + 2 <= self.scale:
+                # The 15E receipt from the conduit and the earmark memo it refers to
+                yield {**base, "index": emitted, "transaction_id": transaction_id, "kind": "15E"}
+                yield {
+                    **base,
+                    "index": emitted + 1,
+                    "transaction_id": transaction_id + "E",
+                    "kind": "EARMARK",
+                }
+                emitted += 2
+            else:
+                yield {**base, "index": emitted, "transaction_id": transaction_id, "kind": "15"}
+                emitted += 1
+
+    @staticmethod
+    def sub_id(index: int) -> str:
+        return str(4_000_000_000_000_000 + index)
+
+    def _contributor_name(self, record: dict[str, Any]) -> tuple[str, str, str]:
+        first, last = self._contributors[record["contributor"]][:2]
+        if record["middle_initial"]:
+            first = f"{first} {record['middle_initial']}"
+        return f"{last}, {first}", first, last
+
+    def fec_schedule_a(self, batch_size: int = 5000) -> Iterator[list[dict[str, Any]]]:
+        """Bronze ``bronze_fec_schedule_a`` rows in batches."""
+        batch: list[dict[str, Any]] = []
+        for record in self.contributions():
+            _, _, city, state, zip9, employer, occupation = self._contributors[
+                record["contributor"]
+            ]
+            name, first, last = self._contributor_name(record)
+            kind = record["kind"]
+            batch.append(
+                {
+                    "sub_id": self.sub_id(record["index"]),
+                    "source_system": SOURCE_SYSTEM,
+                    "transaction_id": record["transaction_id"],
+                    "contribution_receipt_date": record["contribution_date"],
+                    "contribution_receipt_amount": record["amount"],
+                    "contributor_name": name,
+                    "contributor_first_name": first,
+                    "contributor_last_name": last,
+                    "contributor_city": city,
+                    "contributor_state": state,
+                    "contributor_zip": zip9,
+                    "contributor_employer": employer,
+                    "contributor_occupation": occupation,
+                    "entity_type": "IND",
+                    "is_individual": True,
+                    "committee_id": self.committee_fec_id(record["committee"]),
+                    "other_id": CONDUIT_COMMITTEE_ID if kind == "15E" else None,
+                    "receipt_type": kind if kind != "EARMARK" else "15",
+                    "memo_code": "X" if kind == "EARMARK" else None,
+                    "memo_text": "EARMARKED THROUGH ACTBLUE" if kind != "15" else None,
+                    "two_year_transaction_period": record["cycle"],
+                    "report_year": record["contribution_date"].year,
+                }
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def gold_committees(self) -> list[dict[str, Any]]:
+        """``gold_committee`` rows; ids are the committee index + 1, the conduit is last."""
+        rows = []
+        for i, row in enumerate(self.fec_committees()):
+            candidate = self._candidate_of(i) if i < self.committee_count else None
+            rows.append(
+                {
+                    "id": i + 1,
+                    "name": row["name"],
+                    "committee_type": GOLD_COMMITTEE_TYPES[row["committee_type"]],
+                    "party": row.get("party"),
+                    "state": row["state"],
+                    "candidate_id": candidate + 1 if candidate is not None else None,
+                    "fec_committee_id": row["committee_id"],
+                    "is_active": True,
+                }
+            )
+        return rows
+
+    def gold_candidates(self) -> list[dict[str, Any]]:
+        """``gold_candidate`` rows; ids are the candidate index + 1."""
+        return [
+            {
+                "id": i + 1,
+                "name": row["name"],
+                "office": GOLD_OFFICES[row["office"]],
+                "jurisdiction_level": "FEDERAL",
+                "state": row["state"],
+                "party": row["party"],
+                "fec_candidate_id": row["candidate_id"],
+                "is_active": True,
+            }
+            for i, row in enumerate(self.fec_candidates())
+        ]
+
+    def gold_contributions(self, batch_size: int = 5000) -> Iterator[list[dict[str, Any]]]:
+        """``gold_contribution`` rows in batches, before earmark resolution."""
+        batch: list[dict[str, Any]] = []
+        for record in self.contributions():
+            candidate = record["candidate"]
+            batch.append(
+                {
+                    "source_system": SOURCE_SYSTEM,
+                    "source_sub_id": self.sub_id(record["index"]),
+                    "source_transaction_id": record["transaction_id"],
+                    "contribution_date": record["contribution_date"],
+                    "amount": record["amount"],
+                    "contributor_id": record["contributor"] + 1,
+                    "recipient_committee_id": record["committee"] + 1,
+                    "recipient_candidate_id": candidate + 1 if candidate is not None else None,
+                    "is_earmark_receipt": False,
+                    "contribution_type": "EARMARKED" if record["kind"] != "15" else "DIRECT",
+                    "election_year": record["cycle"],
+                    "election_cycle": record["cycle"],
+                }
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def maryland_rows(self) -> Iterator[dict[str, str]]:
+        """MDCRIS contribution CSV records keyed by the CSV headers."""
+        rng = self._rng("maryland")
+        committees = [f"{last} FOR MARYLAND" for last in LAST_NAMES]
+        for _ in range(self.maryland_count):
+            first, last, city, state, zip9, employer, occupation = self._contributors[
+                int(rng.paretovariate(0.8)) % self.contributor_count
+            ]
+            cycle = rng.choice(self.cycles)
+            day = date(cycle - 1, 1, 1) + timedelta(days=rng.randrange(730))
+            amount = rng.choice(AMOUNTS)
+            yield {
+                "Receiving Committee": rng.choice(committees),
+                "Filing Period": f"{day.year} Annual",
+                "Contribution Date": day.strftime("%m/%d/%Y"),
+                "Contributor Name": f"{last}  {first}",
+                "Contributor Address": f"{rng.randrange(1, 9999)} MAIN ST  {city}  {state} {zip9[:5]}",
+                "Contributor Type": "Individual",
+                "Contribution Type": rng.choice(
+                    ("Check", "Credit Card", "Electronic Fund Transfer")
+                ),
+                "Contribution Amount": f"${amount:,.2f}",
+                "Employer Name": employer,
+                "Employer Occupation": occupation,
+                "Office": rng.choice(("Governor (SBE)", "State Senator", "House of Delegates")),
+                "Fund Type": "Electoral",
+            }
+
+    def write_maryland_csv(self, path: str | Path) -> Path:
+        """Write the Maryland stream as an MDCRIS-shaped CSV file."""
+        path = Path(path)
+        with open(path, "w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(CONTRIBUTION_CSV_COLUMNS))
+            writer.writeheader()
+            writer.writerows(self.maryland_rows())
+        return path
@@ -1,10 +1,29 @@
-"""Shared SQLAlchemy models for FundLens project."""
+"""Shared SQLAlchemy models for FundLens project.
+
+Submodules and re-exported names load on first attribute access (PEP 562), so
+``import fund_lens_models`` does not import SQLAlchemy or any model module.
+``fund_lens_models.Base`` loads every model module first, so its metadata
+always describes the whole schema.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.7.0"
 
-from fund_lens_models import bronze, gold, silver
-from fund_lens_models.base import Base
-from fund_lens_models.enums import Office, USState
+if TYPE_CHECKING:
+    from fund_lens_models import bronze, gold, silver
+    from fund_lens_models.base import Base
+    from fund_lens_models.enums import Office, USState
+
+_SUBMODULES = {"bronze", "silver", "gold"}
+
+# Re-exported name -> module that defines it
+_ATTRIBUTES = {
+    "Base": "fund_lens_models.base",
+    "USState": "fund_lens_models.enums",
+    "Office": "fund_lens_models.enums",
+}
 
 __all__ = [
     "Base",
@@ -15,3 +34,21 @@ __all__ = [
     "gold",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name == "Base":
+        from fund_lens_models.base import load_all_models
+
+        load_all_models()
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,37 @@
-"""Base models and mixins for SQLAlchemy ORM."""
+"""Base models and mixins for SQLAlchemy ORM.
 
-from datetime import UTC, datetime
+The packages load their model modules lazily, so ``Base.metadata`` only holds
+the tables whose modules have been imported. :func:`load_all_models` imports
+every model module; tooling that needs the full schema (Alembic, ``create_all``
+for a whole database) should take the metadata from it. Mapper configuration
+calls it too, so the registry is complete whenever ``configure_mappers`` runs.
 
-from sqlalchemy import DateTime
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+Timestamp columns are filled by the database (``server_default``), not by a
+Python callable per row, so Core inserts, bulk upserts and raw ``COPY`` loads
+that leave them out still get correct values. :mod:`fund_lens_models.timestamps`
+brings existing databases up to date.
+"""
+
+import importlib
+from datetime import datetime
+from typing import Any, ClassVar
+
+from sqlalchemy import DateTime, MetaData, event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Mapped, Mapper, mapped_column
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+# Every module that declares models on Base
+MODEL_MODULES = (
+    "fund_lens_models.bronze.fec",
+    "fund_lens_models.bronze.maryland",
+    "fund_lens_models.silver.fec",
+    "fund_lens_models.silver.maryland",
+    "fund_lens_models.silver.watermark",
+    "fund_lens_models.dimensions",
+    "fund_lens_models.gold.models",
+)
 
 
 class Base(DeclarativeBase):
@@ -12,19 +40,65 @@ class Base(DeclarativeBase):
     pass
 
 
+def load_all_models() -> MetaData:
+    """Import every model module and return the fully populated ``Base.metadata``."""
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+    return Base.metadata
+
+
+@event.listens_for(Mapper, "before_configured")
+def _load_models_before_configure() -> None:
+    load_all_models()
+
+
+class utcnow(FunctionElement[datetime]):
+    """Current timestamp evaluated by the database, with sub-second precision.
+
+    ``now()``/``CURRENT_TIMESTAMP`` on PostgreSQL (``timestamptz``, so UTC on
+    read). SQLite's ``CURRENT_TIMESTAMP`` only has whole seconds, which would
+    break ``updated_at`` watermarks, so it renders a millisecond UTC string
+    padded to the six fractional digits SQLAlchemy stores for Python
+    datetimes; SQLite compares them as text.
+    """
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')"
+
+
 class TimestampMixin:
-    """Mixin for created_at and updated_at timestamps."""
+    """Mixin for created_at and updated_at timestamps.
+
+    ``updated_at`` is set in the SQL of every SQLAlchemy ``UPDATE`` that does
+    not assign it; updates issued outside SQLAlchemy need the trigger from
+    :func:`fund_lens_models.timestamps.install_timestamp_defaults`.
+    ``eager_defaults`` fetches the database-generated values in the flush
+    itself (``RETURNING``), so reading them afterwards never lazy-loads, which
+    async sessions cannot do.
+    """
+
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=utcnow(),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
@@ -35,6 +109,6 @@ class SourceMetadataMixin:
     source_system: Mapped[str] = mapped_column(nullable=False, index=True)
     ingestion_timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=utcnow(),
         nullable=False,
     )
@@ -1,17 +1,33 @@
 """Bronze layer models for raw data from source systems."""
 
-from fund_lens_models.bronze.fec import (
-    BronzeFECCandidate,
-    BronzeFECCommittee,
-    BronzeFECExtractionState,
-    BronzeFECScheduleA,
-)
-from fund_lens_models.bronze.maryland import (
-    BronzeMarylandCandidate,
-    BronzeMarylandCommittee,
-    BronzeMarylandContribution,
-    BronzeMarylandExtractionState,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fund_lens_models.bronze.fec import (
+        BronzeFECCandidate,
+        BronzeFECCommittee,
+        BronzeFECExtractionState,
+        BronzeFECScheduleA,
+    )
+    from fund_lens_models.bronze.maryland import (
+        BronzeMarylandCandidate,
+        BronzeMarylandCommittee,
+        BronzeMarylandContribution,
+        BronzeMarylandExtractionState,
+    )
+
+# Public name -> defining module, imported on first access (PEP 562)
+_ATTRIBUTES = {
+    "BronzeFECCandidate": "fund_lens_models.bronze.fec",
+    "BronzeFECCommittee": "fund_lens_models.bronze.fec",
+    "BronzeFECExtractionState": "fund_lens_models.bronze.fec",
+    "BronzeFECScheduleA": "fund_lens_models.bronze.fec",
+    "BronzeMarylandCandidate": "fund_lens_models.bronze.maryland",
+    "BronzeMarylandCommittee": "fund_lens_models.bronze.maryland",
+    "BronzeMarylandContribution": "fund_lens_models.bronze.maryland",
+    "BronzeMarylandExtractionState": "fund_lens_models.bronze.maryland",
+}
 
 __all__ = [
     # FEC models
@@ -25,3 +41,15 @@ __all__ = [
     "BronzeMarylandCandidate",
     "BronzeMarylandExtractionState",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,300 @@
+"""``COPY``-based bulk ingest for the bronze tables.
+
+Multi-row ``INSERT`` statements spend most of their time compiling SQL and
+binding parameters. For statewide reloads and FEC bulk files,
+:func:`copy_upsert` uses the PostgreSQL bulk path instead. Each batch is:
+
+1. encoded as ``COPY`` text format, one encoder per column chosen from the
+   table's column types,
+2. streamed with ``COPY ... FROM STDIN`` into a temporary staging table that
+   has the target's column types but none of its constraints or indexes, and
+3. merged into the target with one ``INSERT ... SELECT ... ON CONFLICT``
+   statement on the table's natural key (``sub_id``, ``content_hash``, ...).
+
+Rows are dicts keyed by column name, as for
+:func:`fund_lens_models.bulk.bulk_upsert`. Columns left out get their server
+defaults, including the timestamps. The COPY path works with psycopg 3 and
+psycopg2. On SQLite (local runs and tests) it falls back to ``executemany``
+of the same upsert.
+"""
+
+import io
+import json
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    Connection,
+    Date,
+    DateTime,
+    Integer,
+    Numeric,
+    column,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy import table as table_clause
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.types import JSON, TypeDecorator
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze.fec import BronzeFECCandidate, BronzeFECCommittee, BronzeFECScheduleA
+from fund_lens_models.bronze.maryland import (
+    BronzeMarylandCandidate,
+    BronzeMarylandCommittee,
+    BronzeMarylandContribution,
+)
+from fund_lens_models.bronze.raw_payload import RawPayloadMixin, with_raw_payload
+from fund_lens_models.bulk import UpsertResult, batched, dialect_name, on_conflict
+
+DEFAULT_COPY_BATCH_SIZE = 50_000
+
+# Natural key each bronze table is merged on
+COPY_KEYS: dict[type[Base], tuple[str, ...]] = {
+    BronzeFECScheduleA: ("sub_id",),
+    BronzeFECCandidate: ("candidate_id",),
+    BronzeFECCommittee: ("committee_id",),
+    BronzeMarylandContribution: ("content_hash",),
+    BronzeMarylandCandidate: ("content_hash",),
+    BronzeMarylandCommittee: ("ccf_id",),
+}
+
+# Content-hashed rows never change, so a conflict means "already loaded"
+INSERT_ONLY: frozenset[type[Base]] = frozenset(
+    {BronzeMarylandContribution, BronzeMarylandCandidate}
+)
+
+Encoder = Callable[[Any], str]
+
+_NULL = "\\N"
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _encode_text(value: Any) -> str:
+    return str(value).translate(_ESCAPES)
+
+
+def _encode_json(value: Any) -> str:
+    return json.dumps(value, default=str).translate(_ESCAPES)
+
+
+def _encode_bool(value: Any) -> str:
+    return "t" if value else "f"
+
+
+def _encode_temporal(value: Any) -> str:
+    return value.isoformat() if isinstance(value, date | datetime) else _encode_text(value)
+
+
+def column_encoder(sql_type: Any) -> Encoder:
+    """``COPY`` text-format encoder for non-NULL values of a column type."""
+    if isinstance(sql_type, TypeDecorator):
+        sql_type = sql_type.load_dialect_impl(postgresql.dialect())
+    if isinstance(sql_type, JSON):
+        return _encode_json
+    if isinstance(sql_type, Boolean):
+        return _encode_bool
+    if isinstance(sql_type, Date | DateTime):
+        return _encode_temporal
+    if isinstance(sql_type, Integer | Numeric):
+        return str
+    return _encode_text
+
+
+def encode_rows(
+    table: Any, columns: Sequence[str], rows: Iterable[Mapping[str, Any]]
+) -> Iterable[str]:
+    """Yield one ``COPY`` text-format line (with newline) per row."""
+    encoders = [column_encoder(table.c[name].type) for name in columns]
+    pairs = list(zip(columns, encoders, strict=True))
+    for row in rows:
+        yield (
+            "\t".join(
+                _NULL if (value := row.get(name)) is None else encode(value)
+                for name, encode in pairs
+            )
+            + "\n"
+        )
+
+
+def merge_key(model: type[Base], partitioned: bool = False) -> tuple[str, ...]:
+    """Natural key ``model`` is merged on; ``partitioned`` appends the partition column.
+
+    Tables created by :mod:`fund_lens_models.partitioning` only have unique
+    keys that include the partition column, so ``ON CONFLICT`` must name it.
+    """
+    if model not in COPY_KEYS:
+        raise ValueError(f"{model.__name__} has no COPY merge key")
+    key = COPY_KEYS[model]
+    if not partitioned:
+        return key
+    from fund_lens_models.partitioning import PARTITION_SPECS
+
+    spec = PARTITION_SPECS.get(model.__tablename__)
+    if spec is None:
+        raise ValueError(f"{model.__name__} is not partitioned")
+    return (*key, spec.column)
+
+
+def _check_columns(table: Any, columns: Sequence[str]) -> None:
+    unknown = [name for name in columns if name not in table.c]
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {', '.join(sorted(unknown))}")
+
+
+def _dedupe(batch: list[Mapping[str, Any]], key: Sequence[str]) -> list[Mapping[str, Any]]:
+    # ON CONFLICT cannot touch the same row twice in one statement; last one wins
+    return list({tuple(row.get(name) for name in key): row for row in batch}.values())
+
+
+def _raw_connection(bind: Session | Connection) -> Any:
+    connection = bind.connection() if isinstance(bind, Session) else bind
+    return connection.connection.dbapi_connection
+
+
+def _copy(cursor: Any, sql: str, data: str) -> None:
+    if hasattr(cursor, "copy"):  # psycopg 3
+        with cursor.copy(sql) as copy:
+            copy.write(data)
+    elif hasattr(cursor, "copy_expert"):  # psycopg2
+        cursor.copy_expert(sql, io.StringIO(data))
+    else:
+        raise ValueError(f"{type(cursor).__module__} does not support COPY FROM STDIN")
+
+
+def _merge_statement(
+    model: type[Base], staging: str, columns: Sequence[str], key: Sequence[str]
+) -> Any:
+    table: Any = model.__table__
+    source = table_clause(staging, *(column(name) for name in columns))
+    stmt = postgresql.insert(table).from_select(list(columns), select(*source.c))
+    if model in INSERT_ONLY:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(key))
+    else:
+        stmt = on_conflict(stmt, table, columns, key)
+    # xmax is 0 only for tuples created by this statement
+    flags = stmt.returning(literal_column("(xmax = 0)", type_=Boolean).label("inserted")).cte(
+        "merged"
+    )
+    return select(func.count().filter(flags.c.inserted), func.count()).select_from(flags)
+
+
+def _copy_upsert_postgresql(
+    bind: Session | Connection,
+    model: type[Base],
+    rows: Iterable[Mapping[str, Any]],
+    columns: Sequence[str],
+    key: Sequence[str],
+    batch_size: int,
+) -> UpsertResult:
+    table: Any = model.__table__
+    staging = f"_copy_{table.name}"
+    column_list = ", ".join(columns)
+    raw = _raw_connection(bind)
+    merge = _merge_statement(model, staging, columns, key)
+    copy_sql = f"COPY {staging} ({column_list}) FROM STDIN"
+
+    with raw.cursor() as cursor:
+        # Column types only: no NOT NULL, defaults, keys or indexes to maintain
+        cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {table.name} WITH NO DATA"
+        )
+    result = UpsertResult()
+    for batch in batched(rows, batch_size):
+        with raw.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {staging}")
+            _copy(cursor, copy_sql, "".join(encode_rows(table, columns, _dedupe(batch, key))))
+        inserted, merged = bind.execute(merge).one()
+        result += UpsertResult(inserted=inserted, updated=merged - inserted)
+    return result
+
+
+def _copy_upsert_executemany(
+    bind: Session | Connection,
+    model: type[Base],
+    rows: Iterable[Mapping[str, Any]],
+    columns: Sequence[str],
+    key: Sequence[str],
+    batch_size: int,
+) -> UpsertResult:
+    table: Any = model.__table__
+    stmt = sqlite.insert(table)
+    if model in INSERT_ONLY:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(key))
+    else:
+        stmt = on_conflict(stmt, table, columns, key)
+
+    # executemany cannot tell inserts from updates, so compare row counts
+    count = select(func.count()).select_from(table)
+    before = bind.execute(count).scalar_one()
+    loaded = 0
+    for batch in batched(rows, batch_size):
+        values = [{name: row.get(name) for name in columns} for row in _dedupe(batch, key)]
+        bind.execute(stmt, values)
+        loaded += len(values)
+    inserted = bind.execute(count).scalar_one() - before
+    return UpsertResult(inserted=inserted, updated=0 if model in INSERT_ONLY else loaded - inserted)
+
+
+def copy_upsert(
+    bind: Session | Connection,
+    model: type[Base],
+    rows: Iterable[Mapping[str, Any]],
+    columns: Sequence[str] | None = None,
+    batch_size: int = DEFAULT_COPY_BATCH_SIZE,
+    partitioned: bool = False,
+) -> UpsertResult:
+    """Load ``rows`` into a bronze table with ``COPY`` and merge on its natural key.
+
+    Args:
+        bind: Session or Connection to execute on. The caller owns the
+            transaction; the staging table is dropped when it commits.
+        model: A bronze model in :data:`COPY_KEYS`.
+        rows: Iterable of dicts keyed by column name. Consumed lazily. A
+            ``raw_json`` document is packed into ``raw_payload`` if the model is compact.
+        columns: Columns to load. Defaults to the keys of the first row.
+            Missing keys load as NULL and other keys are ignored.
+        batch_size: Rows per ``COPY`` and merge.
+        partitioned: The table was created by :mod:`fund_lens_models.partitioning`;
+            the partition column is added to the merge key (and must be loaded).
+
+    Returns:
+        Inserted and updated row counts. Rows of insert-only (content-hashed)
+        tables that were already loaded count as neither.
+
+    Raises:
+        ValueError: If the model has no natural key here (or no partition
+            spec with ``partitioned``), a column is not in the table, the
+            dialect is neither PostgreSQL nor SQLite, or the PostgreSQL driver
+            cannot ``COPY``.
+    """
+    key = merge_key(model, partitioned)
+    if issubclass(model, RawPayloadMixin):
+        rows = (with_raw_payload(model, row) for row in rows)
+    iterator = iter(rows)
+    first = next(iterator, None)
+    if first is None:
+        return UpsertResult()
+    if columns is None:
+        columns = list(first)
+    _check_columns(model.__table__, columns)
+    missing = [name for name in key if name not in columns]
+    if missing:
+        raise ValueError(f"Rows for {model.__tablename__} need the key columns {missing}")
+
+    def all_rows() -> Iterable[Mapping[str, Any]]:
+        yield first
+        yield from iterator
+
+    dialect = dialect_name(bind)
+    if dialect == "postgresql":
+        return _copy_upsert_postgresql(bind, model, all_rows(), columns, key, batch_size)
+    if dialect == "sqlite":
+        return _copy_upsert_executemany(bind, model, all_rows(), columns, key, batch_size)
+    raise ValueError(f"copy_upsert does not support the {dialect!r} dialect")
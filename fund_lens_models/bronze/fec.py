@@ -1,18 +1,22 @@
 """Bronze layer models - raw data from source systems."""
 
 from datetime import UTC, date, datetime
-from typing import Any
 
-from sqlalchemy import JSON, Date, DateTime, Integer, Numeric, String, Text
+from sqlalchemy import JSON, Date, DateTime, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from fund_lens_models.base import Base, SourceMetadataMixin, TimestampMixin
+from fund_lens_models.bronze.raw_payload import RawPayloadMixin
 
 
-class BronzeFECScheduleA(Base, TimestampMixin, SourceMetadataMixin):
+class BronzeFECScheduleA(Base, TimestampMixin, SourceMetadataMixin, RawPayloadMixin):
     """Raw FEC Schedule A contribution data."""
 
     __tablename__ = "bronze_fec_schedule_a"
+    __table_args__ = (
+        # Keyset order for incremental bronze -> silver transforms
+        Index("ix_bronze_fec_schedule_a_updated_at_sub_id", "updated_at", "sub_id"),
+    )
 
     # Primary key
     sub_id: Mapped[str] = mapped_column(String(255), primary_key=True)
@@ -79,8 +83,7 @@ class BronzeFECScheduleA(Base, TimestampMixin, SourceMetadataMixin):
     report_year: Mapped[int | None] = mapped_column(Integer)
     report_type: Mapped[str | None] = mapped_column(String(10))
 
-    # Raw JSON for full record preservation
-    raw_json: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    # Full source record: raw_json, or compacted into raw_payload (RawPayloadMixin)
 
     def __repr__(self) -> str:
         return (
@@ -88,7 +91,7 @@ class BronzeFECScheduleA(Base, TimestampMixin, SourceMetadataMixin):
         )
 
 
-class BronzeFECCandidate(Base, TimestampMixin, SourceMetadataMixin):
+class BronzeFECCandidate(Base, TimestampMixin, SourceMetadataMixin, RawPayloadMixin):
     """Raw FEC candidate data."""
 
     __tablename__ = "bronze_fec_candidate"
@@ -143,14 +146,13 @@ class BronzeFECCandidate(Base, TimestampMixin, SourceMetadataMixin):
     address_street_2: Mapped[str | None] = mapped_column(String(500))
     address_zip: Mapped[str | None] = mapped_column(String(10))
 
-    # Raw JSON for full record preservation
-    raw_json: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    # Full source record: raw_json, or compacted into raw_payload (RawPayloadMixin)
 
     def __repr__(self) -> str:
         return f"<BronzeFECCandidate(candidate_id={self.candidate_id}, name={self.name})>"
 
 
-class BronzeFECCommittee(Base, TimestampMixin, SourceMetadataMixin):
+class BronzeFECCommittee(Base, TimestampMixin, SourceMetadataMixin, RawPayloadMixin):
     """Raw FEC committee data."""
 
     __tablename__ = "bronze_fec_committee"
@@ -195,8 +197,7 @@ class BronzeFECCommittee(Base, TimestampMixin, SourceMetadataMixin):
     is_active: Mapped[bool | None] = mapped_column()
     cycles: Mapped[list[int] | None] = mapped_column(JSON)
 
-    # Raw JSON for full record preservation
-    raw_json: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    # Full source record: raw_json, or compacted into raw_payload (RawPayloadMixin)
 
     def __repr__(self) -> str:
         return f"<BronzeFECCommittee(committee_id={self.committee_id}, name={self.name})>"
@@ -231,6 +232,10 @@ class BronzeFECExtractionState(Base, TimestampMixin):
     is_complete: Mapped[bool] = mapped_column(default=False, nullable=False)
     last_page_processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
+    # Work-queue lease (see fund_lens_models.bronze.work_queue) - NULL when unclaimed
+    lease_owner: Mapped[str | None] = mapped_column(String(255))
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
+
     def __repr__(self) -> str:
         return (
             f"<BronzeFECExtractionState("
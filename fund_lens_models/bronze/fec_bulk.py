@@ -0,0 +1,348 @@
+"""Streaming parser for FEC pipe-delimited bulk data files.
+
+Supports the contribution files (``itcont``/indiv, ``pas2``, ``itoth``/oth)
+and the committee (``cm``) and candidate (``cn``) master files. Files are read
+line by line from plain text, ``.gz`` or the single-member ``.zip`` archives
+the FEC publishes, so memory use is bounded by the chunk size rather than the
+file size. Each record is a dict keyed by the matching bronze model's column
+names, ready for :func:`fund_lens_models.bulk.bulk_upsert`.
+
+Column layouts: https://www.fec.gov/campaign-finance-data/contributions-individuals-file-description/
+"""
+
+import csv
+import gzip
+import io
+import logging
+import zipfile
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from pathlib import Path
+from typing import IO, Any, cast
+
+from sqlalchemy import Connection, inspect
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze.copy_load import copy_upsert, merge_key
+from fund_lens_models.bronze.fec import BronzeFECCandidate, BronzeFECCommittee, BronzeFECScheduleA
+from fund_lens_models.bronze.raw_payload import with_raw_payload
+from fund_lens_models.bulk import DEFAULT_BATCH_SIZE, UpsertResult, bulk_upsert
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_SOURCE_SYSTEM = "FEC_BULK"
+
+
+class FECBulkFileType(str, Enum):
+    """FEC bulk file layouts."""
+
+    INDIVIDUAL = "indiv"  # itcont.txt - individual contributions
+    PAS2 = "pas2"  # itpas2.txt - committee contributions to candidates
+    OTHER = "oth"  # itoth.txt - committee-to-committee transactions
+    COMMITTEE = "cm"  # cm.txt - committee master
+    CANDIDATE = "cn"  # cn.txt - candidate master
+
+
+_CONTRIBUTION_HEADER = (
+    "CMTE_ID",
+    "AMNDT_IND",
+    "RPT_TP",
+    "TRANSACTION_PGI",
+    "IMAGE_NUM",
+    "TRANSACTION_TP",
+    "ENTITY_TP",
+    "NAME",
+    "CITY",
+    "STATE",
+    "ZIP_CODE",
+    "EMPLOYER",
+    "OCCUPATION",
+    "TRANSACTION_DT",
+    "TRANSACTION_AMT",
+    "OTHER_ID",
+    "TRAN_ID",
+    "FILE_NUM",
+    "MEMO_CD",
+    "MEMO_TEXT",
+    "SUB_ID",
+)
+
+HEADERS: dict[FECBulkFileType, tuple[str, ...]] = {
+    FECBulkFileType.INDIVIDUAL: _CONTRIBUTION_HEADER,
+    FECBulkFileType.OTHER: _CONTRIBUTION_HEADER,
+    # pas2 carries the recipient candidate between OTHER_ID and TRAN_ID
+    FECBulkFileType.PAS2: _CONTRIBUTION_HEADER[:16] + ("CAND_ID",) + _CONTRIBUTION_HEADER[16:],
+    FECBulkFileType.COMMITTEE: (
+        "CMTE_ID",
+        "CMTE_NM",
+        "TRES_NM",
+        "CMTE_ST1",
+        "CMTE_ST2",
+        "CMTE_CITY",
+        "CMTE_ST",
+        "CMTE_ZIP",
+        "CMTE_DSGN",
+        "CMTE_TP",
+        "CMTE_PTY_AFFILIATION",
+        "CMTE_FILING_FREQ",
+        "ORG_TP",
+        "CONNECTED_ORG_NM",
+        "CAND_ID",
+    ),
+    FECBulkFileType.CANDIDATE: (
+        "CAND_ID",
+        "CAND_NAME",
+        "CAND_PTY_AFFILIATION",
+        "CAND_ELECTION_YR",
+        "CAND_OFFICE_ST",
+        "CAND_OFFICE",
+        "CAND_OFFICE_DISTRICT",
+        "CAND_ICI",
+        "CAND_STATUS",
+        "CAND_PCC",
+        "CAND_ST1",
+        "CAND_ST2",
+        "CAND_CITY",
+        "CAND_ST",
+        "CAND_ZIP",
+    ),
+}
+
+MODELS: dict[FECBulkFileType, type[Base]] = {
+    FECBulkFileType.INDIVIDUAL: BronzeFECScheduleA,
+    FECBulkFileType.OTHER: BronzeFECScheduleA,
+    FECBulkFileType.PAS2: BronzeFECScheduleA,
+    FECBulkFileType.COMMITTEE: BronzeFECCommittee,
+    FECBulkFileType.CANDIDATE: BronzeFECCandidate,
+}
+
+
+def _text(value: str) -> str | None:
+    value = value.strip()
+    return value or None
+
+
+def _int(value: str) -> int | None:
+    value = value.strip()
+    return int(value) if value.isdigit() else None
+
+
+def _amount(value: str) -> Decimal | None:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        return None
+
+
+def _mmddyyyy(value: str) -> date | None:
+    """Parse the bulk files' MMDDYYYY dates; invalid dates become None."""
+    if len(value) != 8 or not value.isdigit():
+        return None
+    try:
+        return date(int(value[4:]), int(value[:2]), int(value[2:4]))
+    except ValueError:
+        return None
+
+
+def _contribution(fields: list[str], header: tuple[str, ...]) -> dict[str, Any]:
+    raw = dict(zip(header, fields, strict=True))
+    entity_type = _text(raw["ENTITY_TP"])
+    return {
+        "sub_id": raw["SUB_ID"].strip(),
+        "transaction_id": _text(raw["TRAN_ID"]),
+        "file_number": _int(raw["FILE_NUM"]),
+        "amendment_indicator": _text(raw["AMNDT_IND"]),
+        "contribution_receipt_date": _mmddyyyy(raw["TRANSACTION_DT"]),
+        "contribution_receipt_amount": _amount(raw["TRANSACTION_AMT"]),
+        "contributor_name": _text(raw["NAME"]),
+        "contributor_city": _text(raw["CITY"]),
+        "contributor_state": _text(raw["STATE"]),
+        "contributor_zip": _text(raw["ZIP_CODE"]),
+        "contributor_employer": _text(raw["EMPLOYER"]),
+        "contributor_occupation": _text(raw["OCCUPATION"]),
+        "entity_type": entity_type,
+        "committee_id": _text(raw["CMTE_ID"]),
+        "candidate_id": _text(raw.get("CAND_ID", "")),
+        "image_number": _text(raw["IMAGE_NUM"]),
+        "other_id": _text(raw["OTHER_ID"]),
+        "is_individual": entity_type == "IND" if entity_type else None,
+        "receipt_type": _text(raw["TRANSACTION_TP"]),
+        "election_type": _text(raw["TRANSACTION_PGI"]),
+        "memo_code": _text(raw["MEMO_CD"]),
+        "memo_text": _text(raw["MEMO_TEXT"]),
+        "report_type": _text(raw["RPT_TP"]),
+    }
+
+
+def _committee(fields: list[str], header: tuple[str, ...]) -> dict[str, Any]:
+    raw = dict(zip(header, fields, strict=True))
+    candidate_id = _text(raw["CAND_ID"])
+    return {
+        "committee_id": raw["CMTE_ID"].strip(),
+        "name": _text(raw["CMTE_NM"]),
+        "treasurer_name": _text(raw["TRES_NM"]),
+        "street_1": _text(raw["CMTE_ST1"]),
+        "street_2": _text(raw["CMTE_ST2"]),
+        "city": _text(raw["CMTE_CITY"]),
+        "state": _text(raw["CMTE_ST"]),
+        "zip": _text(raw["CMTE_ZIP"]),
+        "designation": _text(raw["CMTE_DSGN"]),
+        "committee_type": _text(raw["CMTE_TP"]),
+        "party": _text(raw["CMTE_PTY_AFFILIATION"]),
+        "filing_frequency": _text(raw["CMTE_FILING_FREQ"]),
+        "organization_type": _text(raw["ORG_TP"]),
+        "candidate_ids": [candidate_id] if candidate_id else None,
+    }
+
+
+def _candidate(fields: list[str], header: tuple[str, ...]) -> dict[str, Any]:
+    raw = dict(zip(header, fields, strict=True))
+    election_year = _int(raw["CAND_ELECTION_YR"])
+    return {
+        "candidate_id": raw["CAND_ID"].strip(),
+        "name": _text(raw["CAND_NAME"]),
+        "party": _text(raw["CAND_PTY_AFFILIATION"]),
+        "election_years": [election_year] if election_year else None,
+        "state": _text(raw["CAND_OFFICE_ST"]),
+        "office": _text(raw["CAND_OFFICE"]),
+        "district": _text(raw["CAND_OFFICE_DISTRICT"]),
+        "incumbent_challenge": _text(raw["CAND_ICI"]),
+        "candidate_status": _text(raw["CAND_STATUS"]),
+        "address_street_1": _text(raw["CAND_ST1"]),
+        "address_street_2": _text(raw["CAND_ST2"]),
+        "address_city": _text(raw["CAND_CITY"]),
+        "address_state": _text(raw["CAND_ST"]),
+        "address_zip": _text(raw["CAND_ZIP"]),
+    }
+
+
+_MAPPERS: dict[FECBulkFileType, Callable[[list[str], tuple[str, ...]], dict[str, Any]]] = {
+    FECBulkFileType.INDIVIDUAL: _contribution,
+    FECBulkFileType.OTHER: _contribution,
+    FECBulkFileType.PAS2: _contribution,
+    FECBulkFileType.COMMITTEE: _committee,
+    FECBulkFileType.CANDIDATE: _candidate,
+}
+
+
+@contextmanager
+def open_bulk_file(path: str | Path) -> Iterator[IO[str]]:
+    """Open a bulk file for streaming text reads.
+
+    ``.gz`` files are decompressed on the fly and ``.zip`` archives are read
+    from their first member without extracting to disk.
+    """
+    path = Path(path)
+    binary: IO[bytes]
+    with ExitStack() as stack:
+        if path.suffix == ".gz":
+            binary = cast(IO[bytes], stack.enter_context(gzip.open(path, "rb")))
+        elif path.suffix == ".zip":
+            archive = stack.enter_context(zipfile.ZipFile(path))
+            binary = stack.enter_context(archive.open(archive.namelist()[0]))
+        else:
+            binary = stack.enter_context(open(path, "rb"))
+        yield io.TextIOWrapper(binary, encoding="utf-8", errors="replace", newline="")
+
+
+def iter_bulk_records(
+    path: str | Path,
+    file_type: FECBulkFileType | str,
+    cycle: int | None = None,
+    source_system: str = DEFAULT_SOURCE_SYSTEM,
+    include_raw: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Yield one bronze-ready dict per line of an FEC bulk file.
+
+    Args:
+        path: Plain, ``.gz`` or ``.zip`` bulk file.
+        file_type: Layout of the file.
+        cycle: Two-year period the file belongs to; stored as
+            ``two_year_transaction_period`` on contributions and as
+            ``cycles`` on committees/candidates.
+        source_system: Value for ``source_system``.
+        include_raw: Also keep the original columns as ``raw_json`` (packed
+            into ``raw_payload`` if the model is compact).
+
+    Lines with the wrong number of fields are logged and skipped.
+    """
+    file_type = FECBulkFileType(file_type)
+    header = HEADERS[file_type]
+    mapper = _MAPPERS[file_type]
+    model = MODELS[file_type]
+    is_contribution = model is BronzeFECScheduleA
+
+    with open_bulk_file(path) as handle:
+        reader = csv.reader(handle, delimiter="|", quoting=csv.QUOTE_NONE)
+        for line_number, fields in enumerate(reader, start=1):
+            if len(fields) != len(header):
+                logger.warning(
+                    "Skipping %s line %d: expected %d fields, got %d",
+                    path,
+                    line_number,
+                    len(header),
+                    len(fields),
+                )
+                continue
+            record = mapper(fields, header)
+            record["source_system"] = source_system
+            if is_contribution:
+                record["two_year_transaction_period"] = cycle
+            else:
+                record["cycles"] = [cycle] if cycle else None
+            if include_raw:
+                record["raw_json"] = dict(zip(header, fields, strict=True))
+                record = with_raw_payload(model, record)
+            yield record
+
+
+def iter_bulk_chunks(
+    path: str | Path,
+    file_type: FECBulkFileType | str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield lists of up to ``chunk_size`` records from :func:`iter_bulk_records`."""
+    chunk: list[dict[str, Any]] = []
+    for record in iter_bulk_records(path, file_type, **kwargs):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_bulk_file(
+    bind: Session | Connection,
+    path: str | Path,
+    file_type: FECBulkFileType | str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    use_copy: bool = False,
+    partitioned: bool = False,
+    **kwargs: Any,
+) -> UpsertResult:
+    """Stream a bulk file into its bronze table, upserting on the primary key.
+
+    ``use_copy=True`` loads through :func:`fund_lens_models.bronze.copy_load.copy_upsert`
+    (``COPY`` into a staging table on PostgreSQL); pass a larger ``batch_size``
+    with it. Pass ``partitioned=True`` when the table was created by
+    :mod:`fund_lens_models.partitioning`, whose unique key also includes the
+    partition column.
+    """
+    model = MODELS[FECBulkFileType(file_type)]
+    records = iter_bulk_records(path, file_type, **kwargs)
+    if use_copy:
+        return copy_upsert(bind, model, records, batch_size=batch_size, partitioned=partitioned)
+    key = [column.name for column in inspect(model).primary_key]
+    if partitioned:
+        key = list(merge_key(model, partitioned=True))
+    return bulk_upsert(bind, model, records, key, batch_size=batch_size)
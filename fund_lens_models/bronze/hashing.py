@@ -0,0 +1,285 @@
+"""Canonical content hashes and pre-load dedupe for Maryland bronze tables.
+
+Maryland contribution and candidate records have no natural key, so
+``content_hash`` is their dedupe key. This module is the single definition of
+that hash: a fixed, versioned field order, a fixed normalization, and SHA-256
+over the result. Loaders stream CSV chunks through :func:`iter_hashed_csv`
+and drop already-loaded rows with :func:`filter_new_rows`, which checks a
+whole batch against the table in one set-based query, optionally screened
+first by an on-disk :class:`HashBloomFilter` so most new rows skip the
+database entirely.
+"""
+
+import csv
+import hashlib
+import math
+import mmap
+import os
+import re
+import struct
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Any
+
+from sqlalchemy import Connection, func, select
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze.maryland import BronzeMarylandCandidate, BronzeMarylandContribution
+
+HASH_VERSION = 1
+
+# Field order is part of the hash definition; changing it requires a new HASH_VERSION
+HASH_FIELDS: dict[type[Base], tuple[str, ...]] = {
+    BronzeMarylandContribution: (
+        "receiving_committee",
+        "filing_period",
+        "contribution_date",
+        "contributor_name",
+        "contributor_address",
+        "contributor_type",
+        "contribution_type",
+        "contribution_amount",
+        "employer_name",
+        "employer_occupation",
+        "office",
+        "fund_type",
+    ),
+    BronzeMarylandCandidate: (
+        "office_name",
+        "district",
+        "candidate_last_name",
+        "candidate_first_name",
+        "additional_info",
+        "party",
+        "jurisdiction",
+        "gender",
+        "status",
+        "filing_type_and_date",
+        "campaign_address",
+        "campaign_city_state_zip",
+        "phone",
+        "email",
+        "website",
+        "facebook",
+        "twitter",
+        "other_social",
+        "committee_name",
+        "election_year",
+        "election_type",
+    ),
+}
+
+# MDCRIS contribution CSV header -> bronze column
+CONTRIBUTION_CSV_COLUMNS = {
+    "Receiving Committee": "receiving_committee",
+    "Filing Period": "filing_period",
+    "Contribution Date": "contribution_date",
+    "Contributor Name": "contributor_name",
+    "Contributor Address": "contributor_address",
+    "Contributor Type": "contributor_type",
+    "Contribution Type": "contribution_type",
+    "Contribution Amount": "contribution_amount",
+    "Employer Name": "employer_name",
+    "Employer Occupation": "employer_occupation",
+    "Office": "office",
+    "Fund Type": "fund_type",
+}
+
+_VERSION_PREFIX = f"v{HASH_VERSION}"
+_SEPARATOR = "\x1f"  # ASCII unit separator never appears in source CSV values
+_WHITESPACE = re.compile(r"\s+")
+_LOOKUP_BATCH = 5000
+
+
+def normalize(value: Any) -> str:
+    """Normalize one field for hashing: None -> '', trimmed, single-spaced, upper case."""
+    if value is None:
+        return ""
+    return _WHITESPACE.sub(" ", str(value)).strip().upper()
+
+
+def compute_content_hash(model: type[Base], row: Mapping[str, Any]) -> str:
+    """Return the canonical 64-character content hash of a bronze row."""
+    parts = [_VERSION_PREFIX, *(normalize(row.get(name)) for name in HASH_FIELDS[model])]
+    return hashlib.sha256(_SEPARATOR.join(parts).encode("utf-8")).hexdigest()
+
+
+def add_content_hashes(model: type[Base], rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Set ``content_hash`` on each row dict in place and return them as a list."""
+    hashed = []
+    for row in rows:
+        row["content_hash"] = compute_content_hash(model, row)
+        hashed.append(row)
+    return hashed
+
+
+def iter_hashed_csv(
+    source: str | Path | IO[str],
+    model: type[Base] = BronzeMarylandContribution,
+    column_map: Mapping[str, str] | None = None,
+    chunk_size: int = 10_000,
+    extra: Mapping[str, Any] | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """Stream a CSV file as chunks of hashed bronze row dicts.
+
+    Args:
+        source: Path or open text file.
+        model: Bronze model the rows are destined for.
+        column_map: CSV header -> column name. Defaults to the MDCRIS
+            contribution headers for contributions; headers are used as-is
+            for other models. Unmapped headers are dropped.
+        chunk_size: Rows per yielded chunk.
+        extra: Constant values added to every row before hashing (e.g.
+            ``election_year`` for candidate files).
+    """
+    if column_map is None and model is BronzeMarylandContribution:
+        column_map = CONTRIBUTION_CSV_COLUMNS
+    columns = set(model.__table__.c.keys())
+    handle: IO[str]
+    with ExitStack() as stack:
+        if isinstance(source, str | Path):
+            handle = stack.enter_context(open(source, encoding="utf-8-sig", newline=""))
+        else:
+            handle = source
+        reader = csv.DictReader(handle)
+        mapping = {
+            header: (column_map or {}).get(header, header) for header in reader.fieldnames or ()
+        }
+        mapping = {header: name for header, name in mapping.items() if name in columns}
+        chunk: list[dict[str, Any]] = []
+        for record in reader:
+            row = {name: (record[header] or None) for header, name in mapping.items()}
+            if extra:
+                row.update(extra)
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield add_content_hashes(model, chunk)
+                chunk = []
+        if chunk:
+            yield add_content_hashes(model, chunk)
+
+
+class HashBloomFilter:
+    """Memory-mapped Bloom filter over hex content hashes.
+
+    Bit positions are taken directly from slices of the SHA-256 digest, so no
+    extra hashing is needed. A negative answer is definitive; a positive one
+    must be confirmed against the table.
+    """
+
+    _MAGIC = b"FLBF"
+    _HEADER = struct.Struct("<4sQII")  # magic, bit count, hash count, hash version
+
+    def __init__(self, path: str | Path, capacity: int = 10_000_000, error_rate: float = 0.001):
+        self.path = Path(path)
+        if not self.path.exists():
+            bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+            hashes = max(1, min(8, round(bits / capacity * math.log(2))))
+            with open(self.path, "wb") as handle:
+                handle.write(self._HEADER.pack(self._MAGIC, bits, hashes, HASH_VERSION))
+                handle.truncate(self._HEADER.size + (bits + 7) // 8)
+        self._file = open(self.path, "r+b")  # noqa: SIM115 - held open for the mmap
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, self.bits, self.hashes, version = self._HEADER.unpack_from(self._map, 0)
+        if magic != self._MAGIC or version != HASH_VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a version {HASH_VERSION} hash Bloom filter")
+
+    def _positions(self, content_hash: str) -> Iterator[int]:
+        for i in range(self.hashes):
+            # Eight hex digits (32 bits) per probe; SHA-256 has 64 digits, enough for 8 probes
+            yield int(content_hash[i * 8 : i * 8 + 8], 16) % self.bits
+
+    def add(self, content_hash: str) -> None:
+        offset = self._HEADER.size
+        for position in self._positions(content_hash):
+            self._map[offset + position // 8] |= 1 << (position % 8)
+
+    def update(self, content_hashes: Iterable[str]) -> None:
+        for content_hash in content_hashes:
+            self.add(content_hash)
+
+    def __contains__(self, content_hash: str) -> bool:
+        offset = self._HEADER.size
+        return all(
+            self._map[offset + position // 8] & (1 << (position % 8))
+            for position in self._positions(content_hash)
+        )
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "HashBloomFilter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.flush()
+        self.close()
+
+    @classmethod
+    def build(
+        cls,
+        bind: Session | Connection,
+        model: type[Base],
+        path: str | Path,
+        error_rate: float = 0.001,
+        capacity: int | None = None,
+    ) -> "HashBloomFilter":
+        """Create a filter at ``path`` from every ``content_hash`` in the table."""
+        if os.path.exists(path):
+            os.remove(path)
+        column = model.__table__.c.content_hash
+        if capacity is None:
+            capacity = max(1000, 2 * (bind.execute(select(func.count(column))).scalar() or 0))
+        bloom = cls(path, capacity=capacity, error_rate=error_rate)
+        result = bind.execute(select(column).execution_options(yield_per=50_000))
+        bloom.update(result.scalars())
+        bloom.flush()
+        return bloom
+
+
+def existing_hashes(
+    bind: Session | Connection, model: type[Base], content_hashes: Sequence[str]
+) -> set[str]:
+    """Return which of ``content_hashes`` are already in the model's table."""
+    column = model.__table__.c.content_hash
+    found: set[str] = set()
+    for start in range(0, len(content_hashes), _LOOKUP_BATCH):
+        batch = content_hashes[start : start + _LOOKUP_BATCH]
+        found.update(bind.execute(select(column).where(column.in_(batch))).scalars())
+    return found
+
+
+def filter_new_rows(
+    bind: Session | Connection,
+    model: type[Base],
+    rows: Iterable[dict[str, Any]],
+    bloom: HashBloomFilter | None = None,
+) -> list[dict[str, Any]]:
+    """Drop rows whose ``content_hash`` is already loaded or repeated in the batch.
+
+    Rows without a ``content_hash`` are hashed first. With ``bloom``, only
+    hashes the filter reports as possibly present are looked up in the
+    database, and the hashes of returned rows are added to the filter.
+    """
+    unique: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        if not row.get("content_hash"):
+            row["content_hash"] = compute_content_hash(model, row)
+        unique.setdefault(row["content_hash"], row)
+
+    candidates = list(unique)
+    if bloom is not None:
+        candidates = [content_hash for content_hash in candidates if content_hash in bloom]
+    for content_hash in existing_hashes(bind, model, candidates):
+        del unique[content_hash]
+
+    if bloom is not None:
+        bloom.update(unique)
+    return list(unique.values())
@@ -0,0 +1,258 @@
+"""Optional compact storage for the raw source documents on the bronze FEC tables.
+
+Bronze FEC rows keep the full API (or bulk-file) record in ``raw_json`` for
+reprocessing. By default it is stored as is. Most of its keys repeat values
+already held in typed columns on the same row, so a model can opt in to
+storing only the remainder in ``raw_payload`` instead
+(``BronzeFECScheduleA.compact_raw_json = True``, set before loading):
+
+* keys whose value equals the row's typed column of the same name (strings,
+  integers, booleans and JSON values, which round-trip exactly) are dropped;
+  keys with any other value, including NULLs, are kept;
+* typed keys that were *not* in the document but have a value on the row are
+  listed under ``"$absent"`` so they are not added back;
+* the remainder is ``JSONB`` on PostgreSQL and zstd-compressed JSON bytes on
+  other backends (:class:`CompressedJSON`, needs the ``compression`` extra),
+  and ``raw_json`` is left empty (JSON ``null``).
+
+The ``raw_document`` hybrid property returns the document either way: the
+stored ``raw_json``, or one rebuilt from the remainder and the row's
+*current* typed columns. A compact document is therefore not the original
+once a typed column is corrected; it shows the corrected value. Keep the
+default where the exact source record must be preserved. ``raw_document``
+accepts a full document on assignment and stores it the way the model is
+configured (packed at flush); in SQL it refers to ``raw_payload``. Core
+loaders pass rows through :func:`with_raw_payload`, and
+:func:`migrate_raw_json` compacts rows stored before a model opted in.
+"""
+
+import json
+from collections.abc import Mapping
+from functools import cache
+from typing import Any, ClassVar
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Connection,
+    Integer,
+    LargeBinary,
+    String,
+    bindparam,
+    event,
+    null,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
+
+ABSENT_KEY = "$absent"
+ZSTD_LEVEL = 3
+
+# Loader metadata, not part of any source document
+_EXCLUDED_COLUMNS = frozenset(
+    {"raw_json", "raw_payload", "created_at", "updated_at", "ingestion_timestamp", "source_system"}
+)
+# Column types whose stored value is identical to the JSON value it came from
+_LOSSLESS_TYPES = {String: (str,), Integer: (int,), Boolean: (bool,), JSON: (dict, list)}
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        raise ImportError(
+            "Compressed raw payloads outside PostgreSQL require zstandard; "
+            "install fund-lens-models[compression]"
+        ) from None
+    return zstandard
+
+
+class CompressedJSON(TypeDecorator[Any]):
+    """JSON document stored as ``JSONB`` on PostgreSQL, zstd-compressed bytes elsewhere."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> Any:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.JSONB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        data = json.dumps(value, separators=(",", ":"), default=str).encode()
+        # Compressor objects are not thread-safe; creating one is cheap
+        return _zstd().ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return json.loads(_zstd().ZstdDecompressor().decompress(value))
+
+
+@cache
+def _typed_keys(table: Any) -> dict[str, tuple[type, ...]]:
+    keys = {}
+    for col in table.columns:
+        if col.name in _EXCLUDED_COLUMNS:
+            continue
+        for sql_type, python_types in _LOSSLESS_TYPES.items():
+            if isinstance(col.type, sql_type):
+                keys[col.name] = python_types
+    return keys
+
+
+def _same(value: Any, typed: Any, python_types: tuple[type, ...]) -> bool:
+    # bool is an int subclass; compare exact types so True never stands in for 1
+    return type(value) in python_types and type(typed) is type(value) and value == typed
+
+
+def pack_raw_json(
+    table: Any, document: Mapping[str, Any] | None, values: Mapping[str, Any]
+) -> dict[str, Any] | None:
+    """Strip ``document`` of keys the row's typed ``values`` already hold."""
+    if document is None:
+        return None
+    typed_keys = _typed_keys(table)
+    payload = {
+        key: value
+        for key, value in document.items()
+        if key not in typed_keys or not _same(value, values.get(key), typed_keys[key])
+    }
+    absent = sorted(
+        key for key in typed_keys if key not in document and values.get(key) is not None
+    )
+    if absent:
+        payload[ABSENT_KEY] = absent
+    return payload
+
+
+def unpack_raw_json(
+    table: Any, payload: Mapping[str, Any] | None, values: Mapping[str, Any]
+) -> dict[str, Any] | None:
+    """Rebuild the original document from a stored remainder and the typed ``values``."""
+    if payload is None:
+        return None
+    document = {key: value for key, value in payload.items() if key != ABSENT_KEY}
+    absent = set(payload.get(ABSENT_KEY, ()))
+    for key in _typed_keys(table):
+        value = values.get(key)
+        if value is not None and key not in document and key not in absent:
+            document[key] = value
+    return document
+
+
+def _typed_values(instance: Any) -> dict[str, Any]:
+    return {key: getattr(instance, key) for key in _typed_keys(instance.__table__)}
+
+
+def with_raw_payload(model: Any, row: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a loader row, its ``raw_json`` packed into ``raw_payload`` if the model is compact."""
+    values = dict(row)
+    if getattr(model, "compact_raw_json", False) and values.get("raw_json") is not None:
+        values["raw_payload"] = pack_raw_json(model.__table__, values["raw_json"], values)
+        values["raw_json"] = None
+    return values
+
+
+class RawPayloadMixin:
+    """``raw_json`` document column, the opt-in compact ``raw_payload`` and ``raw_document``."""
+
+    # Store raw_json compacted into raw_payload; set per model before loading
+    compact_raw_json: ClassVar[bool] = False
+
+    # Raw JSON for full record preservation
+    raw_json: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    raw_payload: Mapped[dict[str, Any] | None] = mapped_column(CompressedJSON)
+
+    @hybrid_property
+    def raw_document(self) -> dict[str, Any] | None:
+        if self.raw_payload is None:
+            return self.raw_json
+        if self.__dict__.get("_raw_payload_unpacked"):  # Assigned; packed at flush
+            return self.raw_payload
+        return unpack_raw_json(self.__table__, self.raw_payload, _typed_values(self))  # type: ignore[attr-defined]
+
+    @raw_document.inplace.setter
+    def _raw_document_setter(self, value: dict[str, Any] | None) -> None:
+        if not self.compact_raw_json or value is None:
+            self.raw_json = value
+            self.raw_payload = None
+            return
+        # Packed at flush, once the typed columns have their final values
+        self.raw_json = None
+        self.raw_payload = dict(value)
+        self.__dict__["_raw_payload_unpacked"] = True
+
+    @raw_document.inplace.expression
+    @classmethod
+    def _raw_document_expression(cls) -> Any:
+        return cls.raw_payload
+
+
+@event.listens_for(RawPayloadMixin, "before_insert", propagate=True)
+@event.listens_for(RawPayloadMixin, "before_update", propagate=True)
+def _pack_before_flush(mapper: Any, connection: Connection, target: Any) -> None:
+    if target.__dict__.pop("_raw_payload_unpacked", False):
+        target.raw_payload = pack_raw_json(
+            target.__table__, target.raw_payload, _typed_values(target)
+        )
+    elif target.compact_raw_json and target.raw_json is not None:
+        # raw_json assigned directly on a compact model
+        target.raw_payload = pack_raw_json(target.__table__, target.raw_json, _typed_values(target))
+        target.raw_json = None
+
+
+def migrate_raw_json(conn: Connection, model: Any, batch_size: int = 1000) -> int:
+    """Compact existing ``raw_json`` documents into ``raw_payload``; returns rows converted.
+
+    For deployments opting a model in to ``compact_raw_json``: add the
+    ``raw_payload`` column if the database predates it, then run this. Rows
+    that already have a ``raw_payload`` are skipped and converted rows get a
+    NULL ``raw_json``, so it can be resumed.
+    """
+    table = model.__table__
+    document = table.c.raw_json
+    key = list(table.primary_key.columns)
+    typed = [table.c[name] for name in _typed_keys(table)]
+    query = (
+        select(*dict.fromkeys([*key, *typed]), document.label("_document"))
+        .where(table.c.raw_payload.is_(None), document.is_not(None))
+        .order_by(*key)
+        .limit(batch_size)
+    )
+    # JSON 'null' documents pack to NULL and would match the filter again;
+    # seek past each batch on the primary key instead
+    position: tuple[Any, ...] | None = None
+    update = (
+        table.update()
+        .where(*(col == bindparam(f"_key_{col.name}") for col in key))
+        .values(raw_payload=bindparam("_payload"), raw_json=null())
+    )
+    converted = 0
+    while (
+        rows := conn.execute(
+            query if position is None else query.where(tuple_(*key) > tuple_(*position))
+        )
+        .mappings()
+        .all()
+    ):
+        conn.execute(
+            update,
+            [
+                {
+                    **{f"_key_{col.name}": row[col.name] for col in key},
+                    "_payload": pack_raw_json(table, row["_document"], dict(row)),
+                }
+                for row in rows
+            ],
+        )
+        converted += len(rows)
+        position = tuple(rows[-1][col.name] for col in key)
+    return converted
@@ -0,0 +1,207 @@
+"""Lease-based work queue over ``bronze_fec_extraction_state``.
+
+Each (committee_id, election_cycle) row is a unit of extraction work. A worker
+claims incomplete rows by writing its id and a lease expiry onto them, keeps
+the lease alive with heartbeats or checkpoints, and marks the row complete when
+done. Rows whose lease has expired are claimable again, so a crashed worker's
+committees are picked up by others and resume from the last checkpoint.
+
+On PostgreSQL claims use ``SELECT ... FOR UPDATE SKIP LOCKED`` so concurrent
+workers never block on or double-claim the same rows. Other backends (SQLite)
+fall back to a conditional ``UPDATE`` per candidate row that only succeeds if
+the lease is still free.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import ColumnElement, and_, or_, select, tuple_, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from fund_lens_models.bronze.fec import BronzeFECExtractionState
+
+DEFAULT_LEASE_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class Lease:
+    """A claimed unit of extraction work and the checkpoint to resume from."""
+
+    committee_id: str
+    election_cycle: int
+    worker_id: str
+    expires_at: datetime
+    last_sub_id: str
+    last_page_processed: int
+    last_contribution_date: date
+
+
+def _key_in(keys: Sequence[tuple[str, int]]) -> ColumnElement[bool]:
+    state = BronzeFECExtractionState
+    return tuple_(state.committee_id, state.election_cycle).in_(keys)
+
+
+class ExtractionWorkQueue:
+    """Coordinates extraction workers through leases on extraction state rows.
+
+    Every method runs in its own short transaction from ``session_factory`` so
+    claims and checkpoints are visible to other workers as soon as they return.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        worker_id: str,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        self.session_factory = session_factory
+        self.worker_id = worker_id
+        self.lease_duration = timedelta(seconds=lease_seconds)
+
+    def _owned(self, lease: Lease) -> ColumnElement[bool]:
+        state = BronzeFECExtractionState
+        return and_(
+            state.committee_id == lease.committee_id,
+            state.election_cycle == lease.election_cycle,
+            state.lease_owner == self.worker_id,
+        )
+
+    def claim(self, limit: int, election_cycle: int | None = None) -> list[Lease]:
+        """Claim up to ``limit`` incomplete committees whose lease is free or expired.
+
+        Least recently extracted committees are handed out first.
+        """
+        state = BronzeFECExtractionState
+        now = datetime.now(UTC)
+        expires_at = now + self.lease_duration
+        claimable = and_(
+            state.is_complete.is_(False),
+            or_(state.lease_expires_at.is_(None), state.lease_expires_at < now),
+        )
+        query = select(state.committee_id, state.election_cycle).where(claimable)
+        if election_cycle is not None:
+            query = query.where(state.election_cycle == election_cycle)
+        query = query.order_by(state.last_extraction_timestamp).limit(limit)
+
+        with self.session_factory.begin() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                claimed = [
+                    tuple(key) for key in session.execute(query.with_for_update(skip_locked=True))
+                ]
+                if claimed:
+                    session.execute(
+                        update(state)
+                        .where(_key_in(claimed))
+                        .values(lease_owner=self.worker_id, lease_expires_at=expires_at)
+                    )
+            else:
+                claimed = []
+                for committee_id, cycle in session.execute(query).all():
+                    # Compare-and-set: another worker may have claimed it since the select
+                    result = session.execute(
+                        update(state)
+                        .where(
+                            state.committee_id == committee_id,
+                            state.election_cycle == cycle,
+                            claimable,
+                        )
+                        .values(lease_owner=self.worker_id, lease_expires_at=expires_at)
+                    )
+                    if result.rowcount == 1:  # type: ignore[attr-defined]
+                        claimed.append((committee_id, cycle))
+            if not claimed:
+                return []
+            rows = session.scalars(select(state).where(_key_in(claimed))).all()
+            return [
+                Lease(
+                    committee_id=row.committee_id,
+                    election_cycle=row.election_cycle,
+                    worker_id=self.worker_id,
+                    expires_at=expires_at,
+                    last_sub_id=row.last_sub_id,
+                    last_page_processed=row.last_page_processed,
+                    last_contribution_date=row.last_contribution_date,
+                )
+                for row in rows
+            ]
+
+    def heartbeat(self, lease: Lease) -> Lease | None:
+        """Extend a lease. Returns None if this worker no longer holds it."""
+        expires_at = datetime.now(UTC) + self.lease_duration
+        with self.session_factory.begin() as session:
+            result = session.execute(
+                update(BronzeFECExtractionState)
+                .where(self._owned(lease))
+                .values(lease_expires_at=expires_at)
+            )
+            if result.rowcount != 1:  # type: ignore[attr-defined]
+                return None
+        return replace(lease, expires_at=expires_at)
+
+    def checkpoint(
+        self,
+        lease: Lease,
+        last_sub_id: str,
+        last_contribution_date: date,
+        last_page_processed: int,
+        contributions_extracted: int = 0,
+    ) -> Lease | None:
+        """Record progress and extend the lease in a single statement.
+
+        ``contributions_extracted`` is added to the running total. Returns None
+        (and writes nothing) if the lease was lost, in which case the worker
+        should stop processing this committee.
+        """
+        state = BronzeFECExtractionState
+        now = datetime.now(UTC)
+        expires_at = now + self.lease_duration
+        with self.session_factory.begin() as session:
+            result = session.execute(
+                update(state)
+                .where(self._owned(lease))
+                .values(
+                    last_sub_id=last_sub_id,
+                    last_contribution_date=last_contribution_date,
+                    last_page_processed=last_page_processed,
+                    total_contributions_extracted=(
+                        state.total_contributions_extracted + contributions_extracted
+                    ),
+                    last_extraction_timestamp=now,
+                    lease_expires_at=expires_at,
+                )
+            )
+            if result.rowcount != 1:  # type: ignore[attr-defined]
+                return None
+        return replace(
+            lease,
+            expires_at=expires_at,
+            last_sub_id=last_sub_id,
+            last_page_processed=last_page_processed,
+            last_contribution_date=last_contribution_date,
+        )
+
+    def complete(self, lease: Lease) -> bool:
+        """Mark the committee complete and release the lease."""
+        with self.session_factory.begin() as session:
+            result = session.execute(
+                update(BronzeFECExtractionState)
+                .where(self._owned(lease))
+                .values(
+                    is_complete=True,
+                    last_extraction_timestamp=datetime.now(UTC),
+                    lease_owner=None,
+                    lease_expires_at=None,
+                )
+            )
+            return result.rowcount == 1  # type: ignore[attr-defined]
+
+    def release(self, lease: Lease) -> bool:
+        """Give up a lease without completing, so another worker can resume it."""
+        with self.session_factory.begin() as session:
+            result = session.execute(
+                update(BronzeFECExtractionState)
+                .where(self._owned(lease))
+                .values(lease_owner=None, lease_expires_at=None)
+            )
+            return result.rowcount == 1  # type: ignore[attr-defined]
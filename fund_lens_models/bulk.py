@@ -0,0 +1,241 @@
+"""Set-based bulk upsert helpers for loading rows without ORM instances.
+
+Rows are plain dicts keyed by column name. They are sent as multi-row
+``INSERT ... ON CONFLICT (...) DO UPDATE`` statements using the PostgreSQL or
+SQLite dialect constructs, so no mapped objects are built and no per-object
+flush happens.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import Boolean, Connection, func, literal_column, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base, utcnow
+from fund_lens_models.bronze.fec import BronzeFECScheduleA
+from fund_lens_models.bronze.raw_payload import with_raw_payload
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Bind-parameter ceilings per statement (PostgreSQL wire protocol, SQLite >= 3.32)
+_MAX_BIND_PARAMS = {"postgresql": 65535, "sqlite": 32766}
+
+# Timestamp columns left to their server defaults on insert and set to the
+# database clock on conflict unless the rows supply them
+_TIMESTAMP_COLUMNS = ("created_at", "updated_at", "ingestion_timestamp")
+
+
+@dataclass
+class UpsertResult:
+    """Row counts from a bulk upsert."""
+
+    inserted: int = 0
+    updated: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated
+
+    def __iadd__(self, other: "UpsertResult") -> "UpsertResult":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        return self
+
+
+def dialect_name(bind: Session | Connection) -> str:
+    """Return the dialect name for a Session or Connection."""
+    if isinstance(bind, Session):
+        return bind.get_bind().dialect.name
+    return bind.dialect.name
+
+
+def batched(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield lists of up to ``size`` items from ``rows``."""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def bulk_upsert(
+    bind: Session | Connection,
+    model: type[Base],
+    rows: Iterable[Mapping[str, Any]],
+    conflict_columns: Sequence[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    update_exclude: Sequence[str] = ("created_at",),
+) -> UpsertResult:
+    """Insert or update ``rows`` into ``model``'s table in multi-row batches.
+
+    Args:
+        bind: Session or Connection to execute on. The caller owns the transaction.
+        model: Mapped class whose table is loaded.
+        rows: Iterable of dicts keyed by column name. Consumed lazily. Rows
+            with different key sets are sent as separate statements, so a
+            column a row leaves out keeps its stored value.
+        conflict_columns: Columns of the unique/primary key to upsert on.
+        batch_size: Maximum rows per statement; lowered automatically to stay
+            under the dialect's bind-parameter limit.
+        update_exclude: Columns never overwritten on conflict.
+
+    Returns:
+        Inserted and updated row counts. Conflicting rows with nothing to
+        update are skipped and count as neither.
+
+    Raises:
+        ValueError: If a row has keys that are not columns of the table or
+            lacks a conflict column, or the dialect has no ON CONFLICT support.
+    """
+    table = model.__table__
+    dialect = dialect_name(bind)
+    if dialect not in _MAX_BIND_PARAMS:
+        raise ValueError(f"bulk_upsert does not support the {dialect!r} dialect")
+
+    max_rows = max(1, _MAX_BIND_PARAMS[dialect] // len(table.columns))
+    result = UpsertResult()
+    for batch in batched(rows, min(batch_size, max_rows)):
+        result += _upsert_batch(bind, dialect, table, batch, conflict_columns, update_exclude)
+    return result
+
+
+def _normalize_batch(
+    table: Any, batch: list[Mapping[str, Any]], conflict_columns: Sequence[str]
+) -> list[tuple[list[str], list[dict[str, Any]]]]:
+    """Drop earlier duplicates of a conflict key and group rows by the keys they supply.
+
+    Each group becomes its own statement: padding a row with NULLs for columns
+    it left out would overwrite the stored values on conflict.
+    """
+    unknown = {name for row in batch for name in row if name not in table.c}
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {', '.join(sorted(unknown))}")
+
+    # ON CONFLICT cannot touch the same row twice in one statement; last one wins
+    deduped: dict[tuple[Any, ...], Mapping[str, Any]] = {}
+    for row in batch:
+        deduped[tuple(row.get(name) for name in conflict_columns)] = row
+
+    # Supplied but NULL timestamps get one value per batch; omitted ones the server default
+    now = datetime.now(UTC)
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in deduped.values():
+        values = dict(row)
+        for name in _TIMESTAMP_COLUMNS:
+            if name in values and values[name] is None:
+                values[name] = now
+        groups.setdefault(tuple(values), []).append(values)
+    return [(list(columns), rows) for columns, rows in groups.items()]
+
+
+def _conflict_updates(
+    stmt: Any,
+    table: Any,
+    columns: Sequence[str],
+    conflict_columns: Sequence[str],
+    update_exclude: Sequence[str],
+) -> dict[str, Any]:
+    set_: dict[str, Any] = {
+        name: stmt.excluded[name]
+        for name in columns
+        if name not in conflict_columns and name not in update_exclude
+    }
+    # ON CONFLICT DO UPDATE does not apply column onupdate values
+    for name in _TIMESTAMP_COLUMNS:
+        if name in table.c and name not in set_ and name not in update_exclude:
+            set_[name] = utcnow()
+    return set_
+
+
+def on_conflict(
+    stmt: Any,
+    table: Any,
+    columns: Sequence[str],
+    conflict_columns: Sequence[str],
+    update_exclude: Sequence[str] = ("created_at",),
+) -> Any:
+    """Add ``ON CONFLICT`` handling to a PostgreSQL or SQLite ``insert()``.
+
+    Loaded ``columns`` outside the key and ``update_exclude`` are overwritten
+    from the incoming row; timestamp columns not loaded are set to the
+    database clock. With nothing to update the conflict is ignored.
+    """
+    set_ = _conflict_updates(stmt, table, columns, conflict_columns, update_exclude)
+    if set_:
+        return stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_)
+    return stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+
+def _upsert_batch(
+    bind: Session | Connection,
+    dialect: str,
+    table: Any,
+    batch: list[Mapping[str, Any]],
+    conflict_columns: Sequence[str],
+    update_exclude: Sequence[str],
+) -> UpsertResult:
+    result = UpsertResult()
+    for columns, values in _normalize_batch(table, batch, conflict_columns):
+        result += _upsert_rows(
+            bind, dialect, table, columns, values, conflict_columns, update_exclude
+        )
+    return result
+
+
+def _upsert_rows(
+    bind: Session | Connection,
+    dialect: str,
+    table: Any,
+    columns: list[str],
+    values: list[dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_exclude: Sequence[str],
+) -> UpsertResult:
+    missing = [name for name in conflict_columns if name not in columns]
+    if missing:
+        raise ValueError(f"Rows for {table.name} need the key columns {missing}")
+    insert = (postgresql.insert if dialect == "postgresql" else sqlite.insert)(table)
+    # Conflicts on DO NOTHING are skipped rows, not updates
+    updates = bool(_conflict_updates(insert, table, columns, conflict_columns, update_exclude))
+    stmt = on_conflict(insert.values(values), table, columns, conflict_columns, update_exclude)
+
+    if dialect == "postgresql":
+        # xmax is 0 only for tuples created by this statement
+        flags = bind.execute(
+            stmt.returning(literal_column("(xmax = 0)", type_=Boolean).label("inserted"))
+        ).scalars()
+        inserted = sum(1 for flag in flags if flag)
+        return UpsertResult(inserted=inserted, updated=len(values) - inserted if updates else 0)
+
+    # SQLite cannot tell inserts from updates in RETURNING; count existing keys first
+    key_columns = [table.c[name] for name in conflict_columns]
+    keys = [tuple(row[name] for name in conflict_columns) for row in values]
+    if len(key_columns) == 1:
+        condition = key_columns[0].in_([key[0] for key in keys])
+    else:
+        condition = tuple_(*key_columns).in_(keys)
+    existing = bind.execute(select(func.count()).select_from(table).where(condition)).scalar_one()
+    bind.execute(stmt)
+    return UpsertResult(inserted=len(values) - existing, updated=existing if updates else 0)
+
+
+def upsert_fec_schedule_a(
+    bind: Session | Connection,
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    partitioned: bool = False,
+) -> UpsertResult:
+    """Bulk upsert raw Schedule A rows into ``bronze_fec_schedule_a`` on ``sub_id``.
+
+    Re-pulled contributions replace the stored row; ``created_at`` is kept. A
+    ``raw_json`` document is packed into ``raw_payload`` if the model is compact.
+    Pass ``partitioned=True`` when the table was created by
+    :mod:`fund_lens_models.partitioning`, whose unique key also includes
+    ``two_year_transaction_period``.
+    """
+    key = ("sub_id", "two_year_transaction_period") if partitioned else ("sub_id",)
+    packed = (with_raw_payload(BronzeFECScheduleA, row) for row in rows)
+    return bulk_upsert(bind, BronzeFECScheduleA, packed, key, batch_size=batch_size)
@@ -1,25 +1,379 @@
-from collections.abc import Generator
+"""Engine and session helpers.
 
-from sqlalchemy import create_engine
+Engines are cached in a process-wide registry keyed by database URL and pool
+options, so repeated calls to :func:`get_engine`, :func:`get_session_factory`
+and :func:`get_session` share one connection pool instead of opening a new one
+per request. The ``get_async_*`` counterparts do the same for asyncio drivers
+(``postgresql+asyncpg://``, ``sqlite+aiosqlite://``) and bind to the same
+model metadata.
+"""
+
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from fund_lens_models.instrumentation import query_metrics
+
+
+@dataclass(frozen=True)
+class EngineOptions:
+    """Connection pool settings used when creating a registered engine.
+
+    Sizing options only apply to queue-based pools; SQLite in-memory databases
+    use SQLAlchemy's singleton/static pools and ignore them.
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800  # Seconds; recycle before server/LB idle timeouts
+    pool_pre_ping: bool = True
+    pool_use_lifo: bool = False
+    echo: bool = False
+    # Record per-statement metrics in fund_lens_models.instrumentation.query_metrics
+    instrument_queries: bool = False
+
+
+DEFAULT_ENGINE_OPTIONS = EngineOptions()
+
+
+@dataclass
+class PoolMetrics:
+    """Counters collected from pool events for one registered engine."""
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    checkout_timeouts: int = 0
+    checkout_wait_seconds_total: float = 0.0
+    checkout_wait_seconds_max: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """Record time spent waiting for a pooled connection."""
+        with self._lock:
+            self.checkout_wait_seconds_total += seconds
+            self.checkout_wait_seconds_max = max(self.checkout_wait_seconds_max, seconds)
+            if timed_out:
+                self.checkout_timeouts += 1
+
+    def increment(self, name: str) -> None:
+        """Increment a counter by name."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters as a plain dict."""
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_lock"}
+
+
+class _MeteredPoolMixin:
+    """Times checkouts so pool wait can be reported alongside event counters."""
+
+    _metrics: PoolMetrics | None = None
+
+    def connect(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()  # type: ignore[misc]
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self._metrics is not None:
+                self._metrics.record_wait(time.perf_counter() - start, timed_out)
+
+    def recreate(self):  # type: ignore[no-untyped-def]
+        # dispose() swaps in a fresh pool; keep reporting into the same metrics
+        pool = super().recreate()  # type: ignore[misc]
+        pool._metrics = self._metrics
+        return pool
+
+
+class _MeteredQueuePool(_MeteredPoolMixin, QueuePool):
+    pass
+
+
+class _MeteredAsyncAdaptedQueuePool(_MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _engine_kwargs(url: URL, options: EngineOptions) -> dict[str, Any]:
+    """Build create_engine keyword arguments appropriate for the URL's pool class."""
+    kwargs: dict[str, Any] = {
+        "pool_pre_ping": options.pool_pre_ping,
+        "echo": options.echo,
+    }
+    pool_class = url.get_dialect().get_pool_class(url)  # type: ignore[attr-defined]
+    if issubclass(pool_class, QueuePool):
+        if issubclass(pool_class, AsyncAdaptedQueuePool):
+            kwargs["poolclass"] = _MeteredAsyncAdaptedQueuePool
+        else:
+            kwargs["poolclass"] = _MeteredQueuePool
+        kwargs.update(
+            pool_size=options.pool_size,
+            max_overflow=options.max_overflow,
+            pool_timeout=options.pool_timeout,
+            pool_recycle=options.pool_recycle,
+            pool_use_lifo=options.pool_use_lifo,
+        )
+    return kwargs
+
+
+def _attach_metrics(pool: Pool, metrics: PoolMetrics) -> None:
+    """Register pool event listeners that feed ``metrics``."""
+    if isinstance(pool, _MeteredPoolMixin):
+        pool._metrics = metrics
+    event.listen(pool, "connect", lambda *_: metrics.increment("connects"))
+    event.listen(pool, "checkout", lambda *_: metrics.increment("checkouts"))
+    event.listen(pool, "checkin", lambda *_: metrics.increment("checkins"))
+    event.listen(pool, "invalidate", lambda *_: metrics.increment("invalidations"))
+
+
+@dataclass
+class _RegistryEntry:
+    engine: Any  # Engine or AsyncEngine
+    metrics: PoolMetrics
+    session_factory: Any = None
+
 
+class EngineRegistry:
+    """Process-wide cache of engines and session factories.
 
-def get_engine(database_url: str):
-    """Create SQLAlchemy engine."""
-    return create_engine(database_url, pool_pre_ping=True)
+    Entries are keyed by ``(url, options)``; the same URL with different pool
+    options yields a separate engine.
+    """
 
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._entries: dict[tuple[str, str, EngineOptions], _RegistryEntry] = {}
 
-def get_session_factory(database_url: str):
-    """Create session factory."""
-    engine = get_engine(database_url)
-    return sessionmaker(bind=engine)
+    def _get_entry(
+        self,
+        kind: str,
+        database_url: str | URL,
+        options: EngineOptions,
+        factory: Callable[..., Any],
+    ) -> _RegistryEntry:
+        url = make_url(database_url)
+        key = (kind, url.render_as_string(hide_password=False), options)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                metrics = PoolMetrics()
+                engine = factory(url, **_engine_kwargs(url, options))
+                _attach_metrics(getattr(engine, "sync_engine", engine).pool, metrics)
+                if options.instrument_queries:
+                    query_metrics.attach(engine)
+                entry = _RegistryEntry(engine=engine, metrics=metrics)
+                self._entries[key] = entry
+            return entry
 
+    def get_engine(
+        self, database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+    ) -> Engine:
+        """Return the shared engine for ``database_url`` and ``options``."""
+        return self._get_entry("sync", database_url, options, create_engine).engine
 
-def get_session(database_url: str) -> Generator[Session, None, None]:
+    def get_session_factory(
+        self, database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+    ) -> sessionmaker[Session]:
+        """Return the shared sessionmaker bound to the registered engine."""
+        entry = self._get_entry("sync", database_url, options, create_engine)
+        if entry.session_factory is None:
+            with self._lock:
+                if entry.session_factory is None:
+                    entry.session_factory = sessionmaker(bind=entry.engine)
+        return entry.session_factory
+
+    def get_async_engine(
+        self, database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+    ) -> AsyncEngine:
+        """Return the shared async engine for ``database_url`` and ``options``."""
+        return self._get_entry("async", database_url, options, create_async_engine).engine
+
+    def get_async_session_factory(
+        self, database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+    ) -> async_sessionmaker[AsyncSession]:
+        """Return the shared async_sessionmaker bound to the registered async engine."""
+        entry = self._get_entry("async", database_url, options, create_async_engine)
+        if entry.session_factory is None:
+            with self._lock:
+                if entry.session_factory is None:
+                    # Objects stay usable after commit without an implicit (awaitable) refresh
+                    entry.session_factory = async_sessionmaker(
+                        bind=entry.engine, expire_on_commit=False
+                    )
+        return entry.session_factory
+
+    def dispose_all(self, close: bool = True) -> None:
+        """Dispose every registered engine's pool.
+
+        Call with ``close=False`` in a freshly forked child process (e.g. a
+        gunicorn ``post_fork`` or multiprocessing initializer) so connections
+        inherited from the parent are dropped without being closed under it.
+        Engines stay registered and open new connections on next use.
+        """
+        with self._lock:
+            items = list(self._entries.items())
+        for (kind, _, _), entry in items:
+            if kind == "async":
+                # Async connections can only be closed from the event loop;
+                # use adispose_all() there, here just drop the pool.
+                entry.engine.sync_engine.dispose(close=False)
+            else:
+                entry.engine.dispose(close=close)
+
+    async def adispose_all(self) -> None:
+        """Dispose every registered engine, closing async connections on the running loop."""
+        with self._lock:
+            items = list(self._entries.items())
+        for (kind, _, _), entry in items:
+            if kind == "async":
+                await entry.engine.dispose()
+            else:
+                entry.engine.dispose()
+
+    def clear(self) -> None:
+        """Dispose all engines and forget them."""
+        with self._lock:
+            self.dispose_all()
+            self._entries.clear()
+
+    def pool_metrics(self) -> list[dict[str, Any]]:
+        """Return a snapshot of pool state and counters for each registered engine."""
+        with self._lock:
+            items = list(self._entries.items())
+        snapshot = []
+        for (kind, _, _), entry in items:
+            sync_engine = getattr(entry.engine, "sync_engine", entry.engine)
+            pool = sync_engine.pool
+            data: dict[str, Any] = {
+                "url": sync_engine.url.render_as_string(hide_password=True),
+                "kind": kind,
+                "pool_class": type(pool).__name__,
+            }
+            if isinstance(pool, QueuePool):
+                data.update(
+                    pool_size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    checked_in=pool.checkedin(),
+                    overflow=pool.overflow(),
+                )
+            data.update(entry.metrics.as_dict())
+            snapshot.append(data)
+        return snapshot
+
+    def render_prometheus(self, prefix: str = "fund_lens_db_pool") -> str:
+        """Render pool metrics in the Prometheus text exposition format."""
+        gauges = ("pool_size", "checked_out", "checked_in", "overflow", "checkout_wait_seconds_max")
+        counters = (
+            "connects",
+            "checkouts",
+            "checkins",
+            "invalidations",
+            "checkout_timeouts",
+            "checkout_wait_seconds_total",
+        )
+        snapshot = self.pool_metrics()
+        lines: list[str] = []
+        for names, metric_type in ((gauges, "gauge"), (counters, "counter")):
+            for name in names:
+                samples = [row for row in snapshot if name in row]
+                if not samples:
+                    continue
+                lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+                for row in samples:
+                    url = row["url"].replace("\\", "\\\\").replace('"', '\\"')
+                    lines.append(f'{prefix}_{name}{{url="{url}",kind="{row["kind"]}"}} {row[name]}')
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+registry = EngineRegistry()
+
+
+def get_engine(database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS) -> Engine:
+    """Return the process-wide SQLAlchemy engine for this URL and pool options."""
+    return registry.get_engine(database_url, options)
+
+
+def get_session_factory(
+    database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+) -> sessionmaker[Session]:
+    """Return the process-wide session factory for this URL and pool options."""
+    return registry.get_session_factory(database_url, options)
+
+
+def get_session(
+    database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+) -> Generator[Session, None, None]:
     """Dependency for FastAPI/etc."""
-    sessionlocal = get_session_factory(database_url)
+    sessionlocal = get_session_factory(database_url, options)
     session = sessionlocal()
     try:
         yield session
     finally:
         session.close()
+
+
+def get_async_engine(
+    database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+) -> AsyncEngine:
+    """Return the process-wide async engine (e.g. ``postgresql+asyncpg://``)."""
+    return registry.get_async_engine(database_url, options)
+
+
+def get_async_session_factory(
+    database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+) -> async_sessionmaker[AsyncSession]:
+    """Return the process-wide async session factory for this URL and pool options."""
+    return registry.get_async_session_factory(database_url, options)
+
+
+async def get_async_session(
+    database_url: str | URL, options: EngineOptions = DEFAULT_ENGINE_OPTIONS
+) -> AsyncGenerator[AsyncSession, None]:
+    """Async dependency for FastAPI/etc."""
+    sessionlocal = get_async_session_factory(database_url, options)
+    async with sessionlocal() as session:
+        yield session
+
+
+def dispose_all(close: bool = True) -> None:
+    """Dispose all registered engines; use ``close=False`` after fork."""
+    registry.dispose_all(close=close)
+
+
+async def adispose_all() -> None:
+    """Dispose all registered engines from within a running event loop."""
+    await registry.adispose_all()
+
+
+def pool_metrics() -> list[dict[str, Any]]:
+    """Snapshot pool metrics for all registered engines."""
+    return registry.pool_metrics()
+
+
+def render_pool_metrics_prometheus() -> str:
+    """Pool metrics for all registered engines in Prometheus text format."""
+    return registry.render_prometheus()
@@ -0,0 +1,372 @@
+"""Integer-coded dimensions for the low-cardinality gold columns.
+
+Gold rows repeat a few short strings (``source_system``, ``party``,
+``committee_type``, ``contribution_type``, ...) on every row and in every
+index entry. Those columns store a ``SMALLINT`` code instead, referencing a
+small lookup table per dimension (``dim_party``, ``dim_committee_type``, ...):
+
+* the vocabularies are the enums in :mod:`fund_lens_models.enums` and a
+  member's code is its 1-based position, so codes are identical in every
+  database and process. Append new members; never reorder or remove them;
+* :class:`CodedEnum` translates on the way in and out with code maps built
+  once per process, so models, comparisons
+  (``GoldContribution.source_system == "FEC"``), query results and loaders
+  keep using the strings (enum members are accepted too), while ``GROUP BY``
+  and index lookups run on integers;
+* the free-text values these columns held before are still accepted:
+  spellings in ``DIMENSION_ALIASES`` (FEC codes such as ``Office`` members,
+  Maryland party names such as ``Democratic``; matched case-insensitively)
+  are stored as their member, and any other value is stored as the
+  dimension's ``DIMENSION_FALLBACKS`` member (``OTH``/``OTHER``) with a
+  warning. Only ``source_system`` and ``jurisdiction_level``, which have no
+  fallback, raise ``ValueError`` for unknown values;
+* lookup tables are seeded when ``create_all`` creates them, and
+  :func:`install_dimensions` converts existing databases with the same
+  mapping.
+
+Silver tables keep the source's own strings; normalizing them into these
+vocabularies is the silver-to-gold step. Migrations live in fund-lens-etl; a
+revision there calls ``install_dimensions(op.get_bind())`` from ``upgrade()``.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
+from enum import Enum
+from functools import cache, lru_cache
+from typing import Any, cast
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    SmallInteger,
+    String,
+    Table,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy import column as column_clause
+from sqlalchemy import table as table_clause
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+from fund_lens_models.base import Base, load_all_models
+from fund_lens_models.enums import (
+    FEC_OFFICES,
+    CandidateOffice,
+    CommitteeType,
+    ContributionType,
+    ElectionType,
+    JurisdictionLevel,
+    Party,
+    SourceSystem,
+)
+
+logger = logging.getLogger(__name__)
+
+# Dimension name (lookup table dim_<name>) -> vocabulary
+DIMENSIONS: dict[str, type[Enum]] = {
+    "source_system": SourceSystem,
+    "jurisdiction_level": JurisdictionLevel,
+    "office": CandidateOffice,
+    "party": Party,
+    "committee_type": CommitteeType,
+    "contribution_type": ContributionType,
+    "election_type": ElectionType,
+}
+
+DIMENSION_TABLES: dict[type[Enum], Table] = {
+    enum_class: Table(
+        f"dim_{name}",
+        Base.metadata,
+        Column("code", SmallInteger, primary_key=True, autoincrement=False),
+        Column("value", String(50), nullable=False, unique=True),
+    )
+    for name, enum_class in DIMENSIONS.items()
+}
+
+_TABLE_ENUMS = {table.name: enum_class for enum_class, table in DIMENSION_TABLES.items()}
+
+# Source spellings (upper-case) stored as a member, besides the member values
+DIMENSION_ALIASES: dict[type[Enum], dict[str, Enum]] = {
+    CandidateOffice: {
+        **{office.value: gold for office, gold in FEC_OFFICES.items()},
+        "HOUSE": CandidateOffice.US_HOUSE,
+        "SENATE": CandidateOffice.US_SENATE,
+    },
+    Party: {
+        "DEMOCRATIC": Party.DEM,
+        "DEMOCRAT": Party.DEM,
+        "REPUBLICAN": Party.REP,
+        "INDEPENDENT": Party.IND,
+        "LIBERTARIAN": Party.LIB,
+        "GREEN": Party.GRE,
+        "CONSTITUTION": Party.CON,
+        "UNAFFILIATED": Party.NPA,
+        "NONPARTISAN": Party.NPA,
+        "OTHER": Party.OTH,
+        "UNKNOWN": Party.UNK,
+    },
+    CommitteeType: {
+        # FEC committee type codes
+        "H": CommitteeType.CANDIDATE,
+        "S": CommitteeType.CANDIDATE,
+        "P": CommitteeType.CANDIDATE,
+        "N": CommitteeType.PAC,
+        "Q": CommitteeType.PAC,
+        "O": CommitteeType.SUPER_PAC,
+        "V": CommitteeType.HYBRID_PAC,
+        "W": CommitteeType.HYBRID_PAC,
+        "X": CommitteeType.PARTY,
+        "Y": CommitteeType.PARTY,
+        "Z": CommitteeType.PARTY,
+    },
+    ContributionType: {
+        # FEC receipt types and the individual entity type
+        "15": ContributionType.DIRECT,
+        "15E": ContributionType.EARMARKED,
+        "15Z": ContributionType.IN_KIND,
+        "IND": ContributionType.DIRECT,
+    },
+    ElectionType: {
+        # First letter of FEC election codes (P2024, G2024, ...)
+        "P": ElectionType.PRIMARY,
+        "G": ElectionType.GENERAL,
+        "S": ElectionType.SPECIAL,
+        "R": ElectionType.RUNOFF,
+        "C": ElectionType.CONVENTION,
+        "E": ElectionType.RECOUNT,
+        "O": ElectionType.OTHER,
+    },
+}
+
+# Member stored, with a warning, for values that are neither a member nor an alias
+DIMENSION_FALLBACKS: dict[type[Enum], Enum] = {
+    CandidateOffice: CandidateOffice.OTHER,
+    Party: Party.OTH,
+    CommitteeType: CommitteeType.OTHER,
+    ContributionType: ContributionType.OTHER,
+    ElectionType: ElectionType.OTHER,
+}
+
+
+@cache
+def code_map(enum_class: type[Enum]) -> dict[str, int]:
+    """Value -> code for one dimension."""
+    return {member.value: code for code, member in enumerate(enum_class, start=1)}
+
+
+@cache
+def value_map(enum_class: type[Enum]) -> dict[int, str]:
+    """Code -> value for one dimension."""
+    return {code: value for value, code in code_map(enum_class).items()}
+
+
+@cache
+def alias_map(enum_class: type[Enum]) -> dict[str, int]:
+    """Upper-case accepted spelling (values and aliases) -> code for one dimension."""
+    codes = code_map(enum_class)
+    aliases = DIMENSION_ALIASES.get(enum_class, {})
+    return {value.upper(): code for value, code in codes.items()} | {
+        alias: codes[member.value] for alias, member in aliases.items()
+    }
+
+
+@lru_cache(maxsize=1024)
+def _warn_fallback(enum_class: type[Enum], value: str) -> None:
+    fallback = DIMENSION_FALLBACKS[enum_class]
+    logger.warning("Storing %r as %s %s", value, enum_class.__name__, fallback.value)
+
+
+def encode(enum_class: type[Enum], value: Any) -> int:
+    """Code of a dimension value (a string, an ``enum_class`` member or an alias).
+
+    Raises:
+        ValueError: If the value is unknown and the dimension has no fallback.
+    """
+    key = value.value if isinstance(value, Enum) else value
+    code = code_map(enum_class).get(key)
+    if code is not None:
+        return code
+    if isinstance(key, str):
+        code = alias_map(enum_class).get(key.strip().upper())
+        if code is not None:
+            return code
+        fallback = DIMENSION_FALLBACKS.get(enum_class)
+        if fallback is not None:
+            _warn_fallback(enum_class, key)
+            return code_map(enum_class)[fallback.value]
+    raise ValueError(f"{value!r} is not a {enum_class.__name__} value")
+
+
+def decode(enum_class: type[Enum], code: int) -> str:
+    """Value of a dimension code."""
+    try:
+        return value_map(enum_class)[code]
+    except KeyError:
+        raise ValueError(f"{code!r} is not a {enum_class.__name__} code") from None
+
+
+class CodedEnum(TypeDecorator[str]):
+    """Dimension value stored as its ``SMALLINT`` code; reads back as the plain string."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]) -> None:
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> int | None:
+        return None if value is None else encode(self.enum_class, value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        return None if value is None else decode(self.enum_class, value)
+
+    @property
+    def python_type(self) -> type[str]:
+        return str
+
+
+def dimension_rows(enum_class: type[Enum]) -> list[dict[str, Any]]:
+    """Lookup table rows for one dimension."""
+    return [{"code": code, "value": value} for value, code in code_map(enum_class).items()]
+
+
+def sync_dimension(conn: Connection, enum_class: type[Enum]) -> int:
+    """Insert lookup rows for members added since the table was seeded; returns rows added.
+
+    Raises:
+        ValueError: If a stored code has a different value, i.e. the enum
+            was reordered or a member removed.
+    """
+    table = DIMENSION_TABLES[enum_class]
+    stored = dict(conn.execute(select(table.c.code, table.c.value)).tuples().all())
+    expected = value_map(enum_class)
+    changed = {code: value for code, value in stored.items() if expected.get(code) != value}
+    if changed:
+        raise ValueError(
+            f"{table.name} codes {sorted(changed)} no longer match {enum_class.__name__}; "
+            "members may only be appended"
+        )
+    missing = [row for row in dimension_rows(enum_class) if row["code"] not in stored]
+    if missing:
+        conn.execute(insert(table), missing)
+    return len(missing)
+
+
+@event.listens_for(Table, "after_create")
+def _seed_lookup_table(target: Table, connection: Connection, **kw: Any) -> None:
+    if target.name in _TABLE_ENUMS and target.metadata is Base.metadata:
+        sync_dimension(connection, _TABLE_ENUMS[target.name])
+
+
+def coded_columns(tables: Sequence[Table] | None = None) -> list[Column[Any]]:
+    """Every mapped column stored as a dimension code."""
+    tables = load_all_models().sorted_tables if tables is None else tables
+    return [col for table in tables for col in table.columns if isinstance(col.type, CodedEnum)]
+
+
+def _enum_of(column: Column[Any]) -> type[Enum]:
+    return cast(CodedEnum, column.type).enum_class
+
+
+def unmapped_values(conn: Connection, column: Column[Any]) -> list[str]:
+    """Distinct values of a still-string ``column`` that are neither a member nor an alias."""
+    raw = column_clause(column.name, String)
+    query = (
+        select(raw)
+        .select_from(table_clause(column.table.name, raw))
+        .where(
+            raw.is_not(None),
+            func.upper(func.trim(raw)).not_in(list(alias_map(_enum_of(column)))),
+        )
+        .distinct()
+        .order_by(raw)
+    )
+    return list(conn.execute(query).scalars())
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _code_case(name: str, enum_class: type[Enum]) -> str:
+    spellings: defaultdict[int, list[str]] = defaultdict(list)
+    for spelling, code in alias_map(enum_class).items():
+        spellings[code].append(_quote(spelling))
+    whens = " ".join(
+        f"WHEN upper(trim({name})) IN ({', '.join(values)}) THEN {code}"
+        for code, values in sorted(spellings.items())
+    )
+    fallback = DIMENSION_FALLBACKS.get(enum_class)
+    otherwise = "NULL" if fallback is None else str(code_map(enum_class)[fallback.value])
+    return f"CASE WHEN {name} IS NULL THEN NULL {whens} ELSE {otherwise} END"
+
+
+def coded_columns_ddl(dialect_name: str, table: Table, columns: Sequence[str]) -> list[str]:
+    """Statements that convert string ``columns`` of ``table`` to dimension codes.
+
+    Only PostgreSQL can change a column's type in place; SQLite databases are
+    recreated instead.
+    """
+    if dialect_name != "postgresql":
+        raise ValueError(f"Converting dimension columns is not supported on {dialect_name}")
+    alterations = []
+    for name in columns:
+        enum_class = _enum_of(table.c[name])
+        alterations += [
+            f"ALTER COLUMN {name} TYPE smallint USING {_code_case(name, enum_class)}",
+            f"ADD FOREIGN KEY ({name}) REFERENCES {DIMENSION_TABLES[enum_class].name} (code)",
+        ]
+    return [f"ALTER TABLE {table.name} {', '.join(alterations)}"]
+
+
+def install_dimensions(conn: Connection, tables: Sequence[Table] | None = None) -> None:
+    """Create and seed the lookup tables and convert string columns to codes (idempotent).
+
+    Tables that do not exist yet are skipped, as are columns the database
+    already reports as integers.
+
+    Aliases are converted to their member and other values to the
+    dimension's fallback, which is logged.
+
+    Raises:
+        ValueError: If a column without a fallback holds values outside its
+            vocabulary (nothing is converted), or string columns need
+            converting on a backend other than PostgreSQL.
+    """
+    for enum_class, lookup in DIMENSION_TABLES.items():
+        lookup.create(conn, checkfirst=True)  # Seeded by _seed_lookup_table
+        sync_dimension(conn, enum_class)
+
+    inspector = inspect(conn)
+    pending: dict[Table, list[Column[Any]]] = defaultdict(list)
+    for col in coded_columns(tables):
+        table = cast(Table, col.table)
+        if not inspector.has_table(table.name):
+            continue
+        types = {info["name"]: info["type"] for info in inspector.get_columns(table.name)}
+        if isinstance(types.get(col.name), String):
+            pending[table].append(col)
+
+    unmapped: dict[str, list[str]] = {}
+    fallbacks: dict[str, list[str]] = {}
+    for columns in pending.values():
+        for col in columns:
+            if values := unmapped_values(conn, col):
+                name = f"{col.table.name}.{col.name}"
+                target = fallbacks if _enum_of(col) in DIMENSION_FALLBACKS else unmapped
+                target[name] = values
+    if unmapped:
+        raise ValueError(f"Values outside the dimension vocabularies: {unmapped}")
+    if fallbacks:
+        logger.warning("Converting values outside the vocabularies to the fallback: %s", fallbacks)
+    for table, columns in pending.items():
+        names = [col.name for col in columns]
+        for statement in coded_columns_ddl(conn.dialect.name, table, names):
+            conn.execute(text(statement))
@@ -60,6 +60,119 @@ class USState(str, Enum):
 
 
 class Office(str, Enum):
+    """FEC office code, as stored on bronze and silver rows (see ``FEC_OFFICES``)."""
+
     PRESIDENT = "P"
     SENATE = "S"
     HOUSE = "H"
+
+
+# Gold-layer dimensions. Each is stored as a SMALLINT code: the member's
+# 1-based position (fund_lens_models.dimensions). Only append new members.
+
+
+class SourceSystem(str, Enum):
+    """Source a gold record was built from."""
+
+    FEC = "FEC"
+    MD_STATE = "MD_STATE"
+    VA_STATE = "VA_STATE"
+
+
+class JurisdictionLevel(str, Enum):
+    """Level of government of a candidate's office."""
+
+    FEDERAL = "FEDERAL"
+    STATE = "STATE"
+    COUNTY = "COUNTY"
+    CITY = "CITY"
+
+
+class CandidateOffice(str, Enum):
+    """Normalized office a gold candidate is running for.
+
+    The federal members are the ``Office`` codes under the names gold has
+    always stored (``US_HOUSE``, ...), followed by state and local offices.
+    """
+
+    PRESIDENT = "PRESIDENT"
+    US_SENATE = "US_SENATE"
+    US_HOUSE = "US_HOUSE"
+    GOVERNOR = "GOVERNOR"
+    LT_GOVERNOR = "LT_GOVERNOR"
+    ATTORNEY_GENERAL = "ATTORNEY_GENERAL"
+    COMPTROLLER = "COMPTROLLER"
+    STATE_SENATE = "STATE_SENATE"
+    STATE_HOUSE = "STATE_HOUSE"
+    COUNTY_EXEC = "COUNTY_EXEC"
+    COUNTY_COUNCIL = "COUNTY_COUNCIL"
+    COUNTY_COMM = "COUNTY_COMM"
+    STATES_ATTORNEY = "STATES_ATTORNEY"
+    SHERIFF = "SHERIFF"
+    CLERK_OF_COURT = "CLERK_OF_COURT"
+    REGISTER_OF_WILLS = "REGISTER_OF_WILLS"
+    ORPHANS_COURT_JUDGE = "ORPHANS_COURT_JUDGE"
+    BOARD_OF_EDUCATION = "BOARD_OF_EDUCATION"
+    MAYOR = "MAYOR"
+    CITY_COUNCIL = "CITY_COUNCIL"
+    OTHER = "OTHER"
+
+
+# FEC office code -> gold office; gold office columns accept either
+FEC_OFFICES: dict[Office, CandidateOffice] = {
+    Office.PRESIDENT: CandidateOffice.PRESIDENT,
+    Office.SENATE: CandidateOffice.US_SENATE,
+    Office.HOUSE: CandidateOffice.US_HOUSE,
+}
+
+
+class Party(str, Enum):
+    """Political party (FEC party codes)."""
+
+    DEM = "DEM"
+    REP = "REP"
+    IND = "IND"
+    LIB = "LIB"
+    GRE = "GRE"
+    CON = "CON"
+    NPA = "NPA"  # No party affiliation / unaffiliated
+    OTH = "OTH"
+    UNK = "UNK"
+
+
+class CommitteeType(str, Enum):
+    """Normalized committee type."""
+
+    CANDIDATE = "CANDIDATE"
+    PAC = "PAC"
+    SUPER_PAC = "SUPER_PAC"
+    HYBRID_PAC = "HYBRID_PAC"
+    PARTY = "PARTY"
+    JOINT_FUNDRAISING = "JOINT_FUNDRAISING"
+    BALLOT_ISSUE = "BALLOT_ISSUE"
+    SLATE = "SLATE"
+    OTHER = "OTHER"
+
+
+class ContributionType(str, Enum):
+    """Normalized contribution type."""
+
+    DIRECT = "DIRECT"
+    EARMARKED = "EARMARKED"
+    IN_KIND = "IN_KIND"
+    TRANSFER = "TRANSFER"
+    LOAN = "LOAN"
+    REFUND = "REFUND"
+    OTHER = "OTHER"
+
+
+class ElectionType(str, Enum):
+    """Election a contribution is designated for."""
+
+    PRIMARY = "PRIMARY"
+    GENERAL = "GENERAL"
+    SPECIAL = "SPECIAL"
+    RUNOFF = "RUNOFF"
+    CONVENTION = "CONVENTION"
+    RECOUNT = "RECOUNT"
+    OTHER = "OTHER"
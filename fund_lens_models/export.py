@@ -0,0 +1,350 @@
+"""Columnar Parquet export of gold and silver contributions.
+
+Loading ``gold_contribution`` into pandas through ORM queries builds one
+Python object and several ``Decimal`` instances per row. The exporter
+instead streams plain Core rows through a server-side cursor
+(``yield_per``) and converts each batch straight into an Arrow record
+batch, so memory is bounded by ``batch_size`` regardless of the table size:
+
+* amounts are exported as ``int64`` cents, computed in SQL, so no
+  ``Decimal`` objects are created;
+* low-cardinality strings (states, types, party) are dictionary-encoded;
+* each ``(election_cycle, source_system)`` partition is written to its own
+  Hive-style directory (``election_cycle=2024/source_system=FEC/``), which
+  ``pyarrow.dataset`` and pandas read back with the partition columns
+  restored.
+
+Partitions are independent, so ``processes`` exports them in parallel, each
+worker using its own engine. Requires the ``export`` extra (``pyarrow``).
+"""
+
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import BigInteger, Connection, Select, cast, create_engine, func, literal, select
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from fund_lens_models.gold.models import (
+    GoldCandidate,
+    GoldCommittee,
+    GoldContribution,
+    GoldContributor,
+)
+from fund_lens_models.silver.fec import SilverFECContribution
+
+DEFAULT_BATCH_SIZE = 50_000
+
+# Arrow column kinds; "category" is a dictionary-encoded string
+INT = "int"
+STRING = "string"
+CATEGORY = "category"
+DATE = "date"
+BOOL = "bool"
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    """One exported column: output name, SQL expression and Arrow kind."""
+
+    name: str
+    expression: ColumnElement[Any] | InstrumentedAttribute[Any]
+    kind: str
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """A flat, partitioned export of one fact table and its joined dimensions."""
+
+    name: str
+    columns: tuple[ExportColumn, ...]
+    partition_by: tuple[str, ...]
+    select_from: Any
+
+    def column(self, name: str) -> ExportColumn:
+        return next(column for column in self.columns if column.name == name)
+
+    @property
+    def data_columns(self) -> tuple[ExportColumn, ...]:
+        """Columns stored in the files; partition values live in the directory names."""
+        return tuple(column for column in self.columns if column.name not in self.partition_by)
+
+
+def _cents(amount: Any) -> ColumnElement[int]:
+    # round() first: SQLite stores NUMERIC as floating point
+    return cast(func.round(amount * 100), BigInteger)
+
+
+_gold = GoldContribution
+_committee = GoldCommittee.__table__.alias("committee")
+
+GOLD_CONTRIBUTIONS = ExportSpec(
+    name="gold_contribution",
+    columns=(
+        ExportColumn("election_cycle", _gold.election_cycle, INT),
+        ExportColumn("source_system", _gold.source_system, CATEGORY),
+        ExportColumn("id", _gold.id, INT),
+        ExportColumn("source_sub_id", _gold.source_sub_id, STRING),
+        ExportColumn("contribution_date", _gold.contribution_date, DATE),
+        ExportColumn("amount_cents", _cents(_gold.amount), INT),
+        ExportColumn("contribution_type", _gold.contribution_type, CATEGORY),
+        ExportColumn("election_type", _gold.election_type, CATEGORY),
+        ExportColumn("election_year", _gold.election_year, INT),
+        ExportColumn("is_earmark_receipt", _gold.is_earmark_receipt, BOOL),
+        ExportColumn("conduit_committee_id", _gold.conduit_committee_id, INT),
+        ExportColumn("contributor_id", _gold.contributor_id, INT),
+        ExportColumn("contributor_name", GoldContributor.name, STRING),
+        ExportColumn("contributor_city", GoldContributor.city, STRING),
+        ExportColumn("contributor_state", GoldContributor.state, CATEGORY),
+        ExportColumn("contributor_zip", GoldContributor.zip, STRING),
+        ExportColumn("contributor_employer", GoldContributor.employer, STRING),
+        ExportColumn("contributor_occupation", GoldContributor.occupation, STRING),
+        ExportColumn("contributor_entity_type", GoldContributor.entity_type, CATEGORY),
+        ExportColumn("committee_id", _gold.recipient_committee_id, INT),
+        ExportColumn("committee_name", _committee.c.name, STRING),
+        ExportColumn("committee_type", _committee.c.committee_type, CATEGORY),
+        ExportColumn("committee_party", _committee.c.party, CATEGORY),
+        ExportColumn("committee_state", _committee.c.state, CATEGORY),
+        ExportColumn("candidate_id", _gold.recipient_candidate_id, INT),
+        ExportColumn("candidate_name", GoldCandidate.name, STRING),
+        ExportColumn("candidate_office", GoldCandidate.office, CATEGORY),
+        ExportColumn("candidate_party", GoldCandidate.party, CATEGORY),
+        ExportColumn("candidate_state", GoldCandidate.state, CATEGORY),
+    ),
+    partition_by=("election_cycle", "source_system"),
+    select_from=GoldContribution.__table__.outerjoin(
+        GoldContributor.__table__, GoldContributor.id == _gold.contributor_id
+    )
+    .outerjoin(_committee, _committee.c.id == _gold.recipient_committee_id)
+    .outerjoin(GoldCandidate.__table__, GoldCandidate.id == _gold.recipient_candidate_id),
+)
+
+_silver = SilverFECContribution
+
+SILVER_FEC_CONTRIBUTIONS = ExportSpec(
+    name="silver_fec_contribution",
+    columns=(
+        ExportColumn("election_cycle", _silver.election_cycle, INT),
+        ExportColumn("source_system", literal("FEC"), CATEGORY),
+        ExportColumn("id", _silver.id, INT),
+        ExportColumn("source_sub_id", _silver.source_sub_id, STRING),
+        ExportColumn("transaction_id", _silver.transaction_id, STRING),
+        ExportColumn("contribution_date", _silver.contribution_date, DATE),
+        ExportColumn("amount_cents", _cents(_silver.contribution_amount), INT),
+        ExportColumn("contributor_name", _silver.contributor_name, STRING),
+        ExportColumn("contributor_city", _silver.contributor_city, STRING),
+        ExportColumn("contributor_state", _silver.contributor_state, CATEGORY),
+        ExportColumn("contributor_zip", _silver.contributor_zip, STRING),
+        ExportColumn("contributor_employer", _silver.contributor_employer, STRING),
+        ExportColumn("contributor_occupation", _silver.contributor_occupation, STRING),
+        ExportColumn("entity_type", _silver.entity_type, CATEGORY),
+        ExportColumn("committee_id", _silver.committee_id, STRING),
+        ExportColumn("committee_name", _silver.committee_name, STRING),
+        ExportColumn("committee_type", _silver.committee_type, CATEGORY),
+        ExportColumn("committee_party", _silver.committee_party, CATEGORY),
+        ExportColumn("candidate_id", _silver.candidate_id, STRING),
+        ExportColumn("candidate_name", _silver.candidate_name, STRING),
+        ExportColumn("candidate_office", _silver.candidate_office, CATEGORY),
+        ExportColumn("candidate_party", _silver.candidate_party, CATEGORY),
+        ExportColumn("receipt_type", _silver.receipt_type, CATEGORY),
+        ExportColumn("election_type", _silver.election_type, CATEGORY),
+        ExportColumn("memo_code", _silver.memo_code, CATEGORY),
+        ExportColumn("report_year", _silver.report_year, INT),
+    ),
+    partition_by=("election_cycle", "source_system"),
+    select_from=SilverFECContribution.__table__,
+)
+
+# Looked up by name in worker processes; SQL expressions are not pickled
+EXPORTS = {spec.name: spec for spec in (GOLD_CONTRIBUTIONS, SILVER_FEC_CONTRIBUTIONS)}
+
+
+@dataclass
+class PartitionExport:
+    """One written partition file."""
+
+    values: tuple[Any, ...]
+    path: Path
+    rows: int
+
+
+@dataclass
+class ExportResult:
+    """Files written by an export."""
+
+    partitions: list[PartitionExport] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        return sum(partition.rows for partition in self.partitions)
+
+
+def _require_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa  # type: ignore[import-untyped]
+        import pyarrow.parquet as pq  # type: ignore[import-untyped]
+    except ImportError:
+        raise ImportError(
+            "Parquet export requires pyarrow; install fund-lens-models[export]"
+        ) from None
+    return pa, pq
+
+
+def _partition_filter(spec: ExportSpec, values: Sequence[Any]) -> list[ColumnElement[bool]]:
+    return [
+        spec.column(name).expression == value
+        for name, value in zip(spec.partition_by, values, strict=True)
+    ]
+
+
+def partitions_query(spec: ExportSpec, cycles: Sequence[int] | None = None) -> Select[Any]:
+    """Distinct partition values present in the source, optionally limited to ``cycles``."""
+    keys = [spec.column(name).expression.label(name) for name in spec.partition_by]
+    query = select(*keys).select_from(spec.select_from).distinct().order_by(*keys)
+    if cycles is not None:
+        query = query.where(spec.column("election_cycle").expression.in_(cycles))
+    return query
+
+
+def export_query(spec: ExportSpec, values: Sequence[Any]) -> Select[Any]:
+    """Rows of one partition, with only the columns stored in its files."""
+    return (
+        select(*(column.expression.label(column.name) for column in spec.data_columns))
+        .select_from(spec.select_from)
+        .where(*_partition_filter(spec, values))
+    )
+
+
+def iter_column_batches(
+    conn: Connection,
+    spec: ExportSpec,
+    values: Sequence[Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[list[Sequence[Any]]]:
+    """Stream one partition as lists of column values, ``batch_size`` rows at a time.
+
+    Rows come through a server-side cursor and are transposed without being
+    wrapped in ORM objects.
+    """
+    result = conn.execution_options(yield_per=batch_size).execute(export_query(spec, values))
+    for rows in result.partitions():
+        yield list(zip(*rows, strict=True))
+
+
+def _arrow_schema(pa: Any, spec: ExportSpec) -> Any:
+    types = {
+        INT: pa.int64(),
+        STRING: pa.string(),
+        CATEGORY: pa.dictionary(pa.int32(), pa.string()),
+        DATE: pa.date32(),
+        BOOL: pa.bool_(),
+    }
+    return pa.schema([pa.field(column.name, types[column.kind]) for column in spec.data_columns])
+
+
+def _record_batch(pa: Any, schema: Any, columns: list[Sequence[Any]]) -> Any:
+    arrays = []
+    for arrow_field, values in zip(schema, columns, strict=True):
+        if pa.types.is_dictionary(arrow_field.type):
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, arrow_field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def partition_path(spec: ExportSpec, output_dir: Path, values: Sequence[Any]) -> Path:
+    """Hive-style file path of one partition."""
+    path = Path(output_dir)
+    for name, value in zip(spec.partition_by, values, strict=True):
+        path = path / f"{name}={value}"
+    return path / "part-0.parquet"
+
+
+def export_partition(
+    conn: Connection,
+    spec: ExportSpec,
+    values: Sequence[Any],
+    output_dir: Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = "zstd",
+) -> PartitionExport:
+    """Write one partition to its Parquet file, one row group per batch."""
+    pa, pq = _require_pyarrow()
+    schema = _arrow_schema(pa, spec)
+    path = partition_path(spec, output_dir, values)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for columns in iter_column_batches(conn, spec, values, batch_size):
+            writer.write_batch(_record_batch(pa, schema, columns))
+            rows += len(columns[0])
+    return PartitionExport(tuple(values), path, rows)
+
+
+def _export_partition_worker(
+    database_url: str,
+    spec_name: str,
+    values: tuple[Any, ...],
+    output_dir: Path,
+    batch_size: int,
+    compression: str,
+) -> PartitionExport:
+    engine = create_engine(database_url)
+    try:
+        with engine.connect() as conn:
+            return export_partition(
+                conn, EXPORTS[spec_name], values, output_dir, batch_size, compression
+            )
+    finally:
+        engine.dispose()
+
+
+def export_parquet(
+    database_url: str | URL,
+    output_dir: str | Path,
+    spec: ExportSpec = GOLD_CONTRIBUTIONS,
+    cycles: Sequence[int] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    processes: int = 1,
+    compression: str = "zstd",
+) -> ExportResult:
+    """Export ``spec`` to partitioned Parquet files under ``output_dir``.
+
+    Args:
+        database_url: Database to read; workers open their own connections.
+        output_dir: Root of the Hive-partitioned dataset.
+        spec: What to export (``GOLD_CONTRIBUTIONS`` or ``SILVER_FEC_CONTRIBUTIONS``).
+        cycles: Election cycles to export; None exports every cycle present.
+        batch_size: Rows per fetch and per Parquet row group.
+        processes: Partitions exported in parallel; 1 exports in-process.
+        compression: Parquet codec.
+    """
+    _require_pyarrow()
+    url = make_url(database_url).render_as_string(hide_password=False)
+    root = Path(output_dir)
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            partitions = [tuple(row) for row in conn.execute(partitions_query(spec, cycles))]
+            if processes <= 1:
+                return ExportResult(
+                    [
+                        export_partition(conn, spec, values, root, batch_size, compression)
+                        for values in partitions
+                    ]
+                )
+    finally:
+        engine.dispose()
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [
+            pool.submit(
+                _export_partition_worker, url, spec.name, values, root, batch_size, compression
+            )
+            for values in partitions
+        ]
+        return ExportResult([future.result() for future in futures])
@@ -1,15 +1,55 @@
 """Gold contribution data"""
 
-from fund_lens_models.gold.models import (
-    GoldCandidate,
-    GoldCommittee,
-    GoldContribution,
-    GoldContributor,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fund_lens_models.gold.models import (
+        GoldAggregateWatermark,
+        GoldCandidate,
+        GoldCandidateCycleTotal,
+        GoldCommittee,
+        GoldCommitteeCycleTotal,
+        GoldContribution,
+        GoldContributor,
+        GoldContributorSource,
+        GoldDailyContributionRollup,
+    )
+
+# Public name -> defining module, imported on first access (PEP 562)
+_ATTRIBUTES = {
+    "GoldAggregateWatermark": "fund_lens_models.gold.models",
+    "GoldCandidate": "fund_lens_models.gold.models",
+    "GoldCandidateCycleTotal": "fund_lens_models.gold.models",
+    "GoldCommittee": "fund_lens_models.gold.models",
+    "GoldCommitteeCycleTotal": "fund_lens_models.gold.models",
+    "GoldContribution": "fund_lens_models.gold.models",
+    "GoldContributor": "fund_lens_models.gold.models",
+    "GoldContributorSource": "fund_lens_models.gold.models",
+    "GoldDailyContributionRollup": "fund_lens_models.gold.models",
+}
 
 __all__ = [
     "GoldContributor",
+    "GoldContributorSource",
     "GoldCandidate",
     "GoldCommittee",
     "GoldContribution",
+    # Aggregates
+    "GoldCandidateCycleTotal",
+    "GoldCommitteeCycleTotal",
+    "GoldDailyContributionRollup",
+    "GoldAggregateWatermark",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,418 @@
+"""Incremental refresh of the gold fundraising aggregate tables.
+
+``gold_candidate_cycle_total`` and ``gold_committee_cycle_total`` hold
+totals, counts, unique contributors and small/large-dollar splits per
+recipient and cycle, so dashboard reads are primary-key lookups instead of
+scans of ``gold_contribution``.
+
+A refresh reads only contributions whose ``updated_at`` is past the
+watermark, collects the ``(recipient, cycle)`` groups they belong to, and
+recomputes just those groups with one grouped query per batch. Recomputing
+whole groups, rather than adding deltas to stored sums, keeps distinct
+contributor counts exact and makes updates (amendments, earmark flags)
+and re-runs safe. Groups left with no countable contributions are deleted.
+Contributions moved to another recipient or cycle, and deleted rows, are
+only reflected for the old group by a ``full`` refresh.
+
+``gold_daily_contribution_rollup`` buckets contributions by date, recipient
+committee, contributor state and type for time-series and map endpoints. It
+is built per date window with ``DELETE`` + ``INSERT ... SELECT`` in one
+transaction per window, so re-aggregating any date range is idempotent and
+no contribution rows pass through Python. An incremental refresh rebuilds
+the dates of changed contributions, the dates of contributions whose
+contributor changed (a new ``state`` moves them between buckets), and, for
+the committees of changed contributions, the dates whose stored bucket count
+no longer matches ``gold_contribution`` - the old date of a contribution
+whose ``contribution_date`` moved. That check reads the touched committees'
+contributions through ``(recipient_committee_id, contribution_date)``.
+
+Each aggregate keeps its position in ``gold_aggregate_watermark`` under its
+table name. As in the silver transforms, only rows whose ``updated_at`` is
+older than the database clock minus ``safety_lag`` count as changed, so
+writes still in flight when a refresh starts are picked up by the next one
+instead of falling behind the watermark.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import (
+    Insert,
+    Select,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    union,
+)
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.elements import KeyedColumnElement
+
+from fund_lens_models.base import Base
+from fund_lens_models.bulk import batched, bulk_upsert
+from fund_lens_models.gold.models import (
+    GoldAggregateWatermark,
+    GoldCandidateCycleTotal,
+    GoldCommitteeCycleTotal,
+    GoldContribution,
+    GoldContributor,
+    GoldDailyContributionRollup,
+)
+from fund_lens_models.silver.watermark import DEFAULT_SAFETY_LAG, load_watermark, safety_cutoff
+
+SMALL_DOLLAR_THRESHOLD = Decimal("200.00")
+
+_KEY_BATCH = 1000
+DEFAULT_WINDOW_DAYS = 7
+DAILY_ROLLUP_WATERMARK = GoldDailyContributionRollup.__tablename__
+
+
+@dataclass(frozen=True)
+class AggregateSpec:
+    """A per-recipient, per-cycle aggregate table and the contribution column it groups by."""
+
+    model: type[Base]
+    key: str
+    source_column: str
+
+    @property
+    def watermark_name(self) -> str:
+        return self.model.__tablename__
+
+    @property
+    def source(self) -> KeyedColumnElement[Any]:
+        return GoldContribution.__table__.c[self.source_column]
+
+
+AGGREGATES = (
+    AggregateSpec(
+        GoldCandidateCycleTotal,
+        "candidate_id",
+        "recipient_candidate_id",
+    ),
+    AggregateSpec(
+        GoldCommitteeCycleTotal,
+        "committee_id",
+        "recipient_committee_id",
+    ),
+)
+
+
+@dataclass
+class AggregateRefreshResult:
+    """Groups recomputed and removed per aggregate table."""
+
+    groups_refreshed: dict[str, int]
+    groups_removed: dict[str, int]
+
+
+def _totals_query(spec: AggregateSpec, keys: Sequence[tuple[int, int]] | None) -> Select[Any]:
+    gold = GoldContribution
+    amount = gold.amount
+    small = amount <= SMALL_DOLLAR_THRESHOLD
+    zero = literal(0)
+    query = (
+        select(
+            spec.source.label(spec.key),
+            gold.election_cycle,
+            func.sum(amount).label("total_amount"),
+            func.count().label("contribution_count"),
+            func.count(gold.contributor_id.distinct()).label("unique_contributors"),
+            func.sum(case((small, amount), else_=zero)).label("small_dollar_amount"),
+            func.sum(case((small, 1), else_=0)).label("small_dollar_count"),
+            func.sum(case((small, zero), else_=amount)).label("large_dollar_amount"),
+            func.sum(case((small, 0), else_=1)).label("large_dollar_count"),
+        )
+        .where(~gold.is_earmark_receipt, spec.source.is_not(None))
+        .group_by(spec.source, gold.election_cycle)
+    )
+    if keys is not None:
+        query = query.where(tuple_(spec.source, gold.election_cycle).in_(keys))
+    return query
+
+
+def _before(column: Any, cutoff: datetime) -> Any:
+    return column < literal(cutoff, column.type)
+
+
+def refresh_aggregate(
+    session: Session,
+    spec: AggregateSpec,
+    full: bool = False,
+    safety_lag: timedelta = DEFAULT_SAFETY_LAG,
+) -> tuple[int, int]:
+    """Recompute the groups of one aggregate touched since its watermark.
+
+    Returns:
+        Number of groups upserted and deleted.
+    """
+    gold = GoldContribution
+    model_table = spec.model.__table__
+    watermark = load_watermark(session, GoldAggregateWatermark, spec.watermark_name, lock=True)
+    since: datetime | None = None if full else watermark.last_change_timestamp
+    cutoff = safety_cutoff(session, safety_lag)
+    through = session.execute(
+        select(func.max(gold.updated_at)).where(_before(gold.updated_at, cutoff))
+    ).scalar()
+
+    refreshed = removed = 0
+    if since is None:
+        session.execute(delete(spec.model))
+        rows = [dict(row) for row in session.execute(_totals_query(spec, None)).mappings()]
+        refreshed = bulk_upsert(session, spec.model, rows, (spec.key, "election_cycle")).total
+    else:
+        changed = (
+            select(spec.source, gold.election_cycle)
+            .where(
+                gold.updated_at > since,
+                _before(gold.updated_at, cutoff),
+                spec.source.is_not(None),
+            )
+            .distinct()
+        )
+        for keys in batched(session.execute(changed).tuples().all(), _KEY_BATCH):
+            rows = [dict(row) for row in session.execute(_totals_query(spec, keys)).mappings()]
+            refreshed += bulk_upsert(session, spec.model, rows, (spec.key, "election_cycle")).total
+            present = {(row[spec.key], row["election_cycle"]) for row in rows}
+            empty = [key for key in keys if tuple(key) not in present]
+            if empty:
+                key_column = model_table.c[spec.key]
+                result = session.execute(
+                    delete(spec.model).where(
+                        tuple_(key_column, model_table.c.election_cycle).in_(empty)
+                    )
+                )
+                removed += result.rowcount  # type: ignore[attr-defined]
+
+    if through is not None:
+        watermark.last_change_timestamp = through
+    watermark.rows_processed += refreshed
+    return refreshed, removed
+
+
+def refresh_fundraising_totals(
+    session: Session, full: bool = False, safety_lag: timedelta = DEFAULT_SAFETY_LAG
+) -> AggregateRefreshResult:
+    """Refresh the candidate and committee cycle totals from changed contributions.
+
+    Args:
+        session: Session to use; the caller commits. Each aggregate's watermark
+            advances in the same transaction as its rows.
+        full: Rebuild every group instead of only the changed ones.
+        safety_lag: Only contributions with ``updated_at`` older than the
+            database clock minus this count as changed; newer ones are left
+            for the next refresh.
+    """
+    result = AggregateRefreshResult(groups_refreshed={}, groups_removed={})
+    for spec in AGGREGATES:
+        refreshed, removed = refresh_aggregate(session, spec, full=full, safety_lag=safety_lag)
+        result.groups_refreshed[spec.watermark_name] = refreshed
+        result.groups_removed[spec.watermark_name] = removed
+    return result
+
+
+def _daily_rollup_insert(start: date, end: date) -> Insert:
+    gold = GoldContribution
+    state = func.coalesce(GoldContributor.state, "")
+    query = (
+        select(
+            gold.contribution_date,
+            gold.recipient_committee_id,
+            state,
+            gold.contribution_type,
+            func.sum(gold.amount),
+            func.count(),
+        )
+        .outerjoin(GoldContributor, GoldContributor.id == gold.contributor_id)
+        .where(
+            gold.contribution_date.between(start, end),
+            ~gold.is_earmark_receipt,
+        )
+        .group_by(
+            gold.contribution_date, gold.recipient_committee_id, state, gold.contribution_type
+        )
+    )
+    return insert(GoldDailyContributionRollup).from_select(
+        [
+            "contribution_date",
+            "recipient_committee_id",
+            "contributor_state",
+            "contribution_type",
+            "total_amount",
+            "contribution_count",
+        ],
+        query,
+    )
+
+
+def rebuild_daily_rollup(
+    session_factory: sessionmaker[Session],
+    start: date,
+    end: date,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+) -> int:
+    """Re-aggregate the daily rollup for ``start``..``end`` (inclusive).
+
+    Each window of ``window_days`` days is replaced in its own transaction,
+    so a long backfill streams through the fact table in bounded chunks and
+    an interrupted run can simply be repeated.
+
+    Returns:
+        Number of rollup rows written.
+    """
+    rollup = GoldDailyContributionRollup
+    written = 0
+    window_start = start
+    while window_start <= end:
+        window_end = min(window_start + timedelta(days=window_days - 1), end)
+        with session_factory.begin() as session:
+            session.execute(
+                delete(rollup).where(rollup.contribution_date.between(window_start, window_end))
+            )
+            result = session.execute(_daily_rollup_insert(window_start, window_end))
+            written += result.rowcount  # type: ignore[attr-defined]
+        window_start = window_end + timedelta(days=1)
+    return written
+
+
+def _changed_between(column: Any, since: datetime, cutoff: datetime) -> Any:
+    return and_(column > since, _before(column, cutoff))
+
+
+def _changed_dates(since: datetime | None, cutoff: datetime) -> Select[Any]:
+    gold = GoldContribution
+    rollup = GoldDailyContributionRollup
+    if since is None:
+        # Also dates that only the rollup still has, so emptied buckets are removed
+        return (
+            union(select(gold.contribution_date), select(rollup.contribution_date))
+            .subquery()
+            .select()
+        )
+    return (
+        union(
+            select(gold.contribution_date).where(_changed_between(gold.updated_at, since, cutoff)),
+            select(gold.contribution_date)
+            .join(GoldContributor, GoldContributor.id == gold.contributor_id)
+            .where(_changed_between(GoldContributor.updated_at, since, cutoff)),
+        )
+        .subquery()
+        .select()
+    )
+
+
+def _stale_dates(session: Session, since: datetime, cutoff: datetime) -> set[date]:
+    """Dates of touched committees whose stored bucket counts no longer match."""
+    gold = GoldContribution
+    rollup = GoldDailyContributionRollup
+    committees = (
+        select(gold.recipient_committee_id)
+        .where(
+            _changed_between(gold.updated_at, since, cutoff),
+            gold.recipient_committee_id.is_not(None),
+        )
+        .distinct()
+    )
+    stale: set[date] = set()
+    for batch in batched(session.execute(committees).scalars().all(), _KEY_BATCH):
+        stored = (
+            select(
+                rollup.recipient_committee_id,
+                rollup.contribution_date,
+                func.sum(rollup.contribution_count).label("contribution_count"),
+            )
+            .where(rollup.recipient_committee_id.in_(batch))
+            .group_by(rollup.recipient_committee_id, rollup.contribution_date)
+            .subquery("stored")
+        )
+        live = (
+            select(
+                gold.recipient_committee_id,
+                gold.contribution_date,
+                func.count().label("contribution_count"),
+            )
+            .where(gold.recipient_committee_id.in_(batch), ~gold.is_earmark_receipt)
+            .group_by(gold.recipient_committee_id, gold.contribution_date)
+            .subquery("live")
+        )
+        query = (
+            select(stored.c.contribution_date)
+            .outerjoin(
+                live,
+                and_(
+                    live.c.recipient_committee_id == stored.c.recipient_committee_id,
+                    live.c.contribution_date == stored.c.contribution_date,
+                ),
+            )
+            .where(live.c.contribution_count.is_distinct_from(stored.c.contribution_count))
+            .distinct()
+        )
+        stale.update(session.execute(query).scalars())
+    return stale
+
+
+def refresh_daily_rollup(
+    session_factory: sessionmaker[Session],
+    window_days: int = DEFAULT_WINDOW_DAYS,
+    safety_lag: timedelta = DEFAULT_SAFETY_LAG,
+) -> int:
+    """Re-aggregate only the dates affected by changes since the watermark.
+
+    Contributions deleted from a committee with no other changes, or moved to
+    another committee, are only reflected by :func:`rebuild_daily_rollup`.
+    Contribution and contributor changes newer than the database clock minus
+    ``safety_lag`` are left for the next refresh.
+
+    Returns:
+        Number of rollup rows written.
+    """
+    gold = GoldContribution
+    with session_factory.begin() as session:
+        since = load_watermark(
+            session, GoldAggregateWatermark, DAILY_ROLLUP_WATERMARK
+        ).last_change_timestamp
+        cutoff = safety_cutoff(session, safety_lag)
+        latest = session.execute(
+            select(func.max(gold.updated_at))
+            .where(_before(gold.updated_at, cutoff))
+            .union_all(
+                select(func.max(GoldContributor.updated_at)).where(
+                    _before(GoldContributor.updated_at, cutoff)
+                )
+            )
+        ).scalars()
+        through = max((value for value in latest if value is not None), default=None)
+        dates = set(session.execute(_changed_dates(since, cutoff)).scalars())
+        if since is not None:
+            dates |= _stale_dates(session, since, cutoff)
+
+    written = 0
+    # Rebuild runs of nearby changed dates together, one window at a time
+    for run_start, run_end in _date_runs(sorted(dates), window_days):
+        written += rebuild_daily_rollup(session_factory, run_start, run_end, window_days)
+
+    with session_factory.begin() as session:
+        watermark = load_watermark(
+            session, GoldAggregateWatermark, DAILY_ROLLUP_WATERMARK, lock=True
+        )
+        if through is not None:
+            watermark.last_change_timestamp = through
+        watermark.rows_processed += written
+    return written
+
+
+def _date_runs(dates: Sequence[date], window_days: int) -> list[tuple[date, date]]:
+    runs: list[tuple[date, date]] = []
+    for day in dates:
+        if runs and (day - runs[-1][0]).days < window_days:
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
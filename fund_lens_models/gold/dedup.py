@@ -0,0 +1,704 @@
+"""Contributor deduplication: silver FEC and Maryland contributors -> ``GoldContributor``.
+
+Comparing every contributor with every other one is quadratic, so matching
+runs in three steps:
+
+1. Silver rows are collapsed into distinct identities (normalized name,
+   location and employer), so repeat donors are compared once.
+2. Each identity gets blocking keys: last name + ZIP5, a Soundex code of the
+   last name + first initial + state, and employer tokens + Soundex. Only
+   identities sharing a block are scored, and oversized blocks are skipped.
+3. Pairs scoring at least the threshold are joined with union-find. Each
+   resulting cluster becomes one ``GoldContributor``, and every silver record
+   is mapped to it in ``gold_contributor_source``.
+
+Union-find alone is transitive, so ``JOHN`` - ``J`` - ``JANE`` could chain two
+different people through an initial. Each cluster therefore tracks the full
+first names it contains, and two clusters whose full first names conflict are
+never joined.
+
+By default only silver rows without a mapping are read, and they are matched
+against the existing contributors that could share a block with them (same
+last name, or same name or ZIP for organizations); the rest of
+``gold_contributor`` is not loaded. A new record either joins one existing
+cluster or starts a new one. Existing clusters are never merged with each
+other, so published contributor ids stay stable. ``rebuild=True`` re-clusters
+everything from scratch.
+"""
+
+import logging
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import chain, combinations
+from typing import Any
+
+from sqlalchemy import and_, delete, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from fund_lens_models.bulk import batched, bulk_upsert
+from fund_lens_models.gold.models import GoldContributor, GoldContributorSource
+from fund_lens_models.silver.fec import SilverFECContribution
+from fund_lens_models.silver.maryland import SilverMarylandContribution
+
+logger = logging.getLogger(__name__)
+
+FEC_SOURCE = "FEC"
+MARYLAND_SOURCE = "MD_STATE"
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_MAX_BLOCK_SIZE = 500
+
+_YIELD_PER = 10_000
+_WRITE_BATCH = 1000
+
+_NON_ALPHA = re.compile(r"[^A-Z ]+")
+_NAME_AFFIXES = frozenset(
+    {"MR", "MRS", "MS", "MISS", "DR", "JR", "SR", "II", "III", "IV", "ESQ", "MD", "PHD", "DDS"}
+)
+_EMPLOYER_STOPWORDS = frozenset(
+    [
+        "NOT",
+        "PROVIDED",
+        "NONE",
+        "NA",
+        "N",
+        "A",
+        "SELF",
+        "EMPLOYED",
+        "RETIRED",
+        "UNEMPLOYED",
+        "HOMEMAKER",
+        "INFORMATION",
+        "REQUESTED",
+        "REFUSED",
+        "THE",
+        "INC",
+        "LLC",
+        "LLP",
+        "CO",
+        "CORP",
+        "CORPORATION",
+        "COMPANY",
+        "OF",
+        "AND",
+    ]
+)
+
+# Source entity/contributor type -> GoldContributor.entity_type
+_FEC_ENTITY_TYPES = {
+    "IND": "INDIVIDUAL",
+    "CAN": "INDIVIDUAL",
+    "COM": "COMMITTEE",
+    "CCM": "COMMITTEE",
+    "PAC": "COMMITTEE",
+    "PTY": "COMMITTEE",
+    "ORG": "ORG",
+}
+_MARYLAND_ENTITY_TYPES = {
+    "INDIVIDUAL": "INDIVIDUAL",
+    "SELF (CANDIDATE)": "INDIVIDUAL",
+    "CANDIDATE SPOUSE": "INDIVIDUAL",
+    "POLITICAL COMMITTEE": "COMMITTEE",
+    "FEDERAL COMMITTEE": "COMMITTEE",
+    "PAC": "COMMITTEE",
+}
+
+
+def _normalize(value: str | None) -> str:
+    if not value:
+        return ""
+    return " ".join(_NON_ALPHA.sub(" ", value.upper()).split())
+
+
+def split_name(
+    name: str, first_name: str | None = None, last_name: str | None = None
+) -> tuple[str, str]:
+    """Return normalized ``(first, last)`` for an individual's name.
+
+    Explicit first/last values win. Otherwise ``"LAST, FIRST M"`` (FEC) is
+    split on the comma and ``"First M Last"`` on the last word; titles and
+    suffixes are dropped.
+    """
+    if last_name:
+        first = [t for t in _normalize(first_name).split() if t not in _NAME_AFFIXES]
+        last = [t for t in _normalize(last_name).split() if t not in _NAME_AFFIXES]
+        return (first[0] if first else ""), " ".join(last)
+    if "," in name:
+        last_part, _, first_part = name.partition(",")
+        last = [t for t in _normalize(last_part).split() if t not in _NAME_AFFIXES]
+        first = [t for t in _normalize(first_part).split() if t not in _NAME_AFFIXES]
+        return (first[0] if first else ""), " ".join(last)
+    tokens = [t for t in _normalize(name).split() if t not in _NAME_AFFIXES]
+    if len(tokens) < 2:
+        return "", tokens[0] if tokens else ""
+    return tokens[0], tokens[-1]
+
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("BFPV", "1"),
+    **dict.fromkeys("CGJKQSXZ", "2"),
+    **dict.fromkeys("DT", "3"),
+    "L": "4",
+    **dict.fromkeys("MN", "5"),
+    "R": "6",
+}
+
+
+def soundex(value: str) -> str:
+    """American Soundex code (e.g. ``ROBERT`` -> ``R163``); empty for empty input."""
+    letters = [ch for ch in value.upper() if "A" <= ch <= "Z"]
+    if not letters:
+        return ""
+    code = letters[0]
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for ch in letters[1:]:
+        digit = _SOUNDEX_CODES.get(ch, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if ch not in "HW":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def employer_tokens(employer: str | None) -> frozenset[str]:
+    """Significant words of an employer name (placeholders and legal suffixes removed)."""
+    return frozenset(
+        token
+        for token in _normalize(employer).split()
+        if len(token) > 1 and token not in _EMPLOYER_STOPWORDS
+    )
+
+
+class ContributorIdentity:
+    """One distinct normalized contributor, with the source records that share it."""
+
+    __slots__ = (
+        "name",
+        "first",
+        "last",
+        "city",
+        "state",
+        "zip",
+        "employer",
+        "occupation",
+        "entity_type",
+        "phonetic",
+        "tokens",
+        "sources",
+        "contributor_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        first: str,
+        last: str,
+        city: str | None,
+        state: str | None,
+        zip5: str | None,
+        employer: str | None,
+        occupation: str | None,
+        entity_type: str | None,
+        contributor_id: int | None = None,
+    ) -> None:
+        self.name = name
+        self.first = first
+        self.last = last
+        self.city = _normalize(city) or None
+        self.state = state.upper() if state else None
+        self.zip = zip5
+        self.employer = employer
+        self.occupation = occupation
+        self.entity_type = entity_type
+        self.phonetic = soundex(last)
+        self.tokens = employer_tokens(employer)
+        # (source_system, source_key) pairs; empty for existing gold contributors
+        self.sources: list[tuple[str, str]] = []
+        self.contributor_id = contributor_id
+
+    @property
+    def is_individual(self) -> bool:
+        return self.entity_type in (None, "INDIVIDUAL")
+
+    def signature(self) -> tuple[Any, ...]:
+        return (
+            self.is_individual,
+            self.first,
+            self.last,
+            self.zip,
+            self.city,
+            self.state,
+            self.tokens,
+        )
+
+    def blocking_keys(self) -> Iterator[str]:
+        if not self.last:
+            return
+        if self.zip:
+            yield f"lz:{self.last}:{self.zip}"
+        yield f"ph:{self.phonetic}:{self.first[:1]}:{self.state or ''}"
+        for token in self.tokens:
+            yield f"em:{token}:{self.phonetic}"
+
+
+def _compatible_first(a: str, b: str) -> bool:
+    return a.startswith(b) or b.startswith(a)
+
+
+def first_names_conflict(a: frozenset[str], b: frozenset[str]) -> bool:
+    """Whether two clusters' full first names rule out a merge (``JOHN`` vs ``JANE``)."""
+    return any(not _compatible_first(x, y) for x in a for y in b)
+
+
+def score(a: ContributorIdentity, b: ContributorIdentity) -> float:
+    """Similarity of two identities in ``[0, 1]``; 0 means definitely different.
+
+    Weights: last name 0.3 (0.2 for a Soundex-only match), first name 0.3
+    (0.15 when one is an initial or prefix of the other), ZIP 0.25 (0.15 for
+    the same city and state), employer token overlap up to 0.15. Conflicting
+    first names or states rule a match out.
+    """
+    if a.is_individual != b.is_individual:
+        return 0.0
+    if a.last == b.last:
+        total = 0.3
+    elif a.phonetic and a.phonetic == b.phonetic and a.is_individual:
+        total = 0.2
+    else:
+        return 0.0
+
+    if a.is_individual:
+        if a.first and b.first:
+            if a.first == b.first:
+                total += 0.3
+            elif _compatible_first(a.first, b.first):
+                total += 0.15
+            else:
+                return 0.0
+        else:
+            total += 0.1
+    else:
+        total += 0.3  # Organization names were compared whole above
+
+    if a.state and b.state and a.state != b.state:
+        return 0.0
+    if a.zip and a.zip == b.zip:
+        total += 0.25
+    elif a.city and a.city == b.city and a.state:
+        total += 0.15
+
+    if a.tokens and b.tokens:
+        total += 0.15 * len(a.tokens & b.tokens) / len(a.tokens | b.tokens)
+    return round(min(total, 1.0), 2)
+
+
+class UnionFind:
+    """Disjoint sets over ``0..n-1`` with path halving and union by size.
+
+    Sets may carry an *anchor* (an existing gold contributor); two anchored
+    sets are never merged.
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        self.parent = list(range(size))
+        self.size = [1] * size
+        self.anchor: dict[int, int] = {}
+
+    def add(self, anchor: int | None = None) -> int:
+        index = len(self.parent)
+        self.parent.append(index)
+        self.size.append(1)
+        if anchor is not None:
+            self.anchor[index] = anchor
+        return index
+
+    def find(self, index: int) -> int:
+        parent = self.parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(self, a: int, b: int) -> bool:
+        """Join the sets of ``a`` and ``b``; False if already joined or both anchored."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if root_a in self.anchor and root_b in self.anchor:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        if root_b in self.anchor:
+            self.anchor[root_a] = self.anchor.pop(root_b)
+        return True
+
+
+@dataclass
+class DedupResult:
+    """Counts from a deduplication run."""
+
+    source_rows: int = 0
+    identities: int = 0
+    pairs_scored: int = 0
+    oversized_blocks: int = 0
+    contributors_created: int = 0
+    matched_existing: int = 0
+
+
+def _fec_identities(
+    session: Session, unmapped_only: bool
+) -> Iterator[tuple[str, ContributorIdentity]]:
+    silver = SilverFECContribution
+    query = select(
+        silver.source_sub_id,
+        silver.contributor_name,
+        silver.contributor_first_name,
+        silver.contributor_last_name,
+        silver.contributor_city,
+        silver.contributor_state,
+        silver.contributor_zip,
+        silver.contributor_employer,
+        silver.contributor_occupation,
+        silver.entity_type,
+    )
+    if unmapped_only:
+        query = query.outerjoin(
+            GoldContributorSource,
+            and_(
+                GoldContributorSource.source_system == FEC_SOURCE,
+                GoldContributorSource.source_key == silver.source_sub_id,
+            ),
+        ).where(GoldContributorSource.id.is_(None))
+    for row in session.execute(query.execution_options(yield_per=_YIELD_PER)):
+        entity_type = _FEC_ENTITY_TYPES.get((row.entity_type or "IND").upper(), "ORG")
+        if entity_type == "INDIVIDUAL":
+            first, last = split_name(
+                row.contributor_name, row.contributor_first_name, row.contributor_last_name
+            )
+        else:
+            first, last = "", _normalize(row.contributor_name)
+        yield (
+            row.source_sub_id,
+            ContributorIdentity(
+                row.contributor_name,
+                first,
+                last,
+                row.contributor_city,
+                row.contributor_state,
+                row.contributor_zip,
+                row.contributor_employer,
+                row.contributor_occupation,
+                entity_type,
+            ),
+        )
+
+
+def _maryland_identities(
+    session: Session, unmapped_only: bool
+) -> Iterator[tuple[str, ContributorIdentity]]:
+    silver = SilverMarylandContribution
+    query = select(
+        silver.source_content_hash,
+        silver.contributor_name,
+        silver.contributor_type,
+        silver.contributor_city,
+        silver.contributor_state,
+        silver.contributor_zip,
+        silver.employer_name,
+        silver.employer_occupation,
+    )
+    if unmapped_only:
+        query = query.outerjoin(
+            GoldContributorSource,
+            and_(
+                GoldContributorSource.source_system == MARYLAND_SOURCE,
+                GoldContributorSource.source_key == silver.source_content_hash,
+            ),
+        ).where(GoldContributorSource.id.is_(None))
+    for row in session.execute(query.execution_options(yield_per=_YIELD_PER)):
+        entity_type = _MARYLAND_ENTITY_TYPES.get((row.contributor_type or "").upper(), "ORG")
+        if entity_type == "INDIVIDUAL":
+            first, last = split_name(row.contributor_name)
+        else:
+            first, last = "", _normalize(row.contributor_name)
+        yield (
+            row.source_content_hash,
+            ContributorIdentity(
+                row.contributor_name,
+                first,
+                last,
+                row.contributor_city,
+                row.contributor_state,
+                row.contributor_zip[:5] if row.contributor_zip else None,
+                row.employer_name,
+                row.employer_occupation,
+                entity_type,
+            ),
+        )
+
+
+def _existing_identities(
+    session: Session, new: list[ContributorIdentity]
+) -> Iterator[ContributorIdentity]:
+    """Existing contributors that can share a blocking key with ``new`` identities.
+
+    Individuals are found by last name (stored title-cased), organizations by
+    name or ZIP. A record that only matches an existing contributor through
+    Soundex or employer tokens with a different last name starts a new
+    cluster.
+    """
+    gold = GoldContributor
+    individual = or_(gold.entity_type.is_(None), gold.entity_type == "INDIVIDUAL")
+    last_names = sorted({i.last.title() for i in new if i.is_individual and i.last})
+    org_names = sorted({i.name.strip() for i in new if not i.is_individual})
+    org_zips = sorted({i.zip for i in new if not i.is_individual and i.zip})
+    conditions = [
+        *(
+            and_(individual, gold.last_name.in_(batch))
+            for batch in batched(last_names, _WRITE_BATCH)
+        ),
+        *(and_(~individual, gold.name.in_(batch)) for batch in batched(org_names, _WRITE_BATCH)),
+        *(and_(~individual, gold.zip.in_(batch)) for batch in batched(org_zips, _WRITE_BATCH)),
+    ]
+    seen: set[int] = set()
+    for condition in conditions:
+        query = select(
+            gold.id,
+            gold.name,
+            gold.first_name,
+            gold.last_name,
+            gold.city,
+            gold.state,
+            gold.zip,
+            gold.employer,
+            gold.occupation,
+            gold.entity_type,
+        ).where(condition)
+        for row in session.execute(query.execution_options(yield_per=_YIELD_PER)):
+            if row.id in seen:
+                continue
+            seen.add(row.id)
+            is_individual = row.entity_type in (None, "INDIVIDUAL")
+            yield ContributorIdentity(
+                row.name,
+                _normalize(row.first_name) if is_individual else "",
+                _normalize(row.last_name) if is_individual else _normalize(row.name),
+                row.city,
+                row.state,
+                row.zip,
+                row.employer,
+                row.occupation,
+                row.entity_type,
+                contributor_id=row.id,
+            )
+
+
+def _collapse(
+    records: Iterable[tuple[str, tuple[str, ContributorIdentity]]],
+) -> tuple[list[ContributorIdentity], int]:
+    identities: dict[tuple[Any, ...], ContributorIdentity] = {}
+    count = 0
+    for source_system, (source_key, identity) in records:
+        key = identity.signature()
+        existing = identities.get(key)
+        if existing is None:
+            identities[key] = existing = identity
+        existing.sources.append((source_system, source_key))
+        count += 1
+    return list(identities.values()), count
+
+
+def _tagged(source_system: str, records: Iterable[Any]) -> Iterator[tuple[str, Any]]:
+    for record in records:
+        yield source_system, record
+
+
+def _display_name(identity: ContributorIdentity) -> tuple[str, str | None, str | None]:
+    if not identity.is_individual:
+        return identity.name.strip(), None, None
+    return (
+        identity.name.strip(),
+        identity.first.title() or None,
+        identity.last.title() or None,
+    )
+
+
+def deduplicate_contributors(
+    session: Session,
+    rebuild: bool = False,
+    threshold: float = DEFAULT_THRESHOLD,
+    max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+) -> DedupResult:
+    """Cluster silver contributors into ``GoldContributor`` rows.
+
+    Args:
+        session: Session to read and write with. The caller commits.
+        rebuild: Delete all contributors and mappings and cluster every
+            silver record again. Gold contributions must be rebuilt
+            afterwards, since contributor ids change.
+        threshold: Minimum :func:`score` for two identities to be the same
+            contributor.
+        max_block_size: Blocks larger than this are too unselective to score
+            and are skipped (their members can still match via other keys).
+
+    Returns:
+        Counts for the run.
+    """
+    if rebuild:
+        session.execute(delete(GoldContributorSource))
+        session.execute(delete(GoldContributor))
+    unmapped_only = not rebuild
+
+    new, source_rows = _collapse(
+        chain(
+            _tagged(FEC_SOURCE, _fec_identities(session, unmapped_only)),
+            _tagged(MARYLAND_SOURCE, _maryland_identities(session, unmapped_only)),
+        )
+    )
+    result = DedupResult(source_rows=source_rows, identities=len(new))
+    if not new:
+        return result
+
+    existing = list(_existing_identities(session, new)) if unmapped_only else []
+    identities = existing + new
+    sets = UnionFind()
+    for identity in identities:
+        sets.add(identity.contributor_id)
+
+    blocks: defaultdict[str, list[int]] = defaultdict(list)
+    for index, identity in enumerate(identities):
+        for key in identity.blocking_keys():
+            blocks[key].append(index)
+
+    # Lowest accepted edge score and full first names per set root, carried through unions
+    confidence: dict[int, float] = {}
+    first_names = {
+        index: frozenset([identity.first])
+        for index, identity in enumerate(identities)
+        if identity.is_individual and len(identity.first) > 1
+    }
+    joined_by: dict[int, float] = {}
+    first_new = len(existing)
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        if len(members) > max_block_size:
+            result.oversized_blocks += 1
+            continue
+        if members[-1] < first_new:
+            continue  # Only existing contributors; they are never merged
+        for a, b in combinations(members, 2):
+            if b < first_new:
+                continue
+            root_a, root_b = sets.find(a), sets.find(b)
+            if root_a == root_b or (root_a in sets.anchor and root_b in sets.anchor):
+                continue
+            names_a, names_b = (
+                first_names.get(root_a, frozenset()),
+                first_names.get(root_b, frozenset()),
+            )
+            if first_names_conflict(names_a, names_b):
+                continue
+            result.pairs_scored += 1
+            pair_score = score(identities[a], identities[b])
+            if pair_score < threshold:
+                continue
+            low = min(
+                pair_score,
+                confidence.pop(root_a, 1.0),
+                confidence.pop(root_b, 1.0),
+            )
+            sets.union(a, b)
+            root = sets.find(a)
+            confidence[root] = low
+            first_names.pop(root_a, None)
+            first_names.pop(root_b, None)
+            if names_a or names_b:
+                first_names[root] = names_a | names_b
+            joined_by.setdefault(b, pair_score)
+            if a >= first_new:
+                joined_by.setdefault(a, pair_score)
+    if result.oversized_blocks:
+        logger.info("Skipped %d blocks larger than %d", result.oversized_blocks, max_block_size)
+
+    clusters: defaultdict[int, list[int]] = defaultdict(list)
+    for index in range(first_new, len(identities)):
+        clusters[sets.find(index)].append(index)
+
+    # Existing contributors that gained records: lower their confidence if needed
+    confidence_updates = []
+    new_clusters = []
+    for root, members in clusters.items():
+        anchor = sets.anchor.get(root)
+        if anchor is None:
+            new_clusters.append((root, members))
+            continue
+        result.matched_existing += len(members)
+        for index in members:
+            identities[index].contributor_id = anchor
+        confidence_updates.append({"id": anchor, "match_confidence": confidence.get(root, 1.0)})
+    for batch in batched(confidence_updates, _WRITE_BATCH):
+        query = select(GoldContributor.id, GoldContributor.match_confidence).where(
+            GoldContributor.id.in_([row["id"] for row in batch])
+        )
+        current = {row.id: row.match_confidence for row in session.execute(query)}
+        changed = [
+            row
+            for row in batch
+            if (old := current.get(row["id"])) is None
+            or Decimal(str(row["match_confidence"])) < old
+        ]
+        if changed:
+            session.execute(update(GoldContributor), changed)
+
+    # One GoldContributor per new cluster, represented by its most frequent identity
+    for batch in batched(new_clusters, _WRITE_BATCH):
+        rows = []
+        for root, members in batch:
+            representative = identities[
+                max(members, key=lambda index: len(identities[index].sources))
+            ]
+            name, first_name, last_name = _display_name(representative)
+            rows.append(
+                {
+                    "name": name,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "city": representative.city,
+                    "state": representative.state,
+                    "zip": representative.zip,
+                    "employer": representative.employer,
+                    "occupation": representative.occupation,
+                    "entity_type": representative.entity_type,
+                    "match_confidence": confidence.get(root, 1.0),
+                }
+            )
+        created = session.scalars(
+            insert(GoldContributor).returning(GoldContributor.id, sort_by_parameter_order=True),
+            rows,
+        ).all()
+        for (_, members), contributor_id in zip(batch, created, strict=True):
+            for index in members:
+                identities[index].contributor_id = contributor_id
+        result.contributors_created += len(created)
+
+    def mappings() -> Iterator[dict[str, Any]]:
+        for index in range(first_new, len(identities)):
+            identity = identities[index]
+            match_confidence = joined_by.get(index, 1.0)
+            for source_system, source_key in identity.sources:
+                yield {
+                    "source_system": source_system,
+                    "source_key": source_key,
+                    "contributor_id": identity.contributor_id,
+                    "match_confidence": match_confidence,
+                }
+
+    bulk_upsert(session, GoldContributorSource, mappings(), ("source_system", "source_key"))
+    return result
@@ -0,0 +1,184 @@
+"""Set-based earmark pairing for ``GoldContribution``.
+
+An earmarked FEC contribution appears twice: the 15E receipt record and the
+earmark record, whose ``source_transaction_id`` is the receipt's with an
+``E`` appended. The receipt must be excluded from statistics, so it is
+flagged ``is_earmark_receipt``. Only receipts whose ``contribution_type`` is
+``EARMARKED`` are paired, so a direct contribution whose transaction id merely
+happens to have an ``E``-suffixed twin is never dropped from the totals.
+
+:func:`resolve_earmarks` pairs a whole cycle at once with a self-join on
+``(recipient_committee_id, source_transaction_id)``, which PostgreSQL runs as
+a single hash join, instead of looking up partners row by row. The pairs are
+written once to a temporary table, and the results are applied with a few
+``UPDATE ... FROM`` statements that only touch rows whose values change, so
+re-running a cycle is cheap and idempotent.
+``conduit_committee_id`` is resolved from the receipt's bronze ``other_id``
+(the conduit's FEC committee id, e.g. ActBlue) and set on both records.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    Integer,
+    MetaData,
+    Select,
+    Table,
+    and_,
+    exists,
+    func,
+    select,
+    text,
+    union,
+    update,
+)
+from sqlalchemy.orm import Session, aliased
+
+from fund_lens_models.bronze.fec import BronzeFECScheduleA
+from fund_lens_models.enums import ContributionType
+from fund_lens_models.gold.models import GoldCommittee, GoldContribution
+
+EARMARK_SUFFIX = "E"
+
+
+@dataclass
+class EarmarkResult:
+    """Counts from resolving one cycle's earmarks."""
+
+    pairs: int = 0
+    receipts_flagged: int = 0
+    receipts_unflagged: int = 0
+    conduits_set: int = 0
+    unmatched_earmarks: int = 0
+
+
+def earmark_pairs(cycle: int, source_system: str = "FEC") -> Select[tuple[int, int]]:
+    """Select ``(receipt_id, earmark_id)`` for every earmark pair in a cycle."""
+    receipt = aliased(GoldContribution, name="receipt")
+    earmark = aliased(GoldContribution, name="earmark")
+    return (
+        select(receipt.id.label("receipt_id"), earmark.id.label("earmark_id"))
+        .join(
+            earmark,
+            and_(
+                earmark.recipient_committee_id == receipt.recipient_committee_id,
+                earmark.source_system == receipt.source_system,
+                earmark.election_cycle == receipt.election_cycle,
+                earmark.source_transaction_id == receipt.source_transaction_id + EARMARK_SUFFIX,
+            ),
+        )
+        .where(
+            receipt.election_cycle == cycle,
+            receipt.source_system == source_system,
+            receipt.contribution_type == ContributionType.EARMARKED,
+        )
+    )
+
+
+def _pairs_table() -> Table:
+    return Table(
+        "tmp_earmark_pairs",
+        MetaData(),
+        Column("receipt_id", Integer, nullable=False, index=True),
+        Column("earmark_id", Integer, nullable=False, index=True),
+        prefixes=["TEMPORARY"],
+    )
+
+
+def resolve_earmarks(
+    bind: Session | Connection, cycle: int, source_system: str = "FEC"
+) -> EarmarkResult:
+    """Pair earmarks for one election cycle and update the gold flags.
+
+    The pairing join runs once, into a temporary table that the following
+    updates and counts read from.
+
+    Args:
+        bind: Session or Connection to execute on. The caller owns the transaction.
+        cycle: Election cycle to resolve.
+        source_system: Source whose records are paired.
+
+    Returns:
+        Pair count, rows whose flag or conduit changed, and earmark records
+        (transaction id ending in ``E``) left without a receipt.
+    """
+    conn = bind.connection() if isinstance(bind, Session) else bind
+    pairs = _pairs_table()
+    pairs.create(conn)
+    try:
+        pair_query = earmark_pairs(cycle, source_system)
+        conn.execute(pairs.insert().from_select(["receipt_id", "earmark_id"], pair_query))
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(f"ANALYZE {pairs.name}"))
+        return _apply(conn, pairs, cycle, source_system)
+    finally:
+        pairs.drop(conn)
+
+
+def _apply(conn: Connection, pairs: Table, cycle: int, source_system: str) -> EarmarkResult:
+    gold: Table = GoldContribution.__table__  # type: ignore[assignment]
+    in_cycle = and_(gold.c.election_cycle == cycle, gold.c.source_system == source_system)
+    result = EarmarkResult()
+    result.pairs = conn.execute(select(func.count()).select_from(pairs)).scalar_one()
+
+    flagged = conn.execute(
+        update(gold)
+        .where(gold.c.id == pairs.c.receipt_id, gold.c.is_earmark_receipt.is_(False))
+        .values(is_earmark_receipt=True)
+    )
+    result.receipts_flagged = flagged.rowcount
+
+    # Receipts whose earmark disappeared (e.g. after an amendment) are counted again
+    unflagged = conn.execute(
+        update(gold)
+        .where(
+            in_cycle,
+            gold.c.is_earmark_receipt.is_(True),
+            ~exists().where(pairs.c.receipt_id == gold.c.id),
+        )
+        .values(is_earmark_receipt=False)
+    )
+    result.receipts_unflagged = unflagged.rowcount
+
+    receipt = gold.alias("receipt")
+    bronze = BronzeFECScheduleA.__table__
+    committee = GoldCommittee.__table__
+    conduit_of_receipt = (
+        select(pairs.c.receipt_id, pairs.c.earmark_id, committee.c.id.label("conduit_id"))
+        .join(receipt, receipt.c.id == pairs.c.receipt_id)
+        .join(bronze, bronze.c.sub_id == receipt.c.source_sub_id)
+        .join(committee, committee.c.fec_committee_id == bronze.c.other_id)
+        .subquery("conduit_of_receipt")
+    )
+    conduits = union(
+        select(
+            conduit_of_receipt.c.receipt_id.label("contribution_id"),
+            conduit_of_receipt.c.conduit_id,
+        ),
+        select(
+            conduit_of_receipt.c.earmark_id.label("contribution_id"),
+            conduit_of_receipt.c.conduit_id,
+        ),
+    ).subquery("conduits")
+    updated = conn.execute(
+        update(gold)
+        .where(
+            gold.c.id == conduits.c.contribution_id,
+            gold.c.conduit_committee_id.is_distinct_from(conduits.c.conduit_id),
+        )
+        .values(conduit_committee_id=conduits.c.conduit_id)
+    )
+    result.conduits_set = updated.rowcount
+
+    result.unmatched_earmarks = conn.execute(
+        select(func.count())
+        .select_from(gold)
+        .where(
+            in_cycle,
+            gold.c.source_transaction_id.like(f"%{EARMARK_SUFFIX}"),
+            ~exists().where(pairs.c.earmark_id == gold.c.id),
+        )
+    ).scalar_one()
+    return result
@@ -1,18 +1,42 @@
 """Gold layer models - unified cross-source analytical models."""
 
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, Date, Integer, Numeric, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from fund_lens_models.base import Base, TimestampMixin
+from fund_lens_models.dimensions import CodedEnum
+from fund_lens_models.enums import (
+    CandidateOffice,
+    CommitteeType,
+    ContributionType,
+    ElectionType,
+    JurisdictionLevel,
+    Party,
+    SourceSystem,
+)
 
 
 class GoldContributor(Base, TimestampMixin):
     """Unified contributor entity across all sources."""
 
     __tablename__ = "gold_contributor"
+    # updated_at: contributors whose state changed since the daily rollup's watermark
+    __table_args__ = (Index("ix_gold_contributor_updated_at", "updated_at"),)
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -20,12 +44,12 @@ class GoldContributor(Base, TimestampMixin):
     # Contributor identity (deduplicated)
     name: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     first_name: Mapped[str | None] = mapped_column(String(255))
-    last_name: Mapped[str | None] = mapped_column(String(255))
+    last_name: Mapped[str | None] = mapped_column(String(255), index=True)
 
     # Location
     city: Mapped[str | None] = mapped_column(String(255), index=True)
     state: Mapped[str | None] = mapped_column(String(2), index=True)
-    zip: Mapped[str | None] = mapped_column(String(5))
+    zip: Mapped[str | None] = mapped_column(String(5), index=True)
 
     # Employment
     employer: Mapped[str | None] = mapped_column(String(500), index=True)
@@ -43,6 +67,40 @@ class GoldContributor(Base, TimestampMixin):
         return f"<GoldContributor(id={self.id}, name={self.name})>"
 
 
+class GoldContributorSource(Base, TimestampMixin):
+    """Maps each silver contribution record to its deduplicated gold contributor."""
+
+    __tablename__ = "gold_contributor_source"
+    __table_args__ = (
+        UniqueConstraint("source_system", "source_key", name="uq_contributor_source"),
+    )
+
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Source record
+    source_system: Mapped[str] = mapped_column(
+        CodedEnum(SourceSystem), ForeignKey("dim_source_system.code"), nullable=False
+    )
+    source_key: Mapped[str] = mapped_column(
+        String(255), nullable=False
+    )  # Silver source_sub_id (FEC) or source_content_hash (MD)
+
+    # Matched contributor
+    contributor_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    match_confidence: Mapped[float | None] = mapped_column(
+        Numeric(3, 2)
+    )  # Score of the first pair that matched this record; 1.0 if it matched none
+
+    def __repr__(self) -> str:
+        return (
+            f"<GoldContributorSource("
+            f"source={self.source_system}:{self.source_key}, "
+            f"contributor_id={self.contributor_id}"
+            f")>"
+        )
+
+
 class GoldCandidate(Base, TimestampMixin):
     """Unified candidate entity across all sources."""
 
@@ -54,7 +112,7 @@ class GoldCandidate(Base, TimestampMixin):
     # Candidate identity
     name: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     office: Mapped[str] = mapped_column(
-        String(20), nullable=False, index=True
+        CodedEnum(CandidateOffice), ForeignKey("dim_office.code"), nullable=False, index=True
     )  # US_HOUSE, US_SENATE, STATE_HOUSE, STATE_SENATE, GOVERNOR, COUNTY_EXEC, etc.
     office_raw: Mapped[str | None] = mapped_column(
         String(200)
@@ -65,7 +123,9 @@ class GoldCandidate(Base, TimestampMixin):
     # Jurisdiction level - for easy filtering by level of government
     # FEDERAL (US House, US Senate, President), STATE (Governor, State Legislature, etc),
     # COUNTY (County Council, Sheriff, etc), CITY (Baltimore City offices)
-    jurisdiction_level: Mapped[str | None] = mapped_column(String(20), index=True)
+    jurisdiction_level: Mapped[str | None] = mapped_column(
+        CodedEnum(JurisdictionLevel), ForeignKey("dim_jurisdiction_level.code"), index=True
+    )
 
     # Office location for local candidates (where the office is, not candidate address)
     office_county: Mapped[str | None] = mapped_column(
@@ -76,7 +136,9 @@ class GoldCandidate(Base, TimestampMixin):
     )  # For CITY jurisdiction candidates only (e.g., Baltimore)
 
     # Political affiliation
-    party: Mapped[str | None] = mapped_column(String(50), index=True)
+    party: Mapped[str | None] = mapped_column(
+        CodedEnum(Party), ForeignKey("dim_party.code"), index=True
+    )
 
     # Election history tracking
     # For FEC: from election_years field; For MD: from bronze election_year values
@@ -109,11 +171,13 @@ class GoldCommittee(Base, TimestampMixin):
     # Committee identity (name can be NULL in rare cases)
     name: Mapped[str | None] = mapped_column(String(500), index=True)
     committee_type: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
+        CodedEnum(CommitteeType), ForeignKey("dim_committee_type.code"), nullable=False, index=True
     )  # CANDIDATE, PAC, PARTY, SUPER_PAC, etc.
 
     # Political affiliation (NEW)
-    party: Mapped[str | None] = mapped_column(String(50), index=True)
+    party: Mapped[str | None] = mapped_column(
+        CodedEnum(Party), ForeignKey("dim_party.code"), index=True
+    )
 
     # Location
     state: Mapped[str | None] = mapped_column(String(2), index=True)
@@ -139,8 +203,50 @@ class GoldContribution(Base, TimestampMixin):
     """Unified contribution record across all sources."""
 
     __tablename__ = "gold_contribution"
+    # Indexes follow the query workload rather than one per filter column:
+    # - stats exclude earmark receipts, so recipient lookups use partial indexes
+    #   covering amount/contributor_id for index-only aggregation on PostgreSQL
+    # - listings seek on (date, id) for keyset pagination
+    # - cycle-wide stages (earmark pairing, Parquet export) filter on
+    #   (election_cycle, source_system); unpartitioned tables need an index for it
+    # - uq_source_transaction already leads with source_system; other
+    #   low-cardinality columns (is_earmark_receipt, contribution_type,
+    #   election_year) get no index of their own
     __table_args__ = (
         UniqueConstraint("source_system", "source_sub_id", name="uq_source_transaction"),
+        Index(
+            "ix_gold_contribution_candidate_cycle",
+            "recipient_candidate_id",
+            "election_cycle",
+            postgresql_where=text("NOT is_earmark_receipt"),
+            postgresql_include=["amount", "contributor_id"],
+            sqlite_where=text("is_earmark_receipt = 0"),
+        ),
+        Index(
+            "ix_gold_contribution_committee_cycle",
+            "recipient_committee_id",
+            "election_cycle",
+            postgresql_where=text("NOT is_earmark_receipt"),
+            postgresql_include=["amount", "contributor_id"],
+            sqlite_where=text("is_earmark_receipt = 0"),
+        ),
+        Index("ix_gold_contribution_committee_date", "recipient_committee_id", "contribution_date"),
+        Index("ix_gold_contribution_contributor_date", "contributor_id", "contribution_date"),
+        Index("ix_gold_contribution_date_id", "contribution_date", "id"),
+        Index("ix_gold_contribution_cycle_source", "election_cycle", "source_system"),
+        Index(
+            "ix_gold_contribution_committee_transaction",
+            "recipient_committee_id",
+            "source_transaction_id",
+        ),
+        Index(
+            "ix_gold_contribution_conduit_cycle",
+            "conduit_committee_id",
+            "election_cycle",
+            postgresql_where=text("conduit_committee_id IS NOT NULL"),
+            sqlite_where=text("conduit_committee_id IS NOT NULL"),
+        ),
+        Index("ix_gold_contribution_updated_at", "updated_at"),
     )
 
     # Primary key
@@ -148,39 +254,41 @@ class GoldContribution(Base, TimestampMixin):
 
     # Source tracking
     source_system: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
+        CodedEnum(SourceSystem), ForeignKey("dim_source_system.code"), nullable=False
     )  # FEC, MD_STATE, VA_STATE, etc.
     source_sub_id: Mapped[str] = mapped_column(
         String(255), nullable=False
     )  # Unique record ID (FEC sub_id)
     source_transaction_id: Mapped[str | None] = mapped_column(
-        String(255), index=True
+        String(255)
     )  # Links related records (e.g., earmark pairs) - nullable for API data without transaction_id
 
     # Contribution details
-    contribution_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    contribution_date: Mapped[date] = mapped_column(Date, nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
 
     # Relationships (foreign keys to gold entities)
-    contributor_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
-    recipient_committee_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
-    recipient_candidate_id: Mapped[int | None] = mapped_column(Integer, index=True)
+    contributor_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    recipient_committee_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    recipient_candidate_id: Mapped[int | None] = mapped_column(Integer)
 
     # Earmark tracking - for contributions made via a conduit (ActBlue, WinRed, etc.)
-    conduit_committee_id: Mapped[int | None] = mapped_column(Integer, index=True)
+    conduit_committee_id: Mapped[int | None] = mapped_column(Integer)
     is_earmark_receipt: Mapped[bool] = mapped_column(
-        Boolean, nullable=False, default=False, index=True
+        Boolean, nullable=False, default=False
     )  # True for 15E records that have a matching earmark - should be excluded from stats
 
     # Transaction classification
     contribution_type: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
+        CodedEnum(ContributionType), ForeignKey("dim_contribution_type.code"), nullable=False
     )  # DIRECT, EARMARKED, IN_KIND, etc.
-    election_type: Mapped[str | None] = mapped_column(String(20))  # PRIMARY, GENERAL, SPECIAL, etc.
+    election_type: Mapped[str | None] = mapped_column(
+        CodedEnum(ElectionType), ForeignKey("dim_election_type.code")
+    )  # PRIMARY, GENERAL, SPECIAL, etc.
 
     # Election context
-    election_year: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
-    election_cycle: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    election_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    election_cycle: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Additional context
     memo_text: Mapped[str | None] = mapped_column(Text)
@@ -189,3 +297,131 @@ class GoldContribution(Base, TimestampMixin):
         return (
             f"<GoldContribution(id={self.id}, amount={self.amount}, date={self.contribution_date})>"
         )
+
+
+class GoldCandidateCycleTotal(Base, TimestampMixin):
+    """Precomputed fundraising totals per candidate and election cycle.
+
+    Maintained by ``fund_lens_models.gold.aggregates``; earmark receipts are excluded.
+    """
+
+    __tablename__ = "gold_candidate_cycle_total"
+
+    # Primary key
+    candidate_id: Mapped[int] = mapped_column(Integer, primary_key=True)  # GoldCandidate.id
+    election_cycle: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Totals
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    contribution_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unique_contributors: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Small-dollar (<= $200, the FEC itemization threshold) vs large-dollar split
+    small_dollar_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    small_dollar_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    large_dollar_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    large_dollar_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GoldCandidateCycleTotal("
+            f"candidate_id={self.candidate_id}, "
+            f"cycle={self.election_cycle}, "
+            f"total={self.total_amount}"
+            f")>"
+        )
+
+
+class GoldCommitteeCycleTotal(Base, TimestampMixin):
+    """Precomputed fundraising totals per recipient committee and election cycle.
+
+    Maintained by ``fund_lens_models.gold.aggregates``; earmark receipts are excluded.
+    """
+
+    __tablename__ = "gold_committee_cycle_total"
+
+    # Primary key
+    committee_id: Mapped[int] = mapped_column(Integer, primary_key=True)  # GoldCommittee.id
+    election_cycle: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Totals
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    contribution_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unique_contributors: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Small-dollar (<= $200, the FEC itemization threshold) vs large-dollar split
+    small_dollar_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    small_dollar_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    large_dollar_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    large_dollar_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GoldCommitteeCycleTotal("
+            f"committee_id={self.committee_id}, "
+            f"cycle={self.election_cycle}, "
+            f"total={self.total_amount}"
+            f")>"
+        )
+
+
+class GoldDailyContributionRollup(Base, TimestampMixin):
+    """Daily contribution totals by recipient committee, contributor state and type.
+
+    Pre-aggregated for time-series and map queries; maintained by
+    ``fund_lens_models.gold.aggregates``. Earmark receipts are excluded.
+    """
+
+    __tablename__ = "gold_daily_contribution_rollup"
+    __table_args__ = (
+        Index("ix_gold_daily_rollup_committee_date", "recipient_committee_id", "contribution_date"),
+        Index("ix_gold_daily_rollup_state_date", "contributor_state", "contribution_date"),
+    )
+
+    # Primary key (bucket)
+    contribution_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    recipient_committee_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    contributor_state: Mapped[str] = mapped_column(
+        String(2), primary_key=True
+    )  # '' when the contributor's state is unknown
+    contribution_type: Mapped[str] = mapped_column(
+        CodedEnum(ContributionType), ForeignKey("dim_contribution_type.code"), primary_key=True
+    )
+
+    # Totals
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    contribution_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GoldDailyContributionRollup("
+            f"date={self.contribution_date}, "
+            f"committee_id={self.recipient_committee_id}, "
+            f"state={self.contributor_state}, "
+            f"total={self.total_amount}"
+            f")>"
+        )
+
+
+class GoldAggregateWatermark(Base, TimestampMixin):
+    """
+    High-water mark for an incremental gold aggregate refresh.
+
+    Records the latest ``updated_at`` an aggregate has been refreshed through,
+    so the next refresh only recomputes what changed after it.
+    """
+
+    __tablename__ = "gold_aggregate_watermark"
+
+    # Aggregate table name, e.g. 'gold_daily_contribution_rollup'
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    last_change_timestamp: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    # Running total of groups or rows written
+    rows_processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GoldAggregateWatermark(name={self.name}, last_change={self.last_change_timestamp})>"
+        )
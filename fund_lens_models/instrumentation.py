@@ -0,0 +1,373 @@
+"""Opt-in per-statement query metrics and slow-query logging.
+
+:class:`QueryInstrumentation` listens to ``before_cursor_execute`` and
+``after_cursor_execute`` on an engine and aggregates, per normalized
+statement (literals, bind-parameter styles and ``IN``/``VALUES`` lists
+collapsed), the call count, total and max latency, a latency histogram,
+rows affected and the tables and models touched. Statements slower than
+``slow_query_threshold`` are logged with their ``EXPLAIN`` plan.
+
+The per-call cost is two ``perf_counter()`` calls, a cached dict lookup and
+a short locked update; normalization and table parsing are memoized per
+distinct SQL string, EXPLAIN runs at most once per statement per
+``explain_interval``, and the number of tracked statements is capped, so it
+can stay on in production.
+
+Enable it for registered engines with ``EngineOptions(instrument_queries=True)``
+(which attaches the shared :data:`query_metrics`), or call
+:meth:`QueryInstrumentation.attach` on any engine.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from fund_lens_models.base import Base
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_THRESHOLD = 0.5  # Seconds
+DEFAULT_EXPLAIN_INTERVAL = 300.0  # Seconds between EXPLAINs of the same statement
+DEFAULT_MAX_STATEMENTS = 500
+
+# Histogram upper bounds in seconds (Prometheus-style, +Inf implied)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Statements beyond max_statements are folded into this entry
+OTHER_STATEMENT = "<other>"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_ROWS = re.compile(r"(\(\?\.\.\.\))(?:\s*,\s*\(\?\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+_TABLE_REFERENCE = re.compile(
+    r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+(?:ONLY\s+)?\"?(\w+)\"?(?:\.\"?(\w+)\"?)?",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
+def normalize_statement(statement: str) -> str:
+    """Collapse a SQL string to a stable shape for grouping.
+
+    Literals and every bind-parameter style become ``?``, and runs of
+    parameters, such as expanded ``IN`` lists or multi-row ``VALUES``, become
+    ``(?...)``, so batches of different sizes group together.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _PARAMETER_LIST.sub("(?...)", normalized)
+    return _VALUES_ROWS.sub(r"\1", normalized)
+
+
+@lru_cache(maxsize=4096)
+def statement_tables(normalized: str) -> tuple[str, ...]:
+    """Table names referenced after FROM/JOIN/INTO/UPDATE, in first-seen order."""
+    names = []
+    for first, second in _TABLE_REFERENCE.findall(normalized):
+        # "schema.table" captures both parts; a bare name only the first
+        name = second or first
+        if name.upper() != "SELECT":
+            names.append(name)
+    return tuple(dict.fromkeys(names))
+
+
+def _models_by_table() -> dict[str, str]:
+    # Model modules load lazily, so rebuild whenever more mappers are registered
+    return _table_models(len(Base.registry.mappers))
+
+
+@lru_cache(maxsize=1)
+def _table_models(mapper_count: int) -> dict[str, str]:
+    return {
+        mapper.local_table.name: mapper.class_.__name__  # type: ignore[attr-defined]
+        for mapper in Base.registry.mappers
+    }
+
+
+def statement_id(normalized: str) -> str:
+    """Short stable identifier of a normalized statement (for metric labels)."""
+    return hashlib.sha1(normalized.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+@dataclass
+class StatementStats:
+    """Aggregated metrics for one normalized statement."""
+
+    statement: str
+    operation: str
+    tables: tuple[str, ...]
+    models: tuple[str, ...]
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    slow_calls: int = 0
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    last_plan: str | None = None
+    last_explained: float | None = None
+
+    @property
+    def id(self) -> str:
+        return statement_id(self.statement)
+
+    def as_dict(self) -> dict[str, Any]:
+        cumulative = []
+        running = 0
+        for count in self.bucket_counts:
+            running += count
+            cumulative.append(running)
+        return {
+            "id": self.id,
+            "statement": self.statement,
+            "operation": self.operation,
+            "tables": list(self.tables),
+            "models": list(self.models),
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+            "slow_calls": self.slow_calls,
+            "histogram": dict(zip((*LATENCY_BUCKETS, float("inf")), cumulative, strict=True)),
+            "last_plan": self.last_plan,
+        }
+
+
+class QueryInstrumentation:
+    """Cursor-execute listeners that aggregate statement metrics in memory."""
+
+    def __init__(
+        self,
+        slow_query_threshold: float | None = DEFAULT_SLOW_QUERY_THRESHOLD,
+        explain: bool = True,
+        explain_interval: float = DEFAULT_EXPLAIN_INTERVAL,
+        max_statements: int = DEFAULT_MAX_STATEMENTS,
+    ) -> None:
+        self.slow_query_threshold = slow_query_threshold
+        self.explain = explain
+        self.explain_interval = explain_interval
+        self.max_statements = max_statements
+        self._lock = threading.Lock()
+        self._stats: dict[str, StatementStats] = {}
+        self._engines: list[Engine] = []
+
+    def attach(self, engine: Engine) -> None:
+        """Start recording statements executed on ``engine`` (idempotent)."""
+        engine = getattr(engine, "sync_engine", engine)
+        with self._lock:
+            if any(attached is engine for attached in self._engines):
+                return
+            self._engines.append(engine)
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def detach(self, engine: Engine) -> None:
+        """Stop recording statements executed on ``engine``."""
+        engine = getattr(engine, "sync_engine", engine)
+        with self._lock:
+            if not any(attached is engine for attached in self._engines):
+                return
+            self._engines = [attached for attached in self._engines if attached is not engine]
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.remove(engine, "handle_error", self._handle_error)
+
+    def reset(self) -> None:
+        """Forget all recorded statements."""
+        with self._lock:
+            self._stats.clear()
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        context._fund_lens_query_start = time.perf_counter()
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - context._fund_lens_query_start
+        rowcount = getattr(cursor, "rowcount", -1)
+        stats = self._record(statement, elapsed, max(rowcount, 0))
+        threshold = self.slow_query_threshold
+        if threshold is not None and elapsed >= threshold:
+            self._slow_query(conn, cursor, statement, parameters, executemany, stats, elapsed)
+
+    def _handle_error(self, exception_context: Any) -> None:
+        statement = exception_context.statement
+        start = getattr(exception_context.execution_context, "_fund_lens_query_start", None)
+        if statement is None or start is None:
+            return
+        elapsed = time.perf_counter() - start
+        stats = self._record(statement, elapsed, 0)
+        with self._lock:
+            stats.errors += 1
+
+    def _stats_for(self, statement: str) -> StatementStats:
+        # Caller holds the lock
+        normalized = normalize_statement(statement)
+        stats = self._stats.get(normalized)
+        if stats is None:
+            if len(self._stats) >= self.max_statements:
+                normalized = OTHER_STATEMENT
+                stats = self._stats.get(normalized)
+            if stats is None:
+                tables = statement_tables(normalized)
+                models = _models_by_table()
+                stats = StatementStats(
+                    statement=normalized,
+                    operation=normalized.split(" ", 1)[0].upper(),
+                    tables=tables,
+                    models=tuple(models[table] for table in tables if table in models),
+                )
+                self._stats[normalized] = stats
+        return stats
+
+    def _record(self, statement: str, elapsed: float, rows: int) -> StatementStats:
+        bucket = bisect_left(LATENCY_BUCKETS, elapsed)
+        with self._lock:
+            stats = self._stats_for(statement)
+            stats.calls += 1
+            stats.rows += rows
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.bucket_counts[bucket] += 1
+        return stats
+
+    def _slow_query(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        stats: StatementStats,
+        elapsed: float,
+    ) -> None:
+        now = time.monotonic()
+        plan = None
+        with self._lock:
+            stats.slow_calls += 1
+            due = (
+                stats.last_explained is None or now - stats.last_explained >= self.explain_interval
+            )
+            if self.explain and due and not executemany and stats.operation in ("SELECT", "WITH"):
+                stats.last_explained = now
+            else:
+                due = False
+        if due:
+            plan = explain(conn, cursor, statement, parameters)
+            with self._lock:
+                stats.last_plan = plan
+        logger.warning(
+            "Slow query %s (%.3fs, tables=%s): %s%s",
+            stats.id,
+            elapsed,
+            ",".join(stats.tables),
+            stats.statement,
+            f"\n{plan}" if plan else "",
+        )
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Metrics per normalized statement, most total time first."""
+        with self._lock:
+            rows = [stats.as_dict() for stats in self._stats.values()]
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def render_prometheus(self, prefix: str = "fund_lens_db_query") -> str:
+        """Render statement metrics in the Prometheus text exposition format.
+
+        Statements are labelled by ``statement_id`` (see :meth:`snapshot` for
+        the text), operation and tables, keeping label values short.
+        """
+        snapshot = self.snapshot()
+        if not snapshot:
+            return ""
+
+        def labels(row: dict[str, Any], **extra: str) -> str:
+            pairs = {
+                "statement_id": row["id"],
+                "operation": row["operation"],
+                "tables": ",".join(row["tables"]),
+                **extra,
+            }
+            return ",".join(f'{name}="{_escape(value)}"' for name, value in pairs.items())
+
+        lines = [f"# TYPE {prefix}_duration_seconds histogram"]
+        for row in snapshot:
+            for bound, count in row["histogram"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{prefix}_duration_seconds_bucket{{{labels(row, le=le)}}} {count}")
+            lines.append(f"{prefix}_duration_seconds_sum{{{labels(row)}}} {row['total_seconds']}")
+            lines.append(f"{prefix}_duration_seconds_count{{{labels(row)}}} {row['calls']}")
+        for name in ("rows", "errors", "slow_calls"):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for row in snapshot:
+                lines.append(f"{prefix}_{name}_total{{{labels(row)}}} {row[name]}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def explain(conn: Connection, cursor: Any, statement: str, parameters: Any) -> str | None:
+    """Return the plan of ``statement`` with the same parameters, or None if it fails.
+
+    Runs on a fresh DBAPI cursor of the same connection; on PostgreSQL the
+    EXPLAIN is wrapped in a savepoint so a failure cannot abort the caller's
+    transaction.
+    """
+    dialect = conn.dialect.name
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    savepoint = dialect == "postgresql" and conn.in_transaction()
+    explain_cursor = cursor.connection.cursor()
+    try:
+        if savepoint:
+            explain_cursor.execute("SAVEPOINT fund_lens_explain")
+        try:
+            explain_cursor.execute(prefix + statement, parameters)
+            plan = "\n".join(str(row[-1]) for row in explain_cursor.fetchall())
+        except Exception:
+            if savepoint:
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT fund_lens_explain")
+            logger.debug("EXPLAIN failed", exc_info=True)
+            return None
+        finally:
+            if savepoint:
+                explain_cursor.execute("RELEASE SAVEPOINT fund_lens_explain")
+        return plan
+    finally:
+        explain_cursor.close()
+
+
+# Shared instance attached by EngineOptions(instrument_queries=True)
+query_metrics = QueryInstrumentation()
@@ -0,0 +1,176 @@
+"""Keyset (seek) pagination for listing endpoints and exports.
+
+``OFFSET`` pagination reads and discards every skipped row, so deep pages of
+a large table get linearly slower. Keyset pagination instead remembers the
+sort key of the last row returned and asks for rows after it::
+
+    WHERE (contribution_date, id) > (:last_date, :last_id)
+    ORDER BY contribution_date, id
+    LIMIT :limit
+
+With an index on the sort columns every page is an index seek, so page
+10,000 costs the same as page one. The last sort column must be unique
+(normally the primary key) so the order is total.
+
+:func:`paginate` returns one :class:`Page` with an opaque cursor token for
+the next page; :func:`iter_keyset` walks a whole result in keyset chunks for
+exports without holding one long-running cursor open.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import ColumnElement, literal, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from fund_lens_models.base import Base
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_CHUNK_SIZE = 1000
+
+
+@dataclass
+class Page(Generic[ModelT]):
+    """One page of results and the cursor for the page after it."""
+
+    items: list[ModelT] = field(default_factory=list)
+    next_cursor: str | None = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _encode_value(value: Any) -> Any:
+    # Tag types JSON cannot represent so they round-trip exactly
+    if isinstance(value, datetime):
+        return {"t": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "t" in value:
+            return datetime.fromisoformat(value["t"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "n" in value:
+            return Decimal(value["n"])
+    return value
+
+
+def encode_cursor(order_by: Sequence[InstrumentedAttribute[Any]], values: Sequence[Any]) -> str:
+    """Encode the sort-key values of a row as a URL-safe cursor token."""
+    payload = {
+        "k": [column.key for column in order_by],
+        "v": [_encode_value(value) for value in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(order_by: Sequence[InstrumentedAttribute[Any]], token: str) -> list[Any]:
+    """Decode a cursor token; raises ``ValueError`` if it is malformed or for another ordering."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        keys, values = payload["k"], payload["v"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid pagination cursor") from None
+    if keys != [column.key for column in order_by] or len(values) != len(order_by):
+        raise ValueError("Pagination cursor does not match the requested ordering")
+    return [_decode_value(value) for value in values]
+
+
+def _after(
+    order_by: Sequence[InstrumentedAttribute[Any]], values: Sequence[Any], descending: bool
+) -> ColumnElement[bool]:
+    position = tuple_(*order_by)
+    after = tuple_(
+        *(literal(value, column.type) for column, value in zip(order_by, values, strict=True))
+    )
+    return position < after if descending else position > after
+
+
+def _key(item: Base, order_by: Sequence[InstrumentedAttribute[Any]]) -> list[Any]:
+    return [getattr(item, column.key) for column in order_by]
+
+
+def paginate(
+    session: Session,
+    model: type[ModelT],
+    order_by: Sequence[InstrumentedAttribute[Any]],
+    filters: Sequence[ColumnElement[bool]] = (),
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    descending: bool = False,
+) -> Page[ModelT]:
+    """Return one page of ``model`` rows ordered by ``order_by``.
+
+    Args:
+        session: Session to query with.
+        model: Mapped class to list.
+        order_by: Indexed sort columns, ending with a unique column,
+            e.g. ``(GoldContribution.contribution_date, GoldContribution.id)``.
+        filters: Extra WHERE criteria.
+        cursor: ``next_cursor`` from the previous page; None for the first page.
+        limit: Page size.
+        descending: Sort every column descending (newest first).
+    """
+    if not order_by:
+        raise ValueError("order_by must name at least one column")
+    query = select(model).where(*filters)
+    if cursor is not None:
+        query = query.where(_after(order_by, decode_cursor(order_by, cursor), descending))
+    ordering = [column.desc() if descending else column.asc() for column in order_by]
+    # One extra row tells whether another page exists without a COUNT
+    items = list(session.scalars(query.order_by(*ordering).limit(limit + 1)))
+    if len(items) <= limit:
+        return Page(items)
+    items = items[:limit]
+    return Page(items, encode_cursor(order_by, _key(items[-1], order_by)))
+
+
+def iter_keyset(
+    session: Session,
+    model: type[ModelT],
+    order_by: Sequence[InstrumentedAttribute[Any]],
+    filters: Sequence[ColumnElement[bool]] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    descending: bool = False,
+) -> Iterator[ModelT]:
+    """Yield every matching row in keyset-ordered chunks (for exports).
+
+    Each chunk is a separate seek query streamed with ``yield_per``, so
+    memory stays bounded and no chunk is slower than the first. Each object is
+    expunged once the caller resumes, so the identity map does not grow.
+    """
+    if not order_by:
+        raise ValueError("order_by must name at least one column")
+    ordering = [column.desc() if descending else column.asc() for column in order_by]
+    last: list[Any] | None = None
+    while True:
+        query = select(model).where(*filters)
+        if last is not None:
+            query = query.where(_after(order_by, last, descending))
+        query = query.order_by(*ordering).limit(chunk_size)
+        count = 0
+        for item in session.scalars(query.execution_options(yield_per=chunk_size)):
+            count += 1
+            last = _key(item, order_by)
+            yield item
+            session.expunge(item)
+        if count < chunk_size:
+            return
@@ -0,0 +1,277 @@
+"""Opt-in PostgreSQL range partitioning of the largest tables by election cycle.
+
+``bronze_fec_schedule_a`` (by ``two_year_transaction_period``) and
+``gold_contribution`` (by ``election_cycle``) are almost always filtered by
+cycle. Created through this module instead of ``Base.metadata.create_all``,
+they become declaratively partitioned parents with one child table per
+two-year cycle, so cycle-filtered queries and vacuum only touch one slice and
+old cycles can be detached without rewriting anything.
+
+PostgreSQL requires every primary key and unique constraint on a partitioned
+table to include the partition key, so the partitioned variants extend them:
+
+* ``bronze_fec_schedule_a``: primary key ``(sub_id, two_year_transaction_period)``
+  and the period becomes NOT NULL. Upsert with
+  ``upsert_fec_schedule_a(..., partitioned=True)``.
+* ``gold_contribution``: primary key ``(id, election_cycle)`` and
+  ``uq_source_transaction`` on ``(source_system, source_sub_id, election_cycle)``.
+
+Typical setup on a new database::
+
+    with engine.begin() as conn:
+        create_partitioned_tables(conn)
+        Base.metadata.create_all(conn)  # skips the tables created above
+        ensure_cycle_partitions(conn)   # current and next cycle
+
+Run :func:`ensure_cycle_partitions` on a schedule so the next cycle's
+partition always exists before data for it arrives.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    Constraint,
+    ForeignKeyConstraint,
+    Index,
+    MetaData,
+    PrimaryKeyConstraint,
+    Table,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze.fec import BronzeFECScheduleA
+from fund_lens_models.gold.models import GoldContribution
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """How a table is range-partitioned."""
+
+    table_name: str
+    column: str
+
+
+PARTITION_SPECS: dict[str, PartitionSpec] = {
+    BronzeFECScheduleA.__tablename__: PartitionSpec(
+        BronzeFECScheduleA.__tablename__, "two_year_transaction_period"
+    ),
+    GoldContribution.__tablename__: PartitionSpec(GoldContribution.__tablename__, "election_cycle"),
+}
+
+
+def _spec(model: type[Base] | Table) -> tuple[Table, PartitionSpec]:
+    table: Table = model if isinstance(model, Table) else model.__table__  # type: ignore[assignment]
+    try:
+        return table, PARTITION_SPECS[table.name]
+    except KeyError:
+        raise ValueError(f"{table.name} has no partition spec") from None
+
+
+def cycle_for(day: date) -> int:
+    """Return the two-year election cycle (an even year) containing ``day``."""
+    return day.year + day.year % 2
+
+
+def cycle_bounds(cycle: int) -> tuple[int, int]:
+    """Range bounds ``[from, to)`` for a cycle's partition.
+
+    Covers the odd year that opens the cycle as well as the even cycle year
+    itself, so stray odd-year period values land in the right partition.
+    """
+    if cycle % 2:
+        raise ValueError(f"Election cycles are even years, got {cycle}")
+    return cycle - 1, cycle + 1
+
+
+def partition_name(model: type[Base] | Table, cycle: int) -> str:
+    """Name of the child table holding ``cycle``, e.g. ``gold_contribution_2024``."""
+    table, _ = _spec(model)
+    return f"{table.name}_{cycle}"
+
+
+def partitioned_table(model: type[Base] | Table, metadata: MetaData | None = None) -> Table:
+    """Build a partitioned copy of the model's table with partition-aware keys.
+
+    The partition column is made NOT NULL and appended to the primary key and
+    every unique constraint/index. Foreign keys (the ``dim_*`` lookups) are
+    kept, with copies of their target tables in the same ``MetaData``. The
+    copy lives in its own ``MetaData`` so the mapped models are unaffected.
+    """
+    source, spec = _spec(model)
+    metadata = metadata or MetaData()
+    columns = []
+    for column in source.columns:
+        copy: Column = column._copy()
+        if column.name == spec.column:
+            copy.nullable = False
+        copy.primary_key = False
+        copy.unique = False
+        copy.index = False
+        columns.append(copy)
+
+    primary_key = [column.name for column in source.primary_key.columns]
+    constraints: list[Constraint] = [PrimaryKeyConstraint(*primary_key, spec.column)]
+    for constraint in source.constraints:
+        if isinstance(constraint, UniqueConstraint) and not isinstance(
+            constraint, PrimaryKeyConstraint
+        ):
+            names = [column.name for column in constraint.columns]
+            if spec.column not in names:
+                names.append(spec.column)
+            constraints.append(UniqueConstraint(*names, name=constraint.name))
+    for foreign_key in source.foreign_key_constraints:
+        referred = foreign_key.referred_table
+        if referred.key not in metadata.tables:
+            referred.to_metadata(metadata)
+        constraints.append(
+            ForeignKeyConstraint(
+                [column.name for column in foreign_key.columns],
+                [f"{referred.name}.{element.column.name}" for element in foreign_key.elements],
+                name=foreign_key.name,
+                ondelete=foreign_key.ondelete,
+                onupdate=foreign_key.onupdate,
+            )
+        )
+
+    table = Table(
+        source.name,
+        metadata,
+        *columns,
+        *constraints,
+        postgresql_partition_by=f"RANGE ({spec.column})",
+    )
+    for index in source.indexes:
+        names = [column.name for column in index.columns]
+        if index.unique and spec.column not in names:
+            names.append(spec.column)
+        Index(
+            index.name,
+            *(table.c[name] for name in names),
+            unique=index.unique,
+            **index.dialect_kwargs,  # Partial predicates and INCLUDE columns
+        )
+    return table
+
+
+def partitioned_ddl(model: type[Base] | Table) -> list[str]:
+    """PostgreSQL DDL for the partitioned parent table and its indexes."""
+    table = partitioned_table(model)
+    dialect = postgresql.dialect()
+    statements = [str(CreateTable(table).compile(dialect=dialect)).strip()]
+    statements.extend(
+        str(CreateIndex(index).compile(dialect=dialect)).strip()
+        for index in sorted(table.indexes, key=lambda index: index.name or "")
+    )
+    return statements
+
+
+def partition_ddl(model: type[Base] | Table, cycle: int, default: bool = False) -> str:
+    """DDL creating the child partition for ``cycle`` (or the DEFAULT partition)."""
+    table, _ = _spec(model)
+    preparer = postgresql.dialect().identifier_preparer
+    parent = preparer.quote(table.name)
+    if default:
+        child = preparer.quote(f"{table.name}_default")
+        return f"CREATE TABLE IF NOT EXISTS {child} PARTITION OF {parent} DEFAULT"
+    start, end = cycle_bounds(cycle)
+    child = preparer.quote(partition_name(table, cycle))
+    return (
+        f"CREATE TABLE IF NOT EXISTS {child} PARTITION OF {parent} "
+        f"FOR VALUES FROM ({start}) TO ({end})"
+    )
+
+
+def _require_postgresql(conn: Connection) -> None:
+    if conn.dialect.name != "postgresql":
+        raise ValueError(f"Partitioning requires PostgreSQL, not {conn.dialect.name}")
+
+
+def create_partitioned_tables(
+    conn: Connection,
+    models: tuple[type[Base], ...] = (BronzeFECScheduleA, GoldContribution),
+    default_partition: bool = True,
+) -> None:
+    """Create partitioned parents (and optionally DEFAULT partitions) if missing.
+
+    The DEFAULT partition catches rows for cycles that have no partition yet;
+    note that creating a cycle partition later fails if the default already
+    holds rows for that range, so keep :func:`ensure_cycle_partitions` ahead.
+    """
+    _require_postgresql(conn)
+    for model in models:
+        source, _ = _spec(model)
+        # The mapped lookup tables, so they are seeded when created
+        for foreign_key in source.foreign_key_constraints:
+            foreign_key.referred_table.create(conn, checkfirst=True)
+        table = partitioned_table(model)
+        table.create(conn, checkfirst=True)
+        if default_partition:
+            conn.execute(text(partition_ddl(model, 0, default=True)))
+
+
+def create_cycle_partition(conn: Connection, model: type[Base] | Table, cycle: int) -> str:
+    """Create the partition for ``cycle`` if it does not exist; returns its name."""
+    _require_postgresql(conn)
+    conn.execute(text(partition_ddl(model, cycle)))
+    return partition_name(model, cycle)
+
+
+def ensure_cycle_partitions(
+    conn: Connection,
+    models: tuple[type[Base], ...] = (BronzeFECScheduleA, GoldContribution),
+    today: date | None = None,
+    ahead: int = 1,
+) -> list[str]:
+    """Make sure the current cycle and the next ``ahead`` cycles have partitions."""
+    current = cycle_for(today or date.today())
+    created = []
+    for model in models:
+        for offset in range(ahead + 1):
+            created.append(create_cycle_partition(conn, model, current + 2 * offset))
+    return created
+
+
+def detach_cycle_partition(
+    conn: Connection, model: type[Base] | Table, cycle: int, concurrently: bool = False
+) -> str:
+    """Detach a cycle's partition into a standalone table; returns its name.
+
+    The detached table keeps its data and can be archived, dumped or dropped
+    independently. ``concurrently=True`` avoids blocking queries on the parent
+    but must run outside a transaction block (use an AUTOCOMMIT connection).
+    """
+    _require_postgresql(conn)
+    table, _ = _spec(model)
+    preparer = conn.dialect.identifier_preparer
+    child = partition_name(table, cycle)
+    suffix = " CONCURRENTLY" if concurrently else ""
+    conn.execute(
+        text(
+            f"ALTER TABLE {preparer.quote(table.name)} "
+            f"DETACH PARTITION {preparer.quote(child)}{suffix}"
+        )
+    )
+    return child
+
+
+def list_partitions(conn: Connection, model: type[Base] | Table) -> list[str]:
+    """Names of the partitions currently attached to the model's table."""
+    _require_postgresql(conn)
+    table, _ = _spec(model)
+    result = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :name ORDER BY child.relname"
+        ),
+        {"name": table.name},
+    )
+    return list(result.scalars())
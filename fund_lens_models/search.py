@@ -0,0 +1,180 @@
+"""Opt-in indexed name search for gold contributors, committees and candidates.
+
+``ILIKE '%...%'`` cannot use a btree index, so name search scans the table.
+:func:`install_search` adds indexes that can serve substring search:
+
+* PostgreSQL: the ``pg_trgm`` extension and a GIN trigram index on each
+  ``name`` column. ``ILIKE`` with a leading wildcard then becomes an index
+  scan, and results are ranked by trigram ``similarity()``.
+* SQLite: an external-content FTS5 table using the ``trigram`` tokenizer
+  (SQLite >= 3.34), kept in sync with triggers and ranked by bm25.
+
+The indexes are not part of ``Base.metadata``, so ``create_all`` and
+migrations are unaffected until a deployment opts in. :func:`search_names`
+uses them when present and falls back to a plain ``ILIKE`` scan, ranked by
+prefix and length, otherwise. Whether they are installed is checked once per
+engine and model; :func:`install_search` resets the check.
+"""
+
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import (
+    Connection,
+    Engine,
+    Float,
+    Integer,
+    Select,
+    case,
+    column,
+    func,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.gold.models import GoldCandidate, GoldCommittee, GoldContributor
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+SEARCHABLE_MODELS: tuple[type[Base], ...] = (GoldContributor, GoldCommittee, GoldCandidate)
+DEFAULT_LIMIT = 20
+
+# Trigram indexes and the FTS5 trigram tokenizer need at least three characters
+_MIN_TRIGRAM_LENGTH = 3
+
+# Engine -> model -> whether install_search has run for it
+_installed: WeakKeyDictionary[Engine, dict[type[Base], bool]] = WeakKeyDictionary()
+
+
+def _table_name(model: type[Base]) -> str:
+    if model not in SEARCHABLE_MODELS:
+        raise ValueError(f"{model.__name__} does not support name search")
+    return model.__tablename__
+
+
+def trigram_index_name(model: type[Base]) -> str:
+    return f"ix_{_table_name(model)}_name_trgm"
+
+
+def fts_table_name(model: type[Base]) -> str:
+    return f"{_table_name(model)}_name_fts"
+
+
+def _postgresql_ddl(model: type[Base]) -> list[str]:
+    table = _table_name(model)
+    return [
+        f"CREATE INDEX IF NOT EXISTS {trigram_index_name(model)} "
+        f"ON {table} USING gin (name gin_trgm_ops)",
+    ]
+
+
+def _sqlite_ddl(model: type[Base]) -> list[str]:
+    table = _table_name(model)
+    fts = fts_table_name(model)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"name, content='{table}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, name) VALUES (new.id, new.name); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, name) VALUES ('delete', old.id, old.name); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF name ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, name) VALUES ('delete', old.id, old.name); "
+        f"INSERT INTO {fts}(rowid, name) VALUES (new.id, new.name); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def search_ddl(dialect_name: str, model: type[Base]) -> list[str]:
+    """DDL statements that install name search for ``model`` on a dialect."""
+    if dialect_name == "postgresql":
+        return _postgresql_ddl(model)
+    if dialect_name == "sqlite":
+        return _sqlite_ddl(model)
+    raise ValueError(f"Name search is not supported on {dialect_name}")
+
+
+def install_search(conn: Connection, models: tuple[type[Base], ...] = SEARCHABLE_MODELS) -> None:
+    """Create the search indexes (idempotent). The tables must already exist.
+
+    On PostgreSQL this runs ``CREATE EXTENSION IF NOT EXISTS pg_trgm``, which
+    needs a role allowed to create extensions the first time.
+    """
+    dialect_name = conn.dialect.name
+    if dialect_name == "postgresql":
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for model in models:
+        for statement in search_ddl(dialect_name, model):
+            conn.execute(text(statement))
+    _installed.pop(conn.engine, None)
+
+
+def _search_installed(conn: Connection, model: type[Base]) -> bool:
+    inspector = inspect(conn)
+    if conn.dialect.name == "postgresql":
+        indexes = inspector.get_indexes(_table_name(model))
+        return any(index["name"] == trigram_index_name(model) for index in indexes)
+    if conn.dialect.name == "sqlite":
+        return inspector.has_table(fts_table_name(model))
+    return False
+
+
+def search_installed(session: Session, model: type[Base]) -> bool:
+    """Whether :func:`install_search` has run for ``model``; cached per engine."""
+    by_model = _installed.setdefault(session.get_bind().engine, {})
+    if model not in by_model:
+        by_model[model] = _search_installed(session.connection(), model)
+    return by_model[model]
+
+
+def _fts_phrase(query: str) -> str:
+    # One quoted FTS5 string: trigram phrases match substrings, quotes are doubled
+    return '"' + query.replace('"', '""') + '"'
+
+
+def search_names(
+    session: Session, model: type[ModelT], query: str, limit: int = DEFAULT_LIMIT
+) -> list[ModelT]:
+    """Return up to ``limit`` rows of ``model`` whose name contains ``query``, best first.
+
+    Case-insensitive substring match. Ranking is trigram similarity on
+    PostgreSQL and bm25 on SQLite once :func:`install_search` has run, and
+    otherwise prefix matches first, then shorter names.
+    """
+    query = query.strip()
+    if not query:
+        return []
+    _table_name(model)
+    dialect_name = session.get_bind().dialect.name
+    indexed = len(query) >= _MIN_TRIGRAM_LENGTH and search_installed(session, model)
+
+    if dialect_name == "sqlite" and indexed:
+        fts = fts_table_name(model)
+        matches = text(
+            f"SELECT rowid, rank FROM {fts} WHERE {fts} MATCH :phrase ORDER BY rank LIMIT :limit"
+        ).columns(column("rowid", Integer), column("rank", Float))
+        ranked = matches.bindparams(phrase=_fts_phrase(query), limit=limit).subquery("matches")
+        statement = (
+            select(model)
+            .join(ranked, ranked.c.rowid == model.__table__.c.id)  # type: ignore[attr-defined]
+            .order_by(ranked.c.rank)
+        )
+        return list(session.scalars(statement))
+
+    trigram = dialect_name == "postgresql" and indexed
+    return list(session.scalars(scan_statement(model, query, limit, trigram)))
+
+
+def scan_statement(
+    model: type[ModelT], query: str, limit: int, trigram: bool = False
+) -> Select[tuple[ModelT]]:
+    """``ILIKE`` substring query, ranked by ``similarity()`` when ``trigram`` (needs pg_trgm)."""
+    name: Any = model.__table__.c.name  # type: ignore[attr-defined]
+    statement = select(model).where(name.icontains(query, autoescape=True)).limit(limit)
+    if trigram:
+        return statement.order_by(func.similarity(name, query).desc(), name)
+    prefix_first = case((name.istartswith(query, autoescape=True), 0), else_=1)
+    return statement.order_by(prefix_first, func.length(name), name)
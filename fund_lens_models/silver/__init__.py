@@ -1,15 +1,31 @@
 """Silver layer models - cleaned and standardized data."""
 
-from fund_lens_models.silver.fec import (
-    SilverFECCandidate,
-    SilverFECCommittee,
-    SilverFECContribution,
-)
-from fund_lens_models.silver.maryland import (
-    SilverMarylandCandidate,
-    SilverMarylandCommittee,
-    SilverMarylandContribution,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fund_lens_models.silver.fec import (
+        SilverFECCandidate,
+        SilverFECCommittee,
+        SilverFECContribution,
+    )
+    from fund_lens_models.silver.maryland import (
+        SilverMarylandCandidate,
+        SilverMarylandCommittee,
+        SilverMarylandContribution,
+    )
+    from fund_lens_models.silver.watermark import SilverTransformWatermark
+
+# Public name -> defining module, imported on first access (PEP 562)
+_ATTRIBUTES = {
+    "SilverFECCandidate": "fund_lens_models.silver.fec",
+    "SilverFECCommittee": "fund_lens_models.silver.fec",
+    "SilverFECContribution": "fund_lens_models.silver.fec",
+    "SilverMarylandCandidate": "fund_lens_models.silver.maryland",
+    "SilverMarylandCommittee": "fund_lens_models.silver.maryland",
+    "SilverMarylandContribution": "fund_lens_models.silver.maryland",
+    "SilverTransformWatermark": "fund_lens_models.silver.watermark",
+}
 
 __all__ = [
     # FEC models
@@ -20,4 +36,18 @@ __all__ = [
     "SilverMarylandContribution",
     "SilverMarylandCommittee",
     "SilverMarylandCandidate",
+    # Transform state
+    "SilverTransformWatermark",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,212 @@
+"""In-memory committee/candidate lookup for enriching silver FEC contributions.
+
+``SilverFECContribution`` denormalizes committee and candidate attributes.
+Rather than joining or querying per row, :class:`CommitteeEnrichmentCache`
+loads ``bronze_fec_committee`` and ``bronze_fec_candidate`` once into compact
+``__slots__`` records with interned strings, resolves each committee's
+primary candidate up front, and enriches whole batches of rows with one dict
+lookup per row. :meth:`CommitteeEnrichmentCache.refresh` then pulls only rows
+whose ``updated_at`` moved since the last load.
+
+``updated_at`` is stamped when a bronze transaction starts, so a row can
+commit after a refresh with a timestamp below the high-water mark that
+refresh recorded. Each refresh therefore re-reads the last ``safety_lag``
+before the mark; applying a row again is harmless.
+"""
+
+import sys
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Connection, func, select
+from sqlalchemy.orm import Session
+
+from fund_lens_models.bronze.fec import BronzeFECCandidate, BronzeFECCommittee
+from fund_lens_models.silver.watermark import DEFAULT_SAFETY_LAG
+
+_YIELD_PER = 10_000
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value else None
+
+
+class CandidateRecord:
+    """Candidate attributes copied onto contributions."""
+
+    __slots__ = ("name", "office", "party")
+
+    def __init__(self, name: str | None, office: str | None, party: str | None) -> None:
+        self.name = name
+        self.office = office
+        self.party = party
+
+
+class CommitteeRecord:
+    """Committee attributes plus its resolved primary candidate."""
+
+    __slots__ = (
+        "committee_name",
+        "committee_type",
+        "committee_party",
+        "candidate_id",
+        "candidate_name",
+        "candidate_office",
+        "candidate_party",
+    )
+
+    def __init__(
+        self,
+        committee_name: str | None,
+        committee_type: str | None,
+        committee_party: str | None,
+        candidate_id: str | None,
+        candidate: CandidateRecord | None,
+    ) -> None:
+        self.committee_name = committee_name
+        self.committee_type = committee_type
+        self.committee_party = committee_party
+        self.candidate_id = candidate_id
+        self.candidate_name = candidate.name if candidate else None
+        self.candidate_office = candidate.office if candidate else None
+        self.candidate_party = candidate.party if candidate else None
+
+
+class CommitteeEnrichmentCache:
+    """Preloaded committee -> (committee, candidate) attributes keyed by ``committee_id``."""
+
+    def __init__(self, safety_lag: timedelta = DEFAULT_SAFETY_LAG) -> None:
+        self.safety_lag = safety_lag
+        self.committees: dict[str, CommitteeRecord] = {}
+        self.candidates: dict[str, CandidateRecord] = {}
+        # Raw committee fields, kept so records can be rebuilt when a candidate changes
+        self._committee_fields: dict[
+            str, tuple[str | None, str | None, str | None, str | None]
+        ] = {}
+        self._committees_by_candidate: defaultdict[str, set[str]] = defaultdict(set)
+        self.committees_loaded_through: datetime | None = None
+        self.candidates_loaded_through: datetime | None = None
+
+    @classmethod
+    def load(
+        cls, bind: Session | Connection, safety_lag: timedelta = DEFAULT_SAFETY_LAG
+    ) -> "CommitteeEnrichmentCache":
+        """Build a cache from the full bronze committee and candidate tables."""
+        cache = cls(safety_lag)
+        cache.refresh(bind)
+        return cache
+
+    def __len__(self) -> int:
+        return len(self.committees)
+
+    def get(self, committee_id: str) -> CommitteeRecord | None:
+        return self.committees.get(committee_id)
+
+    def refresh(self, bind: Session | Connection) -> tuple[int, int]:
+        """Load committees and candidates updated since the previous load.
+
+        Rows from the last ``safety_lag`` before the previous high-water marks
+        are read again, so transactions still in flight then are not skipped.
+
+        Returns:
+            Number of (committee, candidate) rows applied.
+        """
+        candidate = BronzeFECCandidate
+        candidate_query = select(
+            candidate.candidate_id, candidate.name, candidate.office, candidate.party
+        ).execution_options(yield_per=_YIELD_PER)
+        if self.candidates_loaded_through is not None:
+            candidate_query = candidate_query.where(
+                candidate.updated_at > self.candidates_loaded_through - self.safety_lag
+            )
+        # Read the high-water mark before scanning so concurrent updates are not skipped
+        candidate_through = bind.execute(select(func.max(candidate.updated_at))).scalar()
+
+        changed_candidates: set[str] = set()
+        for candidate_id, name, office, party in bind.execute(candidate_query):
+            self.candidates[candidate_id] = CandidateRecord(
+                _intern(name), _intern(office), _intern(party)
+            )
+            changed_candidates.add(candidate_id)
+
+        committee = BronzeFECCommittee
+        committee_query = select(
+            committee.committee_id,
+            committee.name,
+            committee.committee_type,
+            committee.party,
+            committee.candidate_ids,
+        ).execution_options(yield_per=_YIELD_PER)
+        if self.committees_loaded_through is not None:
+            committee_query = committee_query.where(
+                committee.updated_at > self.committees_loaded_through - self.safety_lag
+            )
+        committee_through = bind.execute(select(func.max(committee.updated_at))).scalar()
+
+        committees_applied = 0
+        for committee_id, name, committee_type, party, candidate_ids in bind.execute(
+            committee_query
+        ):
+            previous = self._committee_fields.get(committee_id)
+            if previous and previous[3]:
+                self._committees_by_candidate[previous[3]].discard(committee_id)
+            primary = _intern(candidate_ids[0]) if candidate_ids else None
+            self._committee_fields[committee_id] = (
+                _intern(name),
+                _intern(committee_type),
+                _intern(party),
+                primary,
+            )
+            if primary:
+                self._committees_by_candidate[primary].add(committee_id)
+            self._build(committee_id)
+            committees_applied += 1
+
+        # Committees whose own row did not change still pick up candidate changes
+        for candidate_id in changed_candidates:
+            for committee_id in self._committees_by_candidate.get(candidate_id, ()):
+                self._build(committee_id)
+
+        self.candidates_loaded_through = candidate_through or self.candidates_loaded_through
+        self.committees_loaded_through = committee_through or self.committees_loaded_through
+        return committees_applied, len(changed_candidates)
+
+    def _build(self, committee_id: str) -> None:
+        name, committee_type, party, candidate_id = self._committee_fields[committee_id]
+        self.committees[sys.intern(committee_id)] = CommitteeRecord(
+            name,
+            committee_type,
+            party,
+            candidate_id,
+            self.candidates.get(candidate_id) if candidate_id else None,
+        )
+
+    def enrich(self, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Fill committee/candidate columns on silver contribution dicts in place.
+
+        A row's own ``candidate_id`` (e.g. from pas2 records) is kept when the
+        committee has no affiliated candidate.
+        """
+        committees = self.committees
+        candidates = self.candidates
+        enriched = []
+        for row in rows:
+            record = committees.get(row["committee_id"])
+            if record is not None:
+                row["committee_name"] = record.committee_name
+                row["committee_type"] = record.committee_type or row.get("committee_type")
+                row["committee_party"] = record.committee_party
+            if record is not None and record.candidate_id:
+                row["candidate_id"] = record.candidate_id
+                row["candidate_name"] = record.candidate_name
+                row["candidate_office"] = record.candidate_office
+                row["candidate_party"] = record.candidate_party
+            else:
+                candidate = candidates.get(row.get("candidate_id") or "")
+                row["candidate_name"] = candidate.name if candidate else None
+                row["candidate_office"] = candidate.office if candidate else None
+                row["candidate_party"] = candidate.party if candidate else None
+            enriched.append(row)
+        return enriched
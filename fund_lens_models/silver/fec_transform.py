@@ -0,0 +1,218 @@
+"""Incremental bronze -> silver transform for FEC Schedule A contributions.
+
+Only ``bronze_fec_schedule_a`` rows whose ``updated_at`` is past the persisted
+watermark are read. They are streamed in keyset order on ``(updated_at,
+sub_id)``, cleaned, and upserted into ``silver_fec_contribution`` on
+``source_sub_id``. Each chunk's upsert and the watermark advance commit in the
+same transaction, so an interrupted run resumes where it stopped and never
+skips or double-applies a chunk.
+
+``updated_at`` is stamped when a bronze transaction starts (PostgreSQL
+``now()``), not when it commits, so rows can become visible with timestamps
+below a watermark that has already passed them. Each run therefore only reads
+rows older than the database clock minus ``safety_lag``; keep the lag longer
+than the longest bronze load transaction.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import literal, select, tuple_
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session, sessionmaker
+
+from fund_lens_models.bronze.fec import BronzeFECScheduleA
+from fund_lens_models.bulk import bulk_upsert
+from fund_lens_models.silver.fec import SilverFECContribution
+from fund_lens_models.silver.watermark import DEFAULT_SAFETY_LAG, get_watermark, safety_cutoff
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = SilverFECContribution.__tablename__
+DEFAULT_CHUNK_SIZE = 5000
+NOT_PROVIDED = "NOT PROVIDED"
+
+# Bronze columns read by the transform (raw_json is deliberately skipped)
+_BRONZE_COLUMNS = (
+    "sub_id",
+    "updated_at",
+    "transaction_id",
+    "file_number",
+    "amendment_indicator",
+    "contribution_receipt_date",
+    "contribution_receipt_amount",
+    "contributor_aggregate_ytd",
+    "contributor_name",
+    "contributor_first_name",
+    "contributor_last_name",
+    "contributor_city",
+    "contributor_state",
+    "contributor_zip",
+    "contributor_employer",
+    "contributor_occupation",
+    "entity_type",
+    "committee_id",
+    "recipient_committee_designation",
+    "recipient_committee_type",
+    "candidate_id",
+    "receipt_type",
+    "election_type",
+    "memo_code",
+    "memo_text",
+    "two_year_transaction_period",
+    "report_year",
+)
+
+Enricher = Callable[[list[dict[str, Any]]], Iterable[dict[str, Any]]]
+
+
+@dataclass
+class TransformResult:
+    """Counts from an incremental transform run."""
+
+    rows_read: int = 0
+    rows_rejected: int = 0
+    inserted: int = 0
+    updated: int = 0
+    chunks: int = 0
+    watermark: tuple[datetime | None, str | None] = (None, None)
+
+
+def _clean(value: str | None) -> str | None:
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def _zip5(value: str | None) -> str | None:
+    digits = "".join(ch for ch in value or "" if ch.isdigit())
+    return digits[:5] if len(digits) >= 5 else None
+
+
+def _election_cycle(period: int | None, contribution_date: date) -> int:
+    if period:
+        return period
+    year = contribution_date.year
+    return year + year % 2
+
+
+def to_silver(row: RowMapping | dict[str, Any]) -> dict[str, Any] | None:
+    """Map a bronze Schedule A row to silver column values.
+
+    Returns None for records missing contribution date, amount, contributor
+    name or committee, which silver requires.
+    """
+    contribution_date = row["contribution_receipt_date"]
+    amount = row["contribution_receipt_amount"]
+    name = _clean(row["contributor_name"])
+    committee_id = _clean(row["committee_id"])
+    if contribution_date is None or amount is None or name is None or committee_id is None:
+        return None
+    state = _clean(row["contributor_state"])
+    return {
+        "source_sub_id": row["sub_id"],
+        "transaction_id": _clean(row["transaction_id"]),
+        "file_number": row["file_number"],
+        "amendment_indicator": _clean(row["amendment_indicator"]),
+        "contribution_date": contribution_date,
+        "contribution_amount": amount,
+        "contributor_aggregate_ytd": row["contributor_aggregate_ytd"],
+        "contributor_name": name,
+        "contributor_first_name": _clean(row["contributor_first_name"]),
+        "contributor_last_name": _clean(row["contributor_last_name"]),
+        "contributor_city": _clean(row["contributor_city"]),
+        "contributor_state": state.upper() if state else None,
+        "contributor_zip": _zip5(row["contributor_zip"]),
+        "contributor_employer": _clean(row["contributor_employer"]) or NOT_PROVIDED,
+        "contributor_occupation": _clean(row["contributor_occupation"]) or NOT_PROVIDED,
+        "entity_type": _clean(row["entity_type"]),
+        "committee_id": committee_id,
+        "committee_designation": _clean(row["recipient_committee_designation"]),
+        "committee_type": _clean(row["recipient_committee_type"]),
+        "candidate_id": _clean(row["candidate_id"]),
+        "receipt_type": _clean(row["receipt_type"]),
+        "election_type": _clean(row["election_type"]),
+        "memo_code": _clean(row["memo_code"]),
+        "memo_text": row["memo_text"],
+        "election_cycle": _election_cycle(row["two_year_transaction_period"], contribution_date),
+        "report_year": row["report_year"],
+    }
+
+
+def transform_fec_contributions(
+    session_factory: sessionmaker[Session],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    enricher: Enricher | None = None,
+    max_chunks: int | None = None,
+    safety_lag: timedelta = DEFAULT_SAFETY_LAG,
+) -> TransformResult:
+    """Apply bronze Schedule A changes past the watermark to silver.
+
+    Args:
+        session_factory: Sessionmaker; one transaction is opened per chunk.
+        chunk_size: Bronze rows read per keyset page.
+        enricher: Optional batch callable that fills committee/candidate
+            columns on the cleaned silver dicts before they are written,
+            e.g. ``CommitteeEnrichmentCache.load(session).enrich``.
+        max_chunks: Stop after this many chunks (for bounded runs).
+        safety_lag: Only rows with ``updated_at`` older than the database
+            clock minus this are read, so transactions still in flight when
+            the run starts are picked up by a later run instead of skipped.
+
+    Returns:
+        Counts for the run and the final watermark position.
+    """
+    bronze = BronzeFECScheduleA
+    columns = [bronze.__table__.c[name] for name in _BRONZE_COLUMNS]
+    position = tuple_(bronze.updated_at, bronze.sub_id)
+    result = TransformResult()
+    with session_factory() as session:
+        cutoff = safety_cutoff(session, safety_lag)
+
+    while max_chunks is None or result.chunks < max_chunks:
+        with session_factory.begin() as session:
+            watermark = get_watermark(session, WATERMARK_NAME, lock=True)
+            query = (
+                select(*columns)
+                .where(bronze.updated_at < literal(cutoff, bronze.updated_at.type))
+                .order_by(bronze.updated_at, bronze.sub_id)
+                .limit(chunk_size)
+            )
+            if watermark.last_change_timestamp is not None:
+                after = tuple_(
+                    literal(watermark.last_change_timestamp, bronze.updated_at.type),
+                    literal(watermark.last_source_key or "", bronze.sub_id.type),
+                )
+                query = query.where(position > after)
+            rows = session.execute(query).mappings().all()
+            if not rows:
+                result.watermark = (watermark.last_change_timestamp, watermark.last_source_key)
+                break
+
+            silver_rows = [silver for silver in map(to_silver, rows) if silver is not None]
+            if enricher is not None and silver_rows:
+                silver_rows = list(enricher(silver_rows))
+            counts = bulk_upsert(session, SilverFECContribution, silver_rows, ("source_sub_id",))
+
+            last = rows[-1]
+            watermark.last_change_timestamp = last["updated_at"]
+            watermark.last_source_key = last["sub_id"]
+            watermark.rows_processed += len(rows)
+
+            result.rows_read += len(rows)
+            result.rows_rejected += len(rows) - len(silver_rows)
+            result.inserted += counts.inserted
+            result.updated += counts.updated
+            result.chunks += 1
+            result.watermark = (last["updated_at"], last["sub_id"])
+
+        if len(rows) < chunk_size:
+            break
+
+    if result.rows_rejected:
+        logger.info("Skipped %d bronze rows missing required fields", result.rows_rejected)
+    return result
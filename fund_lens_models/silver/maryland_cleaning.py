@@ -0,0 +1,192 @@
+"""Batch cleaning of bronze Maryland contributions into silver-ready rows.
+
+Bronze MDCRIS rows keep dates and amounts as strings and the contributor
+address unparsed. The cleaner works on columnar chunks (one list per bronze
+column) and parses a whole column at a time with precompiled patterns. Because
+statewide files repeat the same date, amount and address strings heavily, each
+parser is memoized, so most values cost a dict lookup instead of a regex match.
+Rows that fail required-field checks are returned in a reject list with the
+reasons rather than raising.
+"""
+
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any
+
+from fund_lens_models.enums import USState
+
+_CACHE_SIZE = 1 << 16
+UNKNOWN_CONTRIBUTOR_TYPE = "Unknown"
+
+_DATE_PATTERNS = (
+    # MM/DD/YYYY and M/D/YYYY (MDCRIS exports)
+    (re.compile(r"^(?P<m>\d{1,2})/(?P<d>\d{1,2})/(?P<y>\d{4})"), False),
+    # YYYY-MM-DD, optionally followed by a time
+    (re.compile(r"^(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2})"), False),
+    # MM/DD/YY
+    (re.compile(r"^(?P<m>\d{1,2})/(?P<d>\d{1,2})/(?P<y>\d{2})$"), True),
+)
+
+# Optional sign/parentheses, optional $, digits with thousands separators, optional cents
+_AMOUNT_PATTERN = re.compile(
+    r"^\s*(?P<neg>-|\()?\s*\$?\s*(?P<num>\d[\d,]*(?:\.\d+)?|\.\d+)\s*\)?\s*$"
+)
+
+_STATE_CODES = frozenset(state.value for state in USState)
+
+# "<street>  <city>  <ST> <zip>" or "<street>, <city>, <ST> <zip>"
+_ADDRESS_TAIL = re.compile(r"[\s,]+(?P<state>[A-Za-z]{2})\.?[\s,]+(?P<zip>\d{5})(?:-?\d{4})?\s*$")
+_FIELD_SEPARATOR = re.compile(r"\s{2,}|\s*,\s*")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_date(value: str) -> date | None:
+    """Parse an MDCRIS date string; returns None if unrecognized or invalid."""
+    value = value.strip()
+    for pattern, two_digit_year in _DATE_PATTERNS:
+        match = pattern.match(value)
+        if match:
+            year = int(match["y"])
+            if two_digit_year:
+                year += 2000 if year < 70 else 1900
+            try:
+                return date(year, int(match["m"]), int(match["d"]))
+            except ValueError:
+                return None
+    return None
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_amount(value: str) -> Decimal | None:
+    """Parse a currency string such as ``$1,250.00`` or ``(25.00)``."""
+    match = _AMOUNT_PATTERN.match(value)
+    if match is None:
+        return None
+    try:
+        amount = Decimal(match["num"].replace(",", "")).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None
+    return -amount if match["neg"] else amount
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_address(value: str) -> tuple[str | None, str | None, str | None]:
+    """Split an unparsed address into ``(city, state, zip5)``.
+
+    The state and ZIP are taken from the end of the string; the city is the
+    field before them when fields are separated by commas or runs of spaces.
+    Any part that cannot be identified is None.
+    """
+    match = _ADDRESS_TAIL.search(value)
+    if match is None:
+        return None, None, None
+    state = match["state"].upper()
+    if state not in _STATE_CODES:
+        return None, None, match["zip"]
+    fields = [part for part in _FIELD_SEPARATOR.split(value[: match.start()].strip()) if part]
+    city = fields[-1].strip() if len(fields) >= 2 else None
+    return city, state, match["zip"]
+
+
+def clear_caches() -> None:
+    """Drop memoized parse results (e.g. between unrelated files)."""
+    parse_date.cache_clear()
+    parse_amount.cache_clear()
+    parse_address.cache_clear()
+
+
+@dataclass
+class CleaningResult:
+    """Silver-ready rows and rejected bronze rows from one chunk."""
+
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    rejects: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _strip(values: Sequence[str | None]) -> list[str | None]:
+    return [value.strip() or None if value else None for value in values]
+
+
+def to_columns(rows: Sequence[Mapping[str, Any]]) -> dict[str, list[Any]]:
+    """Transpose a list of bronze row dicts into a columnar chunk."""
+    if not rows:
+        return {}
+    return {name: [row.get(name) for row in rows] for name in rows[0]}
+
+
+def clean_contributions(columns: Mapping[str, Sequence[Any]]) -> CleaningResult:
+    """Clean a columnar chunk of ``BronzeMarylandContribution`` values.
+
+    Args:
+        columns: Bronze column name -> list of values, all lists the same
+            length. ``content_hash``, ``receiving_committee``,
+            ``filing_period``, ``contribution_date``, ``contribution_amount``
+            and ``contribution_type`` are required; other columns may be absent.
+
+    Returns:
+        Dicts keyed by ``SilverMarylandContribution`` columns, and a reject
+        entry (``index``, ``content_hash``, ``reasons``) per unusable row.
+    """
+    size = len(columns["content_hash"])
+
+    def column(name: str) -> list[Any]:
+        values = columns.get(name)
+        return list(values) if values is not None else [None] * size
+
+    # Whole-column passes; memoized parsers turn repeats into cache hits
+    dates = [parse_date(value) if value else None for value in column("contribution_date")]
+    amounts = [parse_amount(value) if value else None for value in column("contribution_amount")]
+    raw_addresses = column("contributor_address")
+    addresses = [parse_address(value) if value else (None, None, None) for value in raw_addresses]
+    names = _strip(column("contributor_name"))
+    committees = _strip(column("receiving_committee"))
+    contributor_types = _strip(column("contributor_type"))
+    contribution_types = _strip(column("contribution_type"))
+    fund_types = _strip(column("fund_type"))
+    employers = _strip(column("employer_name"))
+    occupations = _strip(column("employer_occupation"))
+    filing_periods = _strip(column("filing_period"))
+    offices = _strip(column("office"))
+    hashes = column("content_hash")
+
+    result = CleaningResult()
+    for i in range(size):
+        reasons = []
+        if dates[i] is None:
+            reasons.append("invalid contribution_date")
+        if amounts[i] is None:
+            reasons.append("invalid contribution_amount")
+        if names[i] is None:
+            reasons.append("missing contributor_name")
+        if committees[i] is None:
+            reasons.append("missing receiving_committee")
+        if reasons:
+            result.rejects.append({"index": i, "content_hash": hashes[i], "reasons": reasons})
+            continue
+        city, state, zip5 = addresses[i]
+        address = raw_addresses[i]
+        result.rows.append(
+            {
+                "source_content_hash": hashes[i],
+                "contribution_date": dates[i],
+                "contribution_amount": amounts[i],
+                "contribution_type": contribution_types[i] or "",
+                "fund_type": fund_types[i],
+                "contributor_name": names[i],
+                "contributor_type": contributor_types[i] or UNKNOWN_CONTRIBUTOR_TYPE,
+                "contributor_address": address.strip() if address else None,
+                "contributor_city": city,
+                "contributor_state": state,
+                "contributor_zip": zip5,
+                "employer_name": employers[i],
+                "employer_occupation": occupations[i],
+                "committee_name": committees[i],
+                "filing_period": filing_periods[i] or "",
+                "office": offices[i],
+            }
+        )
+    return result
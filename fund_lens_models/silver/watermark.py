@@ -0,0 +1,81 @@
+"""Silver layer models - transform watermarks.
+
+``updated_at`` is stamped when a transaction starts (PostgreSQL ``now()``),
+not when it commits, so rows can become visible with timestamps below a
+watermark that has already passed them. Incremental readers therefore only
+read rows older than :func:`safety_cutoff`, the database clock minus a
+safety lag longer than the longest writing transaction.
+"""
+
+from datetime import datetime, timedelta
+from typing import TypeVar
+
+from sqlalchemy import DateTime, Integer, String, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from fund_lens_models.base import Base, TimestampMixin, utcnow
+
+DEFAULT_SAFETY_LAG = timedelta(minutes=15)
+
+WatermarkT = TypeVar("WatermarkT", bound=Base)
+
+
+class SilverTransformWatermark(Base, TimestampMixin):
+    """
+    High-water mark for an incremental transform.
+
+    Records the (change timestamp, key) of the last source row a transform has
+    processed, so the next run only reads rows changed after it.
+    """
+
+    __tablename__ = "silver_transform_watermark"
+
+    # Transform name, e.g. 'silver_fec_contribution'
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    # Keyset position of the last processed source row
+    last_change_timestamp: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_source_key: Mapped[str | None] = mapped_column(String(255))
+
+    # Running total of source rows processed
+    rows_processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SilverTransformWatermark("
+            f"name={self.name}, "
+            f"last_change={self.last_change_timestamp}, "
+            f"last_key={self.last_source_key}"
+            f")>"
+        )
+
+
+def load_watermark(
+    session: Session, model: type[WatermarkT], name: str, lock: bool = False
+) -> WatermarkT:
+    """Load the ``name`` row of a watermark model, creating an empty one if missing.
+
+    ``model`` needs ``name`` and ``rows_processed`` columns. With
+    ``lock=True`` the row is selected ``FOR UPDATE`` (PostgreSQL) so two runs
+    of the same transform cannot advance it concurrently.
+    """
+    query = select(model).filter_by(name=name)
+    if lock:
+        query = query.with_for_update()
+    watermark = session.scalars(query).one_or_none()
+    if watermark is None:
+        watermark = model(name=name, rows_processed=0)
+        session.add(watermark)
+        session.flush()
+    return watermark
+
+
+def get_watermark(session: Session, name: str, lock: bool = False) -> SilverTransformWatermark:
+    """Load a transform watermark row, creating an empty one if missing."""
+    return load_watermark(session, SilverTransformWatermark, name, lock=lock)
+
+
+def safety_cutoff(session: Session, safety_lag: timedelta = DEFAULT_SAFETY_LAG) -> datetime:
+    """Database clock minus ``safety_lag``; rows changed at or after it are left for a later run."""
+    cutoff: datetime = session.execute(select(utcnow())).scalar_one() - safety_lag
+    return cutoff
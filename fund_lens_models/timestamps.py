@@ -0,0 +1,139 @@
+"""Bring existing databases up to date with server-side timestamp defaults.
+
+``created_at``, ``updated_at`` and ``ingestion_timestamp`` are filled by the
+database (see :class:`fund_lens_models.base.utcnow`). New databases get the
+defaults from ``create_all``. Databases created before that need
+:func:`install_timestamp_defaults`, which for each table with timestamp
+columns:
+
+* backfills NULL timestamps in columns that are still nullable and makes
+  them NOT NULL,
+* sets the column defaults to the database clock (PostgreSQL; SQLite cannot
+  alter a column default, so SQLite databases are recreated instead), and
+* optionally installs a row trigger that sets ``updated_at`` on every
+  ``UPDATE`` that leaves it unchanged, covering writes that bypass
+  SQLAlchemy (``psql``, ``COPY``-and-merge loaders, other services).
+
+Migrations live in fund-lens-etl; a revision there calls it from
+``upgrade()``::
+
+    def upgrade() -> None:
+        install_timestamp_defaults(op.get_bind())
+"""
+
+from sqlalchemy import Connection, Table, inspect, text
+from sqlalchemy.dialects import sqlite
+
+from fund_lens_models.base import load_all_models, utcnow
+
+TIMESTAMP_COLUMNS = ("created_at", "updated_at", "ingestion_timestamp")
+
+# Shared PL/pgSQL trigger function used by every table's updated_at trigger
+UPDATED_AT_FUNCTION = "fund_lens_set_updated_at"
+
+_POSTGRESQL_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION {UPDATED_AT_FUNCTION}() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at := now();
+    END IF;
+    RETURN NEW;
+END
+$$
+"""
+
+
+def timestamp_tables() -> list[Table]:
+    """Every mapped table with at least one timestamp column."""
+    return [
+        table
+        for table in load_all_models().sorted_tables
+        if any(name in table.c for name in TIMESTAMP_COLUMNS)
+    ]
+
+
+def updated_at_trigger_name(table: Table) -> str:
+    return f"{table.name}_set_updated_at"
+
+
+def _backfill(table: Table, columns: list[str], now: str) -> list[str]:
+    if not columns:
+        return []
+    assignments = ", ".join(f"{name} = COALESCE({name}, {now})" for name in columns)
+    condition = " OR ".join(f"{name} IS NULL" for name in columns)
+    return [f"UPDATE {table.name} SET {assignments} WHERE {condition}"]
+
+
+def _postgresql_ddl(table: Table, nullable: list[str], trigger: bool) -> list[str]:
+    present = [name for name in TIMESTAMP_COLUMNS if name in table.c]
+    alterations = [f"ALTER COLUMN {name} SET DEFAULT now()" for name in present]
+    alterations += [f"ALTER COLUMN {name} SET NOT NULL" for name in nullable]
+    statements = _backfill(table, nullable, "now()")
+    statements.append(f"ALTER TABLE {table.name} {', '.join(alterations)}")
+    if trigger and "updated_at" in table.c:
+        name = updated_at_trigger_name(table)
+        statements += [
+            f"DROP TRIGGER IF EXISTS {name} ON {table.name}",
+            f"CREATE TRIGGER {name} BEFORE UPDATE ON {table.name} "
+            f"FOR EACH ROW EXECUTE FUNCTION {UPDATED_AT_FUNCTION}()",
+        ]
+    return statements
+
+
+def _sqlite_ddl(table: Table, nullable: list[str], trigger: bool) -> list[str]:
+    now = str(utcnow().compile(dialect=sqlite.dialect()))
+    statements = _backfill(table, nullable, now)
+    if trigger and "updated_at" in table.c:
+        # Recursive triggers are off by default, so the inner UPDATE does not re-fire it
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {updated_at_trigger_name(table)} "
+            f"AFTER UPDATE ON {table.name} WHEN new.updated_at IS old.updated_at BEGIN "
+            f"UPDATE {table.name} SET updated_at = {now} WHERE rowid = new.rowid; END"
+        )
+    return statements
+
+
+def timestamp_defaults_ddl(
+    dialect_name: str, table: Table, nullable: tuple[str, ...] = (), trigger: bool = True
+) -> list[str]:
+    """Statements that install the timestamp defaults on one table.
+
+    Args:
+        dialect_name: ``postgresql`` or ``sqlite``.
+        table: Table with timestamp columns.
+        nullable: Timestamp columns that are still nullable in the database;
+            they are backfilled and made NOT NULL.
+        trigger: Also install the ``updated_at`` trigger.
+    """
+    columns = [name for name in TIMESTAMP_COLUMNS if name in nullable]
+    if dialect_name == "postgresql":
+        return _postgresql_ddl(table, columns, trigger)
+    if dialect_name == "sqlite":
+        return _sqlite_ddl(table, columns, trigger)
+    raise ValueError(f"Timestamp defaults are not supported on {dialect_name}")
+
+
+def install_timestamp_defaults(
+    conn: Connection, tables: list[Table] | None = None, trigger: bool = True
+) -> None:
+    """Install server-side timestamp defaults on existing tables (idempotent).
+
+    Tables that do not exist yet are skipped; ``create_all`` gives them the
+    defaults. Only columns the database reports as nullable are backfilled,
+    so already-migrated tables are not scanned.
+    """
+    dialect_name = conn.dialect.name
+    inspector = inspect(conn)
+    if dialect_name == "postgresql" and trigger:
+        conn.execute(text(_POSTGRESQL_FUNCTION))
+    for table in timestamp_tables() if tables is None else tables:
+        if not inspector.has_table(table.name):
+            continue
+        nullable = tuple(
+            column["name"]
+            for column in inspector.get_columns(table.name)
+            if column["name"] in TIMESTAMP_COLUMNS and column["nullable"]
+        )
+        for statement in timestamp_defaults_ddl(dialect_name, table, nullable, trigger):
+            conn.execute(text(statement))
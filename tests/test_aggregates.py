@@ -0,0 +1,167 @@
+"""Gold fundraising aggregate refresh tests."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from fund_lens_models.base import Base
+from fund_lens_models.gold import (
+    GoldAggregateWatermark,
+    GoldCandidateCycleTotal,
+    GoldCommitteeCycleTotal,
+    GoldContribution,
+    GoldContributor,
+    GoldDailyContributionRollup,
+)
+from fund_lens_models.gold.aggregates import (
+    rebuild_daily_rollup,
+    refresh_daily_rollup,
+    refresh_fundraising_totals,
+)
+
+# No concurrent writers here; the bound sits past rows written this millisecond
+NO_LAG = timedelta(seconds=-1)
+
+
+def _contribution(
+    sub_id, amount, contributor_id, candidate_id=7, committee_id=3, day=date(2024, 3, 1), **extra
+):
+    return GoldContribution(
+        source_system="FEC",
+        source_sub_id=sub_id,
+        contribution_date=day,
+        amount=Decimal(amount),
+        contributor_id=contributor_id,
+        recipient_committee_id=committee_id,
+        recipient_candidate_id=candidate_id,
+        contribution_type="DIRECT",
+        election_year=2024,
+        election_cycle=2024,
+        **extra,
+    )
+
+
+def test_refresh_totals_incrementally():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                _contribution("1", "50.00", 1),
+                _contribution("2", "150.00", 1),
+                _contribution("3", "1000.00", 2),
+                _contribution("4", "50.00", 2, is_earmark_receipt=True),
+                _contribution("5", "25.00", 3, candidate_id=None, committee_id=4),
+            ]
+        )
+        session.flush()
+        result = refresh_fundraising_totals(session, safety_lag=NO_LAG)
+        session.commit()
+        assert result.groups_refreshed == {
+            "gold_candidate_cycle_total": 1,
+            "gold_committee_cycle_total": 2,
+        }
+
+        total = session.get(GoldCandidateCycleTotal, (7, 2024))
+        assert total.total_amount == Decimal("1200.00")
+        assert total.contribution_count == 3
+        assert total.unique_contributors == 2
+        assert (total.small_dollar_amount, total.small_dollar_count) == (Decimal("200.00"), 2)
+        assert (total.large_dollar_amount, total.large_dollar_count) == (Decimal("1000.00"), 1)
+
+        # Nothing changed: nothing is recomputed
+        assert refresh_fundraising_totals(session, safety_lag=NO_LAG).groups_refreshed == {
+            "gold_candidate_cycle_total": 0,
+            "gold_committee_cycle_total": 0,
+        }
+
+        # Only the touched committee group is refreshed; earmarking its only row removes it
+        pac = session.query(GoldContribution).filter_by(source_sub_id="5").one()
+        pac.is_earmark_receipt = True
+        session.add(_contribution("6", "10.00", 4))
+        session.flush()
+        # Changes newer than the safety lag wait for a later refresh
+        assert refresh_fundraising_totals(session).groups_refreshed == {
+            "gold_candidate_cycle_total": 0,
+            "gold_committee_cycle_total": 0,
+        }
+        result = refresh_fundraising_totals(session, safety_lag=NO_LAG)
+        session.commit()
+        assert result.groups_refreshed["gold_committee_cycle_total"] == 1
+        assert result.groups_removed["gold_committee_cycle_total"] == 1
+        assert session.get(GoldCommitteeCycleTotal, (4, 2024)) is None
+        session.expire_all()
+        total = session.get(GoldCandidateCycleTotal, (7, 2024))
+        assert total.unique_contributors == 3
+        assert total.total_amount == Decimal("1210.00")
+
+
+def test_daily_rollup_rebuild_and_refresh(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollup.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory.begin() as session:
+        session.add_all(
+            [
+                GoldContributor(id=1, name="DOE, JANE", state="MD"),
+                GoldContributor(id=2, name="ROE, RICK", state="VA"),
+                GoldContributor(id=3, name="UNKNOWN"),
+                _contribution("1", "50.00", 1),
+                _contribution("2", "25.00", 1),
+                _contribution("3", "100.00", 2),
+                _contribution("4", "10.00", 3, day=date(2024, 3, 20)),
+                _contribution("5", "99.00", 2, is_earmark_receipt=True),
+            ]
+        )
+
+    def buckets():
+        with session_factory() as session:
+            query = select(
+                GoldDailyContributionRollup.contribution_date,
+                GoldDailyContributionRollup.contributor_state,
+                GoldDailyContributionRollup.total_amount,
+                GoldDailyContributionRollup.contribution_count,
+            ).order_by(GoldDailyContributionRollup.contribution_date, "contributor_state")
+            return [tuple(row) for row in session.execute(query)]
+
+    expected = [
+        (date(2024, 3, 1), "MD", Decimal("75.00"), 2),
+        (date(2024, 3, 1), "VA", Decimal("100.00"), 1),
+        (date(2024, 3, 20), "", Decimal("10.00"), 1),
+    ]
+    assert refresh_daily_rollup(session_factory, window_days=3, safety_lag=NO_LAG) == 3
+    assert buckets() == expected
+
+    # Re-aggregating a range is idempotent
+    assert rebuild_daily_rollup(session_factory, date(2024, 3, 1), date(2024, 3, 31)) == 3
+    assert buckets() == expected
+
+    with session_factory.begin() as session:
+        session.add(_contribution("6", "5.00", 2, day=date(2024, 3, 20)))
+    assert refresh_daily_rollup(session_factory) == 0  # Newer than the safety lag
+    assert refresh_daily_rollup(session_factory, safety_lag=NO_LAG) == 2  # Only March 20 is rebuilt
+    assert buckets()[-1] == (date(2024, 3, 20), "VA", Decimal("5.00"), 1)
+
+    # A contributor moving state re-buckets their contributions
+    with session_factory.begin() as session:
+        session.get(GoldContributor, 3).state = "DC"
+    assert refresh_daily_rollup(session_factory) == 0
+    refresh_daily_rollup(session_factory, safety_lag=NO_LAG)
+    assert (date(2024, 3, 20), "DC", Decimal("10.00"), 1) in buckets()
+
+    # A contribution moving to another date leaves no stale bucket on the old date
+    with session_factory.begin() as session:
+        moved = session.query(GoldContribution).filter_by(source_sub_id="3").one()
+        moved.contribution_date = date(2024, 4, 15)
+    refresh_daily_rollup(session_factory, safety_lag=NO_LAG)
+    assert buckets() == [
+        (date(2024, 3, 1), "MD", Decimal("75.00"), 2),
+        (date(2024, 3, 20), "DC", Decimal("10.00"), 1),
+        (date(2024, 3, 20), "VA", Decimal("5.00"), 1),
+        (date(2024, 4, 15), "VA", Decimal("100.00"), 1),
+    ]
+
+    with session_factory() as session:
+        assert session.get(GoldAggregateWatermark, "gold_daily_contribution_rollup") is not None
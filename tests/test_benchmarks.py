@@ -0,0 +1,28 @@
+"""Benchmark suite smoke tests."""
+
+from benchmarks.suite import SCENARIOS, compare, run
+from benchmarks.synthetic import SyntheticDataset
+
+
+def test_synthetic_dataset_is_deterministic():
+    first, second = SyntheticDataset(500, seed=7), SyntheticDataset(500, seed=7)
+    assert list(first.fec_schedule_a(100)) == list(second.fec_schedule_a(100))
+    assert list(first.maryland_rows()) == list(second.maryland_rows())
+    assert list(first.maryland_rows()) != list(SyntheticDataset(500, seed=8).maryland_rows())
+
+    rows = [row for batch in first.fec_schedule_a(100) for row in batch]
+    assert len(rows) == 500
+    receipts = {row["transaction_id"] for row in rows if row["receipt_type"] == "15E"}
+    assert receipts
+    assert {row["transaction_id"][:-1] for row in rows if row["memo_code"] == "X"} == receipts
+
+
+def test_suite_runs_every_scenario():
+    results = run(None, scale=300, rounds=1, batch_size=100)
+    scenarios = results["scenarios"]
+    assert list(scenarios) == [scenario.name for scenario in SCENARIOS]
+    timed = {name: result for name, result in scenarios.items() if "skipped" not in result}
+    assert timed["bronze_fec_schedule_a_upsert"]["rows"] == 300
+    assert timed["silver_fec_transform"]["rows"] == 300
+    assert timed["gold_earmark_resolution"]["rows"] > 0
+    assert set(compare(results, results).values()) == {1.0}
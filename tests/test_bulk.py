@@ -0,0 +1,93 @@
+"""Bulk upsert loader tests (SQLite dialect)."""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, select
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze import BronzeFECScheduleA, BronzeMarylandContribution
+from fund_lens_models.bulk import bulk_upsert, upsert_fec_schedule_a
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        yield conn
+
+
+def _row(sub_id, amount):
+    return {
+        "sub_id": sub_id,
+        "source_system": "FEC_BULK",
+        "committee_id": "C00000001",
+        "contribution_receipt_amount": Decimal(amount),
+    }
+
+
+def test_upsert_counts_inserts_and_updates(connection):
+    result = upsert_fec_schedule_a(
+        connection, (_row(str(i), "10.00") for i in range(5)), batch_size=2
+    )
+    assert (result.inserted, result.updated) == (5, 0)
+    created = connection.execute(
+        select(BronzeFECScheduleA.created_at).where(BronzeFECScheduleA.sub_id == "1")
+    ).scalar_one()
+
+    result = upsert_fec_schedule_a(
+        connection, [_row("1", "25.00"), _row("1", "30.00"), _row("9", "5.00")]
+    )
+    assert (result.inserted, result.updated) == (1, 1)
+
+    amount, created_after = connection.execute(
+        select(BronzeFECScheduleA.contribution_receipt_amount, BronzeFECScheduleA.created_at).where(
+            BronzeFECScheduleA.sub_id == "1"
+        )
+    ).one()
+    assert amount == Decimal("30.00")
+    assert created_after == created
+
+
+def test_upsert_rejects_unknown_columns(connection):
+    with pytest.raises(ValueError, match="not_a_column"):
+        upsert_fec_schedule_a(connection, [{**_row("1", "1.00"), "not_a_column": 1}])
+
+
+def test_rows_with_fewer_keys_keep_stored_values(connection):
+    upsert_fec_schedule_a(connection, [{**_row("1", "10.00"), "contributor_city": "X"}])
+    result = upsert_fec_schedule_a(
+        connection,
+        [
+            {"sub_id": "1", "source_system": "FEC_BULK", "contributor_name": "A2"},
+            {**_row("2", "5.00"), "contributor_city": "Y"},
+        ],
+    )
+    assert (result.inserted, result.updated) == (1, 1)
+    name, city, amount = connection.execute(
+        select(
+            BronzeFECScheduleA.contributor_name,
+            BronzeFECScheduleA.contributor_city,
+            BronzeFECScheduleA.contribution_receipt_amount,
+        ).where(BronzeFECScheduleA.sub_id == "1")
+    ).one()
+    assert (name, city, amount) == ("A2", "X", Decimal("10.00"))
+
+
+def test_skipped_conflicts_are_not_updates(connection):
+    row = {
+        "content_hash": "a" * 64,
+        "source_system": "MARYLAND",
+        "contributor_name": "DOE, JANE",
+        "contribution_amount": "10.00",
+        "receiving_committee": "FRIENDS OF SMITH",
+        "filing_period": "2024 Annual",
+        "contribution_date": "01/02/2024",
+        "contribution_type": "Check",
+    }
+    key = ("content_hash",)
+    exclude = tuple(BronzeMarylandContribution.__table__.c.keys())
+    assert bulk_upsert(connection, BronzeMarylandContribution, [row], key).inserted == 1
+    result = bulk_upsert(connection, BronzeMarylandContribution, [row], key, update_exclude=exclude)
+    assert (result.inserted, result.updated) == (0, 0)
@@ -0,0 +1,127 @@
+"""COPY loader tests (SQLite executemany fallback, COPY encoding and merge SQL)."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze import (
+    BronzeFECCommittee,
+    BronzeFECScheduleA,
+    BronzeMarylandContribution,
+)
+from fund_lens_models.bronze.copy_load import (
+    _merge_statement,
+    copy_upsert,
+    encode_rows,
+    merge_key,
+)
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        yield conn
+
+
+def _row(sub_id, amount):
+    return {
+        "sub_id": sub_id,
+        "source_system": "FEC_BULK",
+        "committee_id": "C00000001",
+        "contribution_receipt_amount": Decimal(amount),
+    }
+
+
+def test_copy_upsert_fallback_merges_on_key(connection):
+    result = copy_upsert(
+        connection, BronzeFECScheduleA, (_row(str(i), "10.00") for i in range(5)), batch_size=2
+    )
+    assert (result.inserted, result.updated) == (5, 0)
+
+    result = copy_upsert(
+        connection, BronzeFECScheduleA, [_row("1", "25.00"), _row("1", "30.00"), _row("9", "5")]
+    )
+    assert (result.inserted, result.updated) == (1, 1)
+    amount, created = connection.execute(
+        select(BronzeFECScheduleA.contribution_receipt_amount, BronzeFECScheduleA.created_at).where(
+            BronzeFECScheduleA.sub_id == "1"
+        )
+    ).one()
+    assert amount == Decimal("30.00")
+    assert created is not None
+
+
+def _md_row(content_hash, name="A"):
+    return {
+        "content_hash": content_hash,
+        "source_system": "MARYLAND",
+        "receiving_committee": "FRIENDS OF A",
+        "filing_period": "2024 Annual",
+        "contribution_date": "01/15/2024",
+        "contributor_name": name,
+        "contribution_type": "Check",
+        "contribution_amount": "$50.00",
+    }
+
+
+def test_copy_upsert_content_hash_tables_are_insert_only(connection):
+    md = BronzeMarylandContribution
+    rows = [_md_row(f"h{i}") for i in range(3)]
+    assert copy_upsert(connection, md, rows).inserted == 3
+
+    result = copy_upsert(connection, md, [_md_row("h0", name="B"), _md_row("h9", name="B")])
+    assert (result.inserted, result.updated) == (1, 0)
+    names = connection.execute(select(md.contributor_name).order_by(md.content_hash)).scalars()
+    assert list(names) == ["A", "A", "A", "B"]
+
+
+def test_copy_upsert_rejects_bad_input(connection):
+    with pytest.raises(ValueError, match="not_a_column"):
+        copy_upsert(connection, BronzeFECScheduleA, [{**_row("1", "1"), "not_a_column": 1}])
+    with pytest.raises(ValueError, match="key columns"):
+        copy_upsert(connection, BronzeFECScheduleA, [{"committee_id": "C1"}])
+    assert copy_upsert(connection, BronzeFECScheduleA, []).total == 0
+
+
+def test_encode_rows_uses_copy_text_format():
+    table = BronzeFECScheduleA.__table__
+    row = {
+        "sub_id": "1",
+        "contributor_name": "SMITH\tJANE\\\n",
+        "contribution_receipt_date": date(2024, 3, 1),
+        "contribution_receipt_amount": Decimal("12.50"),
+        "raw_payload": {"memo": "a\tb"},
+    }
+    (line,) = encode_rows(table, [*row, "memo_text"], [row])
+    assert line == '1\tSMITH\\tJANE\\\\\\n\t2024-03-01\t12.50\t{"memo": "a\\\\tb"}\t\\N\n'
+
+
+def test_merge_statement_sql():
+    sql = str(
+        _merge_statement(
+            BronzeFECScheduleA, "_copy_t", ["sub_id", "committee_id"], ("sub_id",)
+        ).compile(dialect=postgresql.dialect())
+    )
+    assert "INSERT INTO bronze_fec_schedule_a (sub_id, committee_id) SELECT" in sql
+    assert "ON CONFLICT (sub_id) DO UPDATE SET committee_id = excluded.committee_id" in sql
+    assert "updated_at = CURRENT_TIMESTAMP" in sql
+    assert "count(*) FILTER (WHERE merged.inserted)" in sql
+
+
+def test_partitioned_merge_key():
+    key = merge_key(BronzeFECScheduleA, partitioned=True)
+    assert key == ("sub_id", "two_year_transaction_period")
+    sql = str(
+        _merge_statement(BronzeFECScheduleA, "_copy_t", [*key, "committee_id"], key).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "ON CONFLICT (sub_id, two_year_transaction_period) DO UPDATE" in sql
+    with pytest.raises(ValueError, match="not partitioned"):
+        merge_key(BronzeFECCommittee, partitioned=True)
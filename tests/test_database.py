@@ -0,0 +1,118 @@
+"""Engine registry and session helper tests."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select, text
+
+from fund_lens_models.base import Base
+from fund_lens_models.database import (
+    EngineOptions,
+    EngineRegistry,
+    adispose_all,
+    get_async_engine,
+    get_async_session,
+    get_session,
+    registry,
+)
+from fund_lens_models.gold import GoldCandidate
+from fund_lens_models.silver import SilverTransformWatermark
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'registry.db'}"
+
+
+def test_engine_is_shared_per_url_and_options(db_url):
+    reg = EngineRegistry()
+    try:
+        engine = reg.get_engine(db_url)
+        assert reg.get_engine(db_url) is engine
+        assert reg.get_session_factory(db_url) is reg.get_session_factory(db_url)
+        assert reg.get_engine(db_url, EngineOptions(pool_size=2)) is not engine
+    finally:
+        reg.clear()
+
+
+def test_pool_options_and_metrics(db_url):
+    reg = EngineRegistry()
+    try:
+        engine = reg.get_engine(db_url, EngineOptions(pool_size=3, max_overflow=1))
+        assert engine.pool.size() == 3
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        (row,) = reg.pool_metrics()
+        assert row["checkouts"] == 1
+        assert row["checkins"] == 1
+        assert row["connects"] == 1
+        assert "fund_lens_db_pool_checkouts{" in reg.render_prometheus()
+
+        reg.dispose_all(close=False)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert reg.pool_metrics()[0]["checkouts"] == 2
+    finally:
+        reg.clear()
+
+
+def test_get_session_reuses_engine(db_url):
+    try:
+        sessions = [next(get_session(db_url)) for _ in range(2)]
+        assert sessions[0].get_bind() is sessions[1].get_bind()
+    finally:
+        registry.clear()
+
+
+def test_async_session_roundtrip(tmp_path):
+    pytest.importorskip("aiosqlite")
+    url = f"sqlite+aiosqlite:///{tmp_path / 'async.db'}"
+
+    async def run():
+        engine = get_async_engine(url)
+        assert get_async_engine(url) is engine
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async for session in get_async_session(url):
+            session.add(GoldCandidate(name="Async Candidate", office="US_HOUSE", state="MD"))
+            await session.commit()
+
+        async for session in get_async_session(url):
+            result = await session.scalars(select(GoldCandidate.name))
+            names = result.all()
+        await adispose_all()
+        return names
+
+    try:
+        assert asyncio.run(run()) == ["Async Candidate"]
+    finally:
+        registry.clear()
+
+
+def test_async_timestamps_are_loaded_without_lazy_load(tmp_path):
+    pytest.importorskip("aiosqlite")
+    url = f"sqlite+aiosqlite:///{tmp_path / 'async.db'}"
+
+    async def run():
+        engine = get_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async for session in get_async_session(url):
+            watermark = SilverTransformWatermark(name="transform", rows_processed=0)
+            session.add(watermark)
+            await session.commit()
+            created = watermark.updated_at  # Server default, returned by the INSERT
+
+            watermark.rows_processed = 5
+            await session.commit()
+            updated = watermark.updated_at  # Refreshed by the UPDATE itself
+        await adispose_all()
+        return created, updated
+
+    try:
+        created, updated = asyncio.run(run())
+        assert created is not None and updated >= created
+    finally:
+        registry.clear()
@@ -0,0 +1,170 @@
+"""Contributor deduplication tests."""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.gold import GoldContributor, GoldContributorSource
+from fund_lens_models.gold.dedup import (
+    ContributorIdentity,
+    UnionFind,
+    _existing_identities,
+    deduplicate_contributors,
+    first_names_conflict,
+    score,
+    soundex,
+    split_name,
+)
+from fund_lens_models.silver import SilverFECContribution, SilverMarylandContribution
+
+
+def _fec(sub_id, name, zip5="21201", employer="ACME HOSPITAL", entity_type="IND"):
+    return SilverFECContribution(
+        source_sub_id=sub_id,
+        contribution_date=date(2024, 5, 1),
+        contribution_amount=Decimal("50.00"),
+        contributor_name=name,
+        contributor_city="BALTIMORE",
+        contributor_state="MD",
+        contributor_zip=zip5,
+        contributor_employer=employer,
+        contributor_occupation="NURSE",
+        entity_type=entity_type,
+        committee_id="C00000001",
+        election_cycle=2024,
+    )
+
+
+def _maryland(content_hash, name, zip_code="21201-4321"):
+    return SilverMarylandContribution(
+        source_content_hash=content_hash,
+        contribution_date=date(2024, 5, 1),
+        contribution_amount=Decimal("25.00"),
+        contribution_type="Check",
+        contributor_name=name,
+        contributor_type="Individual",
+        contributor_city="Baltimore",
+        contributor_state="MD",
+        contributor_zip=zip_code,
+        employer_name="Acme Hospital",
+        committee_name="Friends of Smith",
+        filing_period="2024 Pre-Primary",
+    )
+
+
+def test_name_helpers():
+    assert split_name("SMITH, JANE A. MRS.") == ("JANE", "SMITH")
+    assert split_name("Jane A Smith Jr") == ("JANE", "SMITH")
+    assert split_name("ignored", "Jane", "Smith") == ("JANE", "SMITH")
+    assert soundex("ROBERT") == soundex("RUPERT") == "R163"
+    assert soundex("ASHCRAFT") == "A261"
+
+
+def test_score_and_union_find():
+    jane = ContributorIdentity(
+        "SMITH, JANE", "JANE", "SMITH", "BALTIMORE", "MD", "21201", None, None, "INDIVIDUAL"
+    )
+    initial = ContributorIdentity(
+        "SMITH, J", "J", "SMITH", "BALTIMORE", "MD", "21201", None, None, "INDIVIDUAL"
+    )
+    john = ContributorIdentity(
+        "SMITH, JOHN", "JOHN", "SMITH", "BALTIMORE", "MD", "21201", None, None, "INDIVIDUAL"
+    )
+    assert score(jane, john) == 0.0
+    assert score(jane, initial) == 0.7
+    assert first_names_conflict(frozenset({"JOHN"}), frozenset({"JANE"}))
+    assert not first_names_conflict(frozenset({"JOHN"}), frozenset({"JO"}))
+    assert not first_names_conflict(frozenset(), frozenset({"JANE"}))
+
+    sets = UnionFind()
+    first, second, third = sets.add(anchor=1), sets.add(anchor=2), sets.add()
+    assert sets.union(third, first)
+    assert not sets.union(third, second)  # Both sides anchored
+    assert sets.anchor[sets.find(third)] == 1
+
+
+def test_deduplicate_then_incremental():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                _fec("1", "SMITH, JANE"),
+                _fec("2", "SMITH, JANE A."),
+                _fec("3", "SMITH, JANE", zip5="21202"),
+                _fec("4", "SMITH, JOHN"),
+                _fec("5", "ACME HOSPITAL PAC", employer=None, entity_type="PAC"),
+                _maryland("a" * 64, "Jane Smith"),
+            ]
+        )
+        session.flush()
+        result = deduplicate_contributors(session)
+        session.commit()
+
+        assert result.source_rows == 6
+        assert result.contributors_created == 3  # Jane, John, the PAC
+        mapping = dict(
+            session.execute(
+                select(GoldContributorSource.source_key, GoldContributorSource.contributor_id)
+            ).all()
+        )
+        assert mapping["1"] == mapping["2"] == mapping["3"] == mapping["a" * 64]
+        assert len({mapping["1"], mapping["4"], mapping["5"]}) == 3
+
+        # Only unmapped silver rows are read; they join existing clusters
+        session.add_all([_fec("6", "SMITH, JANE"), _fec("7", "DOE, RICHARD", zip5="20001")])
+        session.flush()
+        incremental = deduplicate_contributors(session)
+        session.commit()
+        assert incremental.source_rows == 2
+        assert incremental.matched_existing == 1
+        assert incremental.contributors_created == 1
+        jane = session.scalar(
+            select(GoldContributorSource.contributor_id).where(
+                GoldContributorSource.source_key == "6"
+            )
+        )
+        assert jane == mapping["1"]
+        assert session.query(GoldContributor).count() == 4
+
+        rebuilt = deduplicate_contributors(session, rebuild=True)
+        assert rebuilt.source_rows == 8
+        assert rebuilt.contributors_created == 4
+
+
+def test_initial_does_not_chain_full_first_names():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([_fec("1", "SMITH, JOHN"), _fec("2", "SMITH, J"), _fec("3", "SMITH, JANE")])
+        session.flush()
+        result = deduplicate_contributors(session)
+        assert result.contributors_created == 2  # J joins one of them, never both
+
+
+def test_incremental_loads_only_candidate_contributors():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                _fec("1", "SMITH, JANE"),
+                _fec("2", "DOE, RICHARD", zip5="20001"),
+                _fec("3", "ACME HOSPITAL PAC", employer=None, entity_type="PAC"),
+            ]
+        )
+        session.flush()
+        deduplicate_contributors(session)
+
+        jane = ContributorIdentity(
+            "SMITH, JANE", "JANE", "SMITH", None, "MD", "21201", None, None, "INDIVIDUAL"
+        )
+        org = ContributorIdentity(
+            "OTHER PAC", "", "OTHER PAC", None, "MD", "21201", None, None, "PAC"
+        )
+        # Doe shares neither a last name nor an organization name/ZIP, so it is not loaded
+        assert [i.name for i in _existing_identities(session, [jane])] == ["SMITH, JANE"]
+        assert [i.name for i in _existing_identities(session, [org])] == ["ACME HOSPITAL PAC"]
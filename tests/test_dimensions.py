@@ -0,0 +1,187 @@
+"""Integer-coded dimension tests (SQLite dialect)."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    exc,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import load_all_models
+from fund_lens_models.dimensions import (
+    DIMENSION_TABLES,
+    code_map,
+    coded_columns,
+    coded_columns_ddl,
+    install_dimensions,
+    sync_dimension,
+)
+from fund_lens_models.enums import ContributionType, Office, Party, SourceSystem
+from fund_lens_models.gold import (
+    GoldCandidate,
+    GoldCommittee,
+    GoldContribution,
+    GoldContributorSource,
+)
+
+
+def _contribution(sub_id: str, contribution_type: str | ContributionType) -> GoldContribution:
+    return GoldContribution(
+        source_system="FEC",
+        source_sub_id=sub_id,
+        contribution_date=date(2024, 5, 1),
+        amount=Decimal("10.00"),
+        contributor_id=1,
+        recipient_committee_id=1,
+        contribution_type=contribution_type,
+        election_year=2024,
+        election_cycle=2024,
+    )
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    load_all_models().create_all(engine)
+    return engine
+
+
+def test_codes_fit_smallint_and_lookup_tables_are_seeded(engine):
+    with engine.connect() as conn:
+        for enum_class, table in DIMENSION_TABLES.items():
+            codes = code_map(enum_class)
+            assert max(codes.values()) < 2**15
+            stored = dict(conn.execute(select(table.c.value, table.c.code)).tuples().all())
+            assert stored == codes
+
+
+def test_values_round_trip_as_strings_and_group_on_codes(engine):
+    with Session(engine) as session:
+        session.add_all(
+            [
+                _contribution("1", "DIRECT"),
+                _contribution("2", ContributionType.EARMARKED),
+                _contribution("3", "DIRECT"),
+            ]
+        )
+        session.commit()
+
+        stored = session.execute(text("SELECT DISTINCT contribution_type FROM gold_contribution"))
+        assert sorted(stored.scalars()) == [1, 2]
+
+        counts = session.execute(
+            select(GoldContribution.contribution_type, func.count())
+            .where(GoldContribution.source_system == SourceSystem.FEC)
+            .group_by(GoldContribution.contribution_type)
+        ).all()
+        assert dict(counts) == {"DIRECT": 2, "EARMARKED": 1}
+
+        loaded = session.scalars(select(GoldContribution).order_by(GoldContribution.id)).first()
+        assert loaded is not None
+        assert type(loaded.contribution_type) is str
+        assert loaded.contribution_type == "DIRECT"
+
+
+def test_source_values_are_aliased_or_fall_back(engine, caplog):
+    with Session(engine) as session:
+        candidate = GoldCandidate(name="Test Candidate", office=Office.HOUSE, party="Democratic")
+        session.add_all(
+            [
+                candidate,
+                GoldCommittee(name="PAC", committee_type="Q", party="Working Families"),
+                _contribution("1", "IND"),
+            ]
+        )
+        session.flush()
+        session.expire_all()
+        assert (candidate.office, candidate.party) == ("US_HOUSE", "DEM")
+        committee = session.scalars(select(GoldCommittee)).one()
+        assert (committee.committee_type, committee.party) == ("PAC", "OTH")
+        assert "'Working Families' as Party OTH" in caplog.text
+        assert session.scalars(select(GoldContribution.contribution_type)).one() == "DIRECT"
+
+
+def test_unknown_value_without_fallback_is_rejected(engine):
+    with Session(engine) as session:
+        contribution = _contribution("1", "DIRECT")
+        contribution.source_system = "MARYLAND"
+        session.add(contribution)
+        with pytest.raises(exc.StatementError, match="'MARYLAND' is not a SourceSystem value"):
+            session.flush()
+
+
+def test_sync_detects_reordered_codes(engine):
+    table = DIMENSION_TABLES[Party]
+    with engine.begin() as conn:
+        assert sync_dimension(conn, Party) == 0
+        conn.execute(table.delete().where(table.c.value == "UNK"))
+        assert sync_dimension(conn, Party) == 1
+
+        conn.execute(table.update().where(table.c.value == "DEM").values(value="DEMOCRAT"))
+        with pytest.raises(ValueError, match="only be appended"):
+            sync_dimension(conn, Party)
+
+
+def test_install_creates_lookup_tables_and_checks_values(caplog):
+    engine = create_engine("sqlite://")
+    # Tables as an older schema created them, with string columns
+    metadata = MetaData()
+    committees = Table(
+        "gold_committee",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("committee_type", String(50)),
+        Column("party", String(50)),
+    )
+    sources = Table(
+        "gold_contributor_source",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("source_system", String(50)),
+    )
+    tables = [GoldCommittee.__table__, GoldContributorSource.__table__]
+    with engine.begin() as conn:
+        metadata.create_all(conn)
+        conn.execute(insert(committees), [{"committee_type": "PAC", "party": "Whig"}])
+        conn.execute(insert(sources), [{"source_system": "MARYLAND"}])
+        with pytest.raises(
+            ValueError, match="'gold_contributor_source.source_system': \\['MARYLAND'\\]"
+        ):
+            install_dimensions(conn, tables)
+        assert conn.execute(select(func.count()).select_from(DIMENSION_TABLES[Party])).scalar()
+
+        conn.execute(sources.update().values(source_system="FEC"))
+        with pytest.raises(ValueError, match="not supported on sqlite"):
+            install_dimensions(conn, tables)
+        assert "'gold_committee.party': ['Whig']" in caplog.text
+
+
+def test_postgresql_ddl_converts_in_place():
+    table = GoldContribution.__table__
+    (statement,) = coded_columns_ddl("postgresql", table, ["source_system"])
+    assert statement.startswith("ALTER TABLE gold_contribution ALTER COLUMN source_system")
+    assert "TYPE smallint USING CASE WHEN source_system IS NULL THEN NULL" in statement
+    assert "WHEN upper(trim(source_system)) IN ('FEC') THEN 1" in statement
+    assert statement.split("ADD FOREIGN KEY")[0].endswith("ELSE NULL END, ")
+
+    (party,) = coded_columns_ddl("postgresql", GoldCommittee.__table__, ["party"])
+    assert "WHEN upper(trim(party)) IN ('DEM', 'DEMOCRATIC', 'DEMOCRAT') THEN 1" in party
+    assert "ELSE 8 END" in party  # OTH
+    assert "ADD FOREIGN KEY (source_system) REFERENCES dim_source_system (code)" in statement
+    assert {col.name for col in coded_columns([table])} == {
+        "source_system",
+        "contribution_type",
+        "election_type",
+    }
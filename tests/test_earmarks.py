@@ -0,0 +1,73 @@
+"""Set-based earmark pairing tests."""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze import BronzeFECScheduleA
+from fund_lens_models.gold import GoldCommittee, GoldContribution
+from fund_lens_models.gold.earmarks import resolve_earmarks
+
+
+def _gold(sub_id, transaction_id, committee_id=1, cycle=2024, contribution_type="EARMARKED"):
+    return GoldContribution(
+        source_system="FEC",
+        source_sub_id=sub_id,
+        source_transaction_id=transaction_id,
+        contribution_date=date(2024, 3, 1),
+        amount=Decimal("25.00"),
+        contributor_id=1,
+        recipient_committee_id=committee_id,
+        contribution_type=contribution_type,
+        election_year=cycle,
+        election_cycle=cycle,
+    )
+
+
+def test_resolve_earmarks_flags_receipts_and_conduits():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                GoldCommittee(
+                    id=99, name="ACTBLUE", committee_type="PAC", fec_committee_id="C00401224"
+                ),
+                BronzeFECScheduleA(sub_id="r1", source_system="FEC", other_id="C00401224"),
+                _gold("r1", "SA11AI_1"),
+                _gold("e1", "SA11AI_1E"),
+                _gold("r2", "SA11AI_2"),  # No earmark partner
+                _gold("e3", "SA11AI_3E"),  # No receipt
+                _gold("r4", "SA11AI_4", committee_id=2),  # Partner is on another committee
+                _gold("e4", "SA11AI_4E"),
+                _gold("r5", "SA11AI_5", cycle=2022),
+                _gold("e5", "SA11AI_5E", cycle=2022),
+                _gold("r6", "SA11AI_6", contribution_type="DIRECT"),  # Not an earmarked receipt
+                _gold("e6", "SA11AI_6E"),
+            ]
+        )
+        session.commit()
+
+        result = resolve_earmarks(session, 2024)
+        session.commit()
+        assert result.pairs == 1
+        assert result.receipts_flagged == 1
+        assert result.conduits_set == 2
+        assert result.unmatched_earmarks == 3
+
+        rows = {row.source_sub_id: row for row in session.scalars(select(GoldContribution)).all()}
+        assert rows["r1"].is_earmark_receipt and rows["r1"].conduit_committee_id == 99
+        assert not rows["e1"].is_earmark_receipt and rows["e1"].conduit_committee_id == 99
+        assert not rows["r2"].is_earmark_receipt
+        assert not rows["r6"].is_earmark_receipt
+        assert not rows["r5"].is_earmark_receipt  # Other cycle untouched
+
+        # Re-running is a no-op; removing the earmark unflags the receipt
+        again = resolve_earmarks(session, 2024)
+        assert (again.receipts_flagged, again.conduits_set) == (0, 0)
+        session.delete(rows["e1"])
+        session.flush()
+        assert resolve_earmarks(session, 2024).receipts_unflagged == 1
@@ -0,0 +1,103 @@
+"""Committee/candidate enrichment cache tests."""
+
+from datetime import timedelta
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze import BronzeFECCandidate, BronzeFECCommittee
+from fund_lens_models.silver.enrichment import CommitteeEnrichmentCache
+
+
+def test_enrich_and_incremental_refresh():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                BronzeFECCandidate(
+                    candidate_id="H4MD00001",
+                    name="SMITH, ANN",
+                    office="H",
+                    party="DEM",
+                    source_system="FEC",
+                ),
+                BronzeFECCandidate(
+                    candidate_id="S4MD00002",
+                    name="JONES, BO",
+                    office="S",
+                    party="REP",
+                    source_system="FEC",
+                ),
+                BronzeFECCommittee(
+                    committee_id="C00000001",
+                    name="SMITH FOR CONGRESS",
+                    committee_type="H",
+                    party="DEM",
+                    candidate_ids=["H4MD00001"],
+                    source_system="FEC",
+                ),
+                BronzeFECCommittee(
+                    committee_id="C00000002",
+                    name="SOME PAC",
+                    committee_type="Q",
+                    source_system="FEC",
+                ),
+            ]
+        )
+        session.commit()
+
+        cache = CommitteeEnrichmentCache.load(session, safety_lag=timedelta(0))
+        rows = cache.enrich(
+            [
+                {"committee_id": "C00000001", "candidate_id": None},
+                {"committee_id": "C00000002", "candidate_id": "S4MD00002"},
+                {"committee_id": "C99999999", "candidate_id": None},
+            ]
+        )
+        assert rows[0]["committee_name"] == "SMITH FOR CONGRESS"
+        assert rows[0]["candidate_id"] == "H4MD00001"
+        assert rows[0]["candidate_office"] == "H"
+        assert rows[1]["candidate_name"] == "JONES, BO"
+        assert rows[2]["candidate_name"] is None
+
+        session.get(BronzeFECCandidate, "H4MD00001").party = "IND"
+        session.commit()
+        assert cache.refresh(session) == (0, 1)
+        assert cache.get("C00000001").candidate_party == "IND"
+        assert cache.refresh(session) == (0, 0)
+
+
+def test_refresh_rereads_rows_committed_behind_the_mark():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                BronzeFECCandidate(
+                    candidate_id="H4MD00001", name="SMITH, ANN", party="DEM", source_system="FEC"
+                ),
+                BronzeFECCommittee(
+                    committee_id="C00000001",
+                    name="SMITH FOR CONGRESS",
+                    candidate_ids=["H4MD00001"],
+                    source_system="FEC",
+                ),
+            ]
+        )
+        session.commit()
+        cache = CommitteeEnrichmentCache.load(session)
+        unlagged = CommitteeEnrichmentCache.load(session, safety_lag=timedelta(0))
+
+        # A transaction that started before the load commits afterwards
+        session.execute(
+            update(BronzeFECCandidate).values(
+                party="IND", updated_at=cache.candidates_loaded_through - timedelta(seconds=1)
+            )
+        )
+        session.commit()
+        unlagged.refresh(session)
+        cache.refresh(session)
+        assert unlagged.get("C00000001").candidate_party == "DEM"
+        assert cache.get("C00000001").candidate_party == "IND"
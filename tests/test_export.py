@@ -0,0 +1,89 @@
+"""Columnar export tests."""
+
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.export import (
+    GOLD_CONTRIBUTIONS,
+    export_parquet,
+    iter_column_batches,
+    partitions_query,
+)
+from fund_lens_models.gold import GoldCommittee, GoldContribution, GoldContributor
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'export.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                GoldContributor(id=1, name="DOE, JANE", state="MD"),
+                GoldCommittee(id=1, name="FRIENDS OF DOE", committee_type="PAC"),
+                *(
+                    GoldContribution(
+                        source_system="FEC" if i % 3 else "MD_STATE",
+                        source_sub_id=str(i),
+                        contribution_date=date(cycle - 1, 6, 1),
+                        amount=Decimal("19.99") * (i + 1),
+                        contributor_id=1,
+                        recipient_committee_id=1,
+                        contribution_type="DIRECT",
+                        election_year=cycle,
+                        election_cycle=cycle,
+                    )
+                    for i, cycle in enumerate([2022, 2024] * 6)
+                ),
+            ]
+        )
+        session.commit()
+    engine.dispose()
+    return url
+
+
+def test_column_batches_without_orm_objects(database_url):
+    engine = create_engine(database_url)
+    with engine.connect() as conn:
+        partitions = list(conn.execute(partitions_query(GOLD_CONTRIBUTIONS, cycles=[2024])))
+        assert [tuple(row) for row in partitions] == [(2024, "FEC"), (2024, "MD_STATE")]
+        batches = list(iter_column_batches(conn, GOLD_CONTRIBUTIONS, (2024, "FEC"), batch_size=2))
+    names = [column.name for column in GOLD_CONTRIBUTIONS.data_columns]
+    assert [len(batch[0]) for batch in batches] == [2, 2]
+    cents = sorted(value for batch in batches for value in batch[names.index("amount_cents")])
+    assert cents == [3998, 11994, 15992, 23988]  # Exact integer cents
+    assert batches[0][names.index("committee_name")] == ("FRIENDS OF DOE",) * 2
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_export_parquet(database_url, tmp_path, processes):
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+
+    result = export_parquet(database_url, tmp_path / "out", batch_size=3, processes=processes)
+    assert result.rows == 12
+    assert len(result.partitions) == 4
+    assert result.partitions[0].path == (
+        tmp_path / "out" / "election_cycle=2022" / "source_system=FEC" / "part-0.parquet"
+    )
+
+    table = ds.dataset(tmp_path / "out", partitioning="hive").to_table()
+    assert table.num_rows == 12
+    assert (
+        str(table.schema.field("contributor_state").type)
+        == "dictionary<values=string, indices=int32, ordered=0>"
+    )
+    assert sorted(table.column("amount_cents").to_pylist())[:2] == [1999, 3998]
+
+
+def test_export_requires_pyarrow(database_url, tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match=r"fund-lens-models\[export\]"):
+        export_parquet(database_url, tmp_path / "out")
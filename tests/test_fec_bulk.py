@@ -0,0 +1,68 @@
+"""FEC bulk file parser tests."""
+
+import gzip
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, func, select
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze import BronzeFECCommittee, BronzeFECScheduleA
+from fund_lens_models.bronze.fec_bulk import iter_bulk_chunks, iter_bulk_records, load_bulk_file
+
+ITCONT = (
+    "C00401224|A|M3|P2024|202403209637384386|15E|IND|DOE, JANE|BALTIMORE|MD|212011234|"
+    "ACME|ENGINEER|02152024|25|C00694323|SA11AI_123|1793011|X|EARMARKED|4032020241940052651\n"
+    "C00401224|N|M3|P2024|202403209637384387|15|ORG|ACME PAC|BALTIMORE|MD|21201|||"
+    "13322024|100.50||SA11AI_124|1793011|||4032020241940052652\n"
+    "bad|line\n"
+)
+
+PAS2 = (
+    "C00000935|N|Q1|P2024|202404159640000001|24K|CCM|FRIENDS OF SMITH|ANYTOWN|MD|20850|||"
+    "03012024|5000|H4MD00001|H4MD00001|SB23_1|1800000|||4041520241940000001\n"
+)
+
+CM = "C00401224|ACTBLUE|SMITH, JOHN|PO BOX 1||SOMERVILLE|MA|02144|U|V|UNK|M|||\n"
+
+
+def test_contribution_records(tmp_path):
+    path = tmp_path / "itcont.txt.gz"
+    with gzip.open(path, "wt") as handle:
+        handle.write(ITCONT)
+
+    first, second = iter_bulk_records(path, "indiv", cycle=2024)
+    assert first["sub_id"] == "4032020241940052651"
+    assert first["contribution_receipt_date"] == date(2024, 2, 15)
+    assert first["contribution_receipt_amount"] == Decimal("25")
+    assert first["is_individual"] is True
+    assert first["other_id"] == "C00694323"
+    assert first["receipt_type"] == "15E"
+    assert first["two_year_transaction_period"] == 2024
+    assert second["is_individual"] is False
+    assert second["contribution_receipt_date"] is None  # invalid month
+    assert second["contributor_employer"] is None
+
+
+def test_pas2_candidate_and_chunks(tmp_path):
+    path = tmp_path / "itpas2.txt"
+    path.write_text(PAS2 * 5)
+    chunks = list(iter_bulk_chunks(path, "pas2", chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0][0]["candidate_id"] == "H4MD00001"
+    assert chunks[0][0]["transaction_id"] == "SB23_1"
+
+
+def test_load_bulk_file(tmp_path):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    (tmp_path / "itcont.txt").write_text(ITCONT)
+    (tmp_path / "cm.txt").write_text(CM)
+    with engine.begin() as conn:
+        result = load_bulk_file(conn, tmp_path / "itcont.txt", "indiv", cycle=2024)
+        assert result.inserted == 2
+        load_bulk_file(conn, tmp_path / "cm.txt", "cm", cycle=2024)
+        assert conn.execute(select(func.count()).select_from(BronzeFECScheduleA)).scalar() == 2
+        committee = conn.execute(select(BronzeFECCommittee)).one()
+        assert committee.name == "ACTBLUE"
+        assert committee.cycles == [2024]
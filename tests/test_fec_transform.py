@@ -0,0 +1,67 @@
+"""Incremental bronze -> silver FEC transform tests."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from fund_lens_models.base import Base
+from fund_lens_models.bulk import upsert_fec_schedule_a
+from fund_lens_models.silver import SilverFECContribution
+from fund_lens_models.silver.fec_transform import transform_fec_contributions
+
+# No concurrent bronze writers here; the bound sits past rows loaded this millisecond
+NO_LAG = timedelta(seconds=-1)
+
+
+def _bronze(sub_id, name="DOE, JANE", amount="50.00"):
+    return {
+        "sub_id": sub_id,
+        "source_system": "FEC",
+        "committee_id": "C00000001",
+        "contributor_name": name,
+        "contributor_zip": "21201-1234",
+        "contribution_receipt_date": date(2024, 5, 1),
+        "contribution_receipt_amount": Decimal(amount),
+        "two_year_transaction_period": 2024,
+    }
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'transform.db'}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def test_transform_only_reads_rows_past_watermark(session_factory):
+    with session_factory.begin() as session:
+        upsert_fec_schedule_a(
+            session, [_bronze(str(i)) for i in range(5)] + [_bronze("x", name=None)]
+        )
+
+    # Rows newer than the default lag may belong to transactions still in flight
+    assert transform_fec_contributions(session_factory).rows_read == 0
+
+    result = transform_fec_contributions(session_factory, chunk_size=2, safety_lag=NO_LAG)
+    assert (result.rows_read, result.rows_rejected, result.inserted) == (6, 1, 5)
+    assert result.chunks == 3
+
+    assert transform_fec_contributions(session_factory, safety_lag=NO_LAG).rows_read == 0
+
+    with session_factory.begin() as session:
+        upsert_fec_schedule_a(session, [_bronze("3", amount="75.00")])
+    result = transform_fec_contributions(session_factory, safety_lag=NO_LAG)
+    assert (result.rows_read, result.inserted, result.updated) == (1, 0, 1)
+
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(SilverFECContribution)) == 5
+        row = session.scalars(
+            select(SilverFECContribution).where(SilverFECContribution.source_sub_id == "3")
+        ).one()
+        assert row.contribution_amount == Decimal("75.00")
+        assert row.contributor_zip == "21201"
+        assert row.contributor_employer == "NOT PROVIDED"
+        assert row.election_cycle == 2024
@@ -0,0 +1,61 @@
+"""Maryland content hash and dedupe tests."""
+
+import io
+
+import pytest
+from sqlalchemy import create_engine
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze import BronzeMarylandContribution
+from fund_lens_models.bronze.hashing import (
+    HashBloomFilter,
+    compute_content_hash,
+    filter_new_rows,
+    iter_hashed_csv,
+)
+
+CSV = (
+    "Receiving Committee,Filing Period,Contribution Date,Contributor Name,Contributor Address,"
+    "Contributor Type,Contribution Type,Contribution Amount,Employer Name,Employer Occupation,"
+    "Office,Fund Type\n"
+    "Friends of Smith,2024 Annual,01/15/2024,Jane Doe,1 Main St  Baltimore  MD 21201,"
+    "Individual,Check,$100.00,,,Governor (SBE),Electoral\n"
+    "Friends of Smith,2024 Annual,01/16/2024,John Roe,2 Main St  Baltimore  MD 21201,"
+    "Individual,Check,$50.00,,,Governor (SBE),Electoral\n"
+)
+
+
+def test_hash_is_normalized_and_stable():
+    row = {"receiving_committee": "Friends  of Smith ", "contributor_name": "jane doe"}
+    same = {"receiving_committee": "FRIENDS OF SMITH", "contributor_name": "Jane Doe"}
+    assert compute_content_hash(BronzeMarylandContribution, row) == compute_content_hash(
+        BronzeMarylandContribution, same
+    )
+    assert len(compute_content_hash(BronzeMarylandContribution, row)) == 64
+
+
+@pytest.mark.parametrize("use_bloom", [False, True])
+def test_filter_new_rows_against_table(tmp_path, use_bloom):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    (chunk,) = iter_hashed_csv(io.StringIO(CSV))
+    assert chunk[0]["contribution_amount"] == "$100.00"
+
+    with engine.begin() as conn:
+        bloom = (
+            HashBloomFilter.build(conn, BronzeMarylandContribution, tmp_path / "md.bloom")
+            if use_bloom
+            else None
+        )
+        first = filter_new_rows(conn, BronzeMarylandContribution, chunk[:1] * 2, bloom=bloom)
+        assert len(first) == 1
+        conn.execute(
+            BronzeMarylandContribution.__table__.insert(),
+            [{**row, "source_system": "MD"} for row in first],
+        )
+        (second,) = iter_hashed_csv(io.StringIO(CSV))
+        remaining = filter_new_rows(conn, BronzeMarylandContribution, second, bloom=bloom)
+        assert [row["contributor_name"] for row in remaining] == ["John Roe"]
+        if bloom is not None:
+            assert first[0]["content_hash"] in bloom
+            bloom.close()
@@ -0,0 +1,43 @@
+"""Workload index set tests for gold_contribution."""
+
+from sqlalchemy import create_engine, func, select, text
+
+from fund_lens_models.base import Base
+from fund_lens_models.gold import GoldContribution
+from fund_lens_models.gold.earmarks import earmark_pairs
+
+
+def test_no_redundant_single_column_indexes():
+    indexed = {
+        tuple(column.name for column in index.columns)
+        for index in GoldContribution.__table__.indexes
+    }
+    for column in ("source_system", "is_earmark_receipt", "contribution_type", "election_cycle"):
+        assert (column,) not in indexed
+    assert ("recipient_candidate_id", "election_cycle") in indexed
+    assert ("election_cycle", "source_system") in indexed
+
+
+def _plan(query):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        compiled = query.compile(conn, compile_kwargs={"literal_binds": True})
+        return " ".join(
+            str(row[-1]) for row in conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        )
+
+
+def test_candidate_totals_use_partial_index():
+    gold = GoldContribution
+    query = select(func.sum(gold.amount)).where(
+        gold.recipient_candidate_id == 1, gold.election_cycle == 2024, ~gold.is_earmark_receipt
+    )
+    assert "ix_gold_contribution_candidate_cycle" in _plan(query)
+
+
+def test_cycle_scans_use_cycle_source_index():
+    gold = GoldContribution
+    query = select(gold.id).where(gold.election_cycle == 2024, gold.source_system == "FEC")
+    assert "ix_gold_contribution_cycle_source" in _plan(query)
+    assert "ix_gold_contribution_cycle_source" in _plan(earmark_pairs(2024))
@@ -0,0 +1,134 @@
+"""Query instrumentation tests."""
+
+import logging
+import subprocess
+import sys
+
+from sqlalchemy import create_engine, select, text, update
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.database import EngineOptions, EngineRegistry
+from fund_lens_models.gold import GoldCommittee, GoldContributor
+from fund_lens_models.instrumentation import (
+    QueryInstrumentation,
+    normalize_statement,
+    query_metrics,
+    statement_tables,
+)
+
+
+def test_normalize_statement():
+    a = normalize_statement("SELECT * FROM t WHERE id IN (?, ?, ?) AND name = 'x'")
+    b = normalize_statement("SELECT *\n  FROM t WHERE id IN (%(p1)s, %(p2)s) AND name = 'it''s'")
+    assert a == b == "SELECT * FROM t WHERE id IN (?...) AND name = ?"
+    assert normalize_statement("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4)") == (
+        "INSERT INTO t (a, b) VALUES (?...)"
+    )
+    assert normalize_statement("SELECT x::text FROM t LIMIT 10") == "SELECT x::text FROM t LIMIT ?"
+    assert statement_tables(
+        "SELECT * FROM gold_contribution JOIN public.gold_committee ON x UPDATE y"
+    ) == ("gold_contribution", "gold_committee", "y")
+
+
+def test_records_statements_and_slow_queries(caplog):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    metrics = QueryInstrumentation(slow_query_threshold=0.0, explain_interval=3600)
+    metrics.attach(engine)
+    metrics.attach(engine)  # Idempotent
+    with (
+        caplog.at_level(logging.WARNING, "fund_lens_models.instrumentation"),
+        Session(engine) as session,
+    ):
+        session.add_all(GoldContributor(name=f"DONOR {i}") for i in range(3))
+        session.flush()
+        session.execute(update(GoldContributor).values(city="BALTIMORE"))
+        for i in range(1, 4):
+            session.execute(select(GoldContributor).where(GoldContributor.id == i)).all()
+        session.execute(select(GoldCommittee).where(GoldCommittee.id.in_([1, 2, 3]))).all()
+        session.execute(select(GoldCommittee).where(GoldCommittee.id.in_([1, 2]))).all()
+        try:
+            session.execute(text("SELECT * FROM no_such_table"))
+        except Exception:
+            session.rollback()
+
+    snapshot = {row["statement"]: row for row in metrics.snapshot()}
+    by_id = next(
+        row for row in snapshot.values() if row["statement"].startswith("SELECT gold_contributor")
+    )
+    assert by_id["calls"] == 3
+    assert by_id["models"] == ["GoldContributor"]
+    assert by_id["histogram"][float("inf")] == 3
+    assert "SEARCH gold_contributor" in by_id["last_plan"]
+    in_list = next(
+        row for row in snapshot.values() if "gold_committee.id IN (?...)" in row["statement"]
+    )
+    assert in_list["calls"] == 2
+    assert snapshot["SELECT * FROM no_such_table"]["errors"] == 1
+    updates = [row for row in snapshot.values() if row["operation"] == "UPDATE"]
+    assert [row["rows"] for row in updates] == [3]
+
+    # EXPLAIN runs once per statement per interval; every slow call is logged
+    assert sum("Slow query" in record.message for record in caplog.records) >= 5
+    assert sum("SEARCH gold_contributor" in record.message for record in caplog.records) == 1
+
+    prometheus = metrics.render_prometheus()
+    assert f'fund_lens_db_query_duration_seconds_count{{statement_id="{by_id["id"]}"' in prometheus
+    assert 'le="+Inf"' in prometheus
+
+    metrics.detach(engine)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert "SELECT ?" not in {row["statement"] for row in metrics.snapshot()}
+
+
+def test_registry_option_attaches_shared_metrics(tmp_path):
+    reg = EngineRegistry()
+    query_metrics.reset()
+    try:
+        engine = reg.get_engine(
+            f"sqlite:///{tmp_path / 'db.sqlite'}", EngineOptions(instrument_queries=True)
+        )
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 42"))
+        assert any(row["statement"] == "SELECT ?" for row in query_metrics.snapshot())
+    finally:
+        query_metrics.detach(engine)
+        query_metrics.reset()
+        reg.clear()
+
+
+def test_statement_cap():
+    engine = create_engine("sqlite://")
+    metrics = QueryInstrumentation(slow_query_threshold=None, max_statements=2)
+    metrics.attach(engine)
+    with engine.connect() as conn:
+        for column in ("a", "b", "c", "d"):
+            conn.execute(text(f"SELECT 1 AS {column}"))
+    statements = [row["statement"] for row in metrics.snapshot()]
+    assert len(statements) == 3
+    assert "<other>" in statements
+
+
+def test_models_imported_later_are_attributed():
+    # Fresh interpreter, Core statements: mapper configuration never loads every model
+    code = """
+from sqlalchemy import create_engine
+from fund_lens_models.bronze import BronzeFECScheduleA
+from fund_lens_models.instrumentation import QueryInstrumentation
+engine = create_engine("sqlite://")
+BronzeFECScheduleA.__table__.create(engine)
+metrics = QueryInstrumentation()
+metrics.attach(engine)
+with engine.connect() as conn:
+    conn.execute(BronzeFECScheduleA.__table__.select()).all()
+    from fund_lens_models.gold import GoldContribution
+    GoldContribution.__table__.create(conn, checkfirst=False)
+    conn.execute(GoldContribution.__table__.select()).all()
+print(sorted(model for s in metrics.snapshot() for model in s["models"]))
+"""
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert "GoldContribution" in completed.stdout
@@ -0,0 +1,73 @@
+"""Lazy submodule loading tests (run in fresh interpreters)."""
+
+import subprocess
+import sys
+
+import pytest
+
+import fund_lens_models
+from fund_lens_models import bronze, gold, silver
+from fund_lens_models.base import MODEL_MODULES
+
+
+def _run(code: str) -> str:
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.strip()
+
+
+def test_package_import_loads_nothing():
+    loaded = _run(
+        "import sys, fund_lens_models; "
+        "print(sorted(m for m in sys.modules if m.startswith(('fund_lens_models.', 'sqlalchemy'))))"
+    )
+    assert loaded == "[]"
+
+
+def test_subpackage_loads_only_its_models():
+    loaded = _run(
+        "import sys; from fund_lens_models.gold import GoldContribution; "
+        "print(sorted(m for m in sys.modules if m.startswith('fund_lens_models.')))"
+    )
+    assert loaded == str(
+        [
+            "fund_lens_models.base",
+            "fund_lens_models.dimensions",
+            "fund_lens_models.enums",
+            "fund_lens_models.gold",
+            "fund_lens_models.gold.models",
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "from fund_lens_models import Base",
+        "from fund_lens_models.base import load_all_models; load_all_models()",
+        "from fund_lens_models.gold import GoldContribution\n"
+        "from sqlalchemy.orm import configure_mappers; configure_mappers()",
+    ],
+)
+def test_metadata_is_complete(code):
+    tables = _run(
+        f"{code}\nfrom fund_lens_models.base import Base; print(len(Base.metadata.tables))"
+    )
+    expected = _run(
+        "import importlib; from fund_lens_models.base import Base, MODEL_MODULES\n"
+        "for module in MODEL_MODULES: importlib.import_module(module)\n"
+        "print(len(Base.metadata.tables))"
+    )
+    assert tables == expected
+
+
+def test_public_names_unchanged():
+    assert fund_lens_models.Base.metadata.tables
+    assert {"Base", "USState", "Office", "bronze", "silver", "gold"} <= set(dir(fund_lens_models))
+    for package in (bronze, silver, gold):
+        for name in package.__all__:
+            assert getattr(package, name).__module__ in MODEL_MODULES
+            assert name in dir(package)
+    with pytest.raises(AttributeError):
+        gold.Missing  # noqa: B018
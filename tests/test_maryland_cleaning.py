@@ -0,0 +1,82 @@
+"""Maryland contribution cleaning tests."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from fund_lens_models.silver.maryland_cleaning import (
+    clean_contributions,
+    parse_address,
+    parse_amount,
+    parse_date,
+    to_columns,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("01/15/2024", date(2024, 1, 15)),
+        ("1/5/2024", date(2024, 1, 5)),
+        ("2024-01-15 00:00:00", date(2024, 1, 15)),
+        ("02/30/2024", None),
+        ("soon", None),
+    ],
+)
+def test_parse_date(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("$1,250.00", Decimal("1250.00")),
+        ("25", Decimal("25.00")),
+        ("(40.50)", Decimal("-40.50")),
+        ("-$3.5", Decimal("-3.50")),
+        ("N/A", None),
+    ],
+)
+def test_parse_amount(value, expected):
+    assert parse_amount(value) == expected
+
+
+def test_parse_address():
+    assert parse_address("6406 Elm St  Chevy Chase  MD 20815") == ("Chevy Chase", "MD", "20815")
+    assert parse_address("1 Main St, Baltimore, MD 21201-1234") == ("Baltimore", "MD", "21201")
+    assert parse_address("PO Box 9  XX 12345") == (None, None, "12345")
+    assert parse_address("no address") == (None, None, None)
+
+
+def test_clean_contributions_splits_rows_and_rejects():
+    base = {
+        "receiving_committee": "Friends of Smith",
+        "filing_period": "2024 Annual",
+        "contribution_type": "Check",
+        "contributor_name": "Jane Doe",
+        "contributor_address": "1 Main St  Baltimore  MD 21201",
+        "contributor_type": None,
+    }
+    rows = [
+        {
+            **base,
+            "content_hash": "a",
+            "contribution_date": "01/15/2024",
+            "contribution_amount": "$100.00",
+        },
+        {**base, "content_hash": "b", "contribution_date": "bad", "contribution_amount": "oops"},
+    ]
+    result = clean_contributions(to_columns(rows))
+    (row,) = result.rows
+    assert row["source_content_hash"] == "a"
+    assert row["contribution_amount"] == Decimal("100.00")
+    assert (row["contributor_city"], row["contributor_state"], row["contributor_zip"]) == (
+        "Baltimore",
+        "MD",
+        "21201",
+    )
+    assert row["contributor_type"] == "Unknown"
+    (reject,) = result.rejects
+    assert reject["content_hash"] == "b"
+    assert reject["reasons"] == ["invalid contribution_date", "invalid contribution_amount"]
@@ -0,0 +1,78 @@
+"""Keyset pagination tests."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.gold import GoldContribution
+from fund_lens_models.pagination import decode_cursor, iter_keyset, paginate
+
+ORDER = (GoldContribution.contribution_date, GoldContribution.id)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            GoldContribution(
+                id=i + 1,
+                source_system="FEC",
+                source_sub_id=str(i),
+                contribution_date=date(2024, 1, 1) + timedelta(days=i // 3),
+                amount=Decimal("10.00"),
+                contributor_id=1,
+                recipient_committee_id=1 + i % 2,
+                contribution_type="DIRECT",
+                election_year=2024,
+                election_cycle=2024,
+            )
+            for i in range(10)
+        )
+        session.commit()
+        yield session
+
+
+def test_paginate_walks_all_pages(session):
+    seen, cursor = [], None
+    while True:
+        page = paginate(session, GoldContribution, ORDER, cursor=cursor, limit=4)
+        seen.extend(item.id for item in page.items)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+    assert seen == list(range(1, 11))
+
+    newest = paginate(session, GoldContribution, ORDER, limit=3, descending=True)
+    assert [item.id for item in newest.items] == [10, 9, 8]
+    older = paginate(
+        session, GoldContribution, ORDER, cursor=newest.next_cursor, limit=3, descending=True
+    )
+    assert [item.id for item in older.items] == [7, 6, 5]
+
+
+def test_cursor_is_validated(session):
+    page = paginate(session, GoldContribution, ORDER, limit=2)
+    assert decode_cursor(ORDER, page.next_cursor) == [date(2024, 1, 1), 2]
+    with pytest.raises(ValueError, match="ordering"):
+        paginate(session, GoldContribution, (GoldContribution.id,), cursor=page.next_cursor)
+    with pytest.raises(ValueError, match="Invalid"):
+        paginate(session, GoldContribution, ORDER, cursor="not-a-cursor")
+
+
+def test_iter_keyset_with_filters(session):
+    items = list(
+        iter_keyset(
+            session,
+            GoldContribution,
+            ORDER,
+            filters=[GoldContribution.recipient_committee_id == 1],
+            chunk_size=2,
+        )
+    )
+    assert [item.id for item in items] == [1, 3, 5, 7, 9]
@@ -0,0 +1,54 @@
+"""Partition DDL generation tests (compiled for PostgreSQL, no server needed)."""
+
+from datetime import date
+
+import pytest
+
+from fund_lens_models.bronze import BronzeFECScheduleA
+from fund_lens_models.gold import GoldContribution
+from fund_lens_models.partitioning import (
+    cycle_bounds,
+    cycle_for,
+    partition_ddl,
+    partitioned_ddl,
+    partitioned_table,
+)
+
+
+def test_partition_key_joins_primary_and_unique_keys():
+    table = partitioned_table(GoldContribution)
+    assert [c.name for c in table.primary_key.columns] == ["id", "election_cycle"]
+    (create_table, *indexes) = partitioned_ddl(GoldContribution)
+    assert "PARTITION BY RANGE (election_cycle)" in create_table
+    assert (
+        "uq_source_transaction UNIQUE (source_system, source_sub_id, election_cycle)"
+        in create_table
+    )
+    assert any(
+        "ix_gold_contribution_candidate_cycle" in ddl and "WHERE NOT is_earmark_receipt" in ddl
+        for ddl in indexes
+    )
+
+    # The dim_* lookup foreign keys carry over, with their targets in the copy's metadata
+    references = {
+        (fk.parent.name, fk.target_fullname) for fk in GoldContribution.__table__.foreign_keys
+    }
+    assert len(references) == 3
+    assert {(fk.parent.name, fk.target_fullname) for fk in table.foreign_keys} == references
+    assert {fk.column.table.metadata for fk in table.foreign_keys} == {table.metadata}
+    assert "FOREIGN KEY(source_system) REFERENCES dim_source_system (code)" in create_table
+
+    bronze = partitioned_table(BronzeFECScheduleA)
+    assert not bronze.c.two_year_transaction_period.nullable
+    assert BronzeFECScheduleA.__table__.c.two_year_transaction_period.nullable
+
+
+def test_cycle_partitions():
+    assert cycle_for(date(2025, 3, 1)) == 2026
+    assert cycle_bounds(2024) == (2023, 2025)
+    with pytest.raises(ValueError):
+        cycle_bounds(2023)
+    assert partition_ddl(BronzeFECScheduleA, 2026) == (
+        "CREATE TABLE IF NOT EXISTS bronze_fec_schedule_a_2026 PARTITION OF "
+        "bronze_fec_schedule_a FOR VALUES FROM (2025) TO (2027)"
+    )
@@ -0,0 +1,175 @@
+"""Raw payload storage tests (SQLite: zstd-compressed JSON)."""
+
+import json
+import sys
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.exc import StatementError
+from sqlalchemy.orm import Session
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze import BronzeFECCommittee, BronzeFECScheduleA
+from fund_lens_models.bronze.raw_payload import (
+    ABSENT_KEY,
+    migrate_raw_json,
+    pack_raw_json,
+    unpack_raw_json,
+)
+from fund_lens_models.bulk import upsert_fec_schedule_a
+
+DOCUMENT = {
+    "committee_id": "C00000001",
+    "name": "FRIENDS OF SMITH",
+    "state": "MD",
+    "is_active": True,
+    "cycles": [2022, 2024],
+    "first_file_date": "2020-01-15",  # Date column: kept as the original string
+    "treasurer_name": None,
+    "sponsor_candidate_list": [{"candidate_id": "H0MD01001"}],
+}
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_pack_drops_typed_keys_and_unpack_restores():
+    table = BronzeFECCommittee.__table__
+    values = {**DOCUMENT, "state": "DC", "city": "BALTIMORE", "is_active": 1}
+    payload = pack_raw_json(table, DOCUMENT, values)
+    assert payload == {
+        "state": "MD",  # differs from the typed column
+        "is_active": True,  # 1 is not True
+        "first_file_date": "2020-01-15",
+        "treasurer_name": None,
+        "sponsor_candidate_list": [{"candidate_id": "H0MD01001"}],
+        ABSENT_KEY: ["city"],
+    }
+    assert unpack_raw_json(table, payload, values) == DOCUMENT
+    assert pack_raw_json(table, None, values) is None
+
+
+@pytest.fixture
+def compact(monkeypatch):
+    for model in (BronzeFECCommittee, BronzeFECScheduleA):
+        monkeypatch.setattr(model, "compact_raw_json", True)
+
+
+def _committee(**fields):
+    values = {
+        "committee_id": "C00000001",
+        "name": "FRIENDS OF SMITH",
+        "state": "MD",
+        "is_active": True,
+        "cycles": [2022, 2024],
+        "source_system": "FEC",
+    }
+    return BronzeFECCommittee(**{**values, **fields})
+
+
+def test_raw_json_is_stored_as_is_by_default(engine, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)  # Not needed by default
+    with Session(engine) as session:
+        session.add(_committee(raw_json=DOCUMENT))
+        session.commit()
+        session.expunge_all()
+
+        committee = session.get(BronzeFECCommittee, "C00000001")
+        assert committee.raw_json == committee.raw_document == DOCUMENT
+        assert committee.raw_payload is None
+
+
+def test_compact_orm_round_trip(engine, compact):
+    with Session(engine) as session:
+        session.add(_committee(raw_document=DOCUMENT))
+        session.commit()
+        session.expunge_all()
+
+        committee = session.get(BronzeFECCommittee, "C00000001")
+        assert committee.raw_document == DOCUMENT
+        assert committee.raw_json is None
+        assert "name" not in committee.raw_payload
+        stored = session.execute(text("SELECT raw_payload FROM bronze_fec_committee")).scalar()
+        assert isinstance(stored, bytes) and b"FRIENDS" not in stored
+
+        # In SQL the hybrid is the stored remainder
+        assert session.scalars(select(BronzeFECCommittee.raw_document)).one() == (
+            committee.raw_payload
+        )
+
+        # Rebuilt from the current typed columns, so a correction shows through
+        committee.name = "FRIENDS OF JANE SMITH"
+        assert committee.raw_document["name"] == "FRIENDS OF JANE SMITH"
+
+        # raw_json assigned directly is compacted too
+        session.add(_committee(committee_id="C00000002", raw_json=DOCUMENT))
+        session.flush()
+        other = session.get(BronzeFECCommittee, "C00000002")
+        assert other.raw_json is None
+        assert other.raw_document == DOCUMENT
+        assert other.raw_payload["committee_id"] == "C00000001"  # Differs from the row
+
+
+def test_bulk_loader_packs_raw_json_only_when_compact(engine, monkeypatch):
+    document = {"sub_id": "1", "committee_id": "C00000001", "receipt_type": "15"}
+    row = {"sub_id": "1", "committee_id": "C00000001", "raw_json": document, "source_system": "FEC"}
+    with engine.begin() as conn:
+        upsert_fec_schedule_a(conn, [row])
+    with Session(engine) as session:
+        stored = session.get(BronzeFECScheduleA, "1")
+        assert (stored.raw_json, stored.raw_payload) == (document, None)
+
+    monkeypatch.setattr(BronzeFECScheduleA, "compact_raw_json", True)
+    with engine.begin() as conn:
+        upsert_fec_schedule_a(conn, [row])
+    with Session(engine) as session:
+        stored = session.get(BronzeFECScheduleA, "1")
+        assert stored.raw_payload == {"receipt_type": "15"}
+        assert stored.raw_document == document
+
+
+def test_migrate_raw_json(engine, compact):
+    with engine.begin() as conn:
+        for index in range(3):
+            conn.execute(
+                text(
+                    "INSERT INTO bronze_fec_committee "
+                    "(committee_id, name, source_system, raw_json) VALUES (:id, :name, 'FEC', :doc)"
+                ),
+                {
+                    "id": f"C{index}",
+                    "name": "PAC",
+                    "doc": json.dumps({"name": "PAC", "party": "X"}),
+                },
+            )
+        # Explicit JSON null, as mapped_column(JSON) stores raw_json=None
+        conn.execute(
+            text(
+                "INSERT INTO bronze_fec_committee "
+                "(committee_id, name, source_system, raw_json) VALUES ('C9', 'PAC', 'FEC', 'null')"
+            )
+        )
+        assert migrate_raw_json(conn, BronzeFECCommittee, batch_size=2) == 4
+        assert migrate_raw_json(conn, BronzeFECCommittee) == 0
+
+    with Session(engine) as session:
+        committee = session.get(BronzeFECCommittee, "C1")
+        # The legacy document had no committee_id key, so it is not added back
+        assert committee.raw_payload == {"party": "X", ABSENT_KEY: ["committee_id"]}
+        assert committee.raw_json is None
+        assert committee.raw_document == {"name": "PAC", "party": "X"}
+        assert session.get(BronzeFECCommittee, "C9").raw_document is None
+
+
+def test_missing_zstandard(engine, compact, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with (
+        pytest.raises(StatementError, match=r"fund-lens-models\[compression\]"),
+        Session(engine) as session,
+    ):
+        session.add(BronzeFECCommittee(committee_id="C1", source_system="FEC", raw_document={}))
+        session.commit()
@@ -0,0 +1,78 @@
+"""Name search tests."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from fund_lens_models import search
+from fund_lens_models.base import Base
+from fund_lens_models.gold import GoldContributor
+from fund_lens_models.search import install_search, scan_statement, search_names
+
+NAMES = ["SMITH, JANE", "SMITHSON, AL", "O'BRIEN, PAT", "GOLDSMITH, ANN", "JONES, BOB", "50%, CO"]
+
+
+@pytest.mark.parametrize("installed", [False, True])
+def test_search_names(installed):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    if installed:
+        with engine.begin() as conn:
+            install_search(conn)
+            install_search(conn)  # Idempotent
+    with Session(engine) as session:
+        session.add_all(GoldContributor(name=name) for name in NAMES)
+        session.commit()
+
+        def names(query, limit=20):
+            return {c.name for c in search_names(session, GoldContributor, query, limit)}
+
+        assert names("smith") == {"SMITH, JANE", "SMITHSON, AL", "GOLDSMITH, ANN"}
+        assert names("o'b") == {"O'BRIEN, PAT"}
+        assert names("50%") == {"50%, CO"}
+        assert names("sm") == {"SMITH, JANE", "SMITHSON, AL", "GOLDSMITH, ANN"}
+        assert len(names("smith", limit=2)) == 2
+        assert names("  ") == set()
+
+        # Renames and deletes stay in sync with the search index
+        jones = session.query(GoldContributor).filter_by(name="JONES, BOB").one()
+        jones.name = "SMITH, BOB"
+        session.delete(session.query(GoldContributor).filter_by(name="SMITHSON, AL").one())
+        session.commit()
+        assert names("jones") == set()
+        assert names("smith") == {"SMITH, JANE", "SMITH, BOB", "GOLDSMITH, ANN"}
+
+
+def test_install_check_is_cached_per_engine(monkeypatch):
+    calls = []
+    check = search._search_installed
+    monkeypatch.setattr(
+        search, "_search_installed", lambda conn, model: calls.append(model) or check(conn, model)
+    )
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(GoldContributor(name="SMITH, JANE"))
+        session.commit()
+        for _ in range(3):
+            assert [c.name for c in search_names(session, GoldContributor, "smith")] == [
+                "SMITH, JANE"
+            ]
+        assert calls == [GoldContributor]
+        assert not search.search_installed(session, GoldContributor)
+
+        # Installing resets the check, so the FTS table is picked up
+        install_search(session.connection())
+        session.commit()
+        assert search.search_installed(session, GoldContributor)
+        assert calls == [GoldContributor, GoldContributor]
+
+
+@pytest.mark.parametrize("trigram", [False, True])
+def test_scan_ranks_by_similarity_only_with_trigram(trigram):
+    sql = str(
+        scan_statement(GoldContributor, "smith", 20, trigram).compile(dialect=postgresql.dialect())
+    )
+    assert ("similarity(" in sql) is trigram
+    assert ("length(" in sql) is not trigram
@@ -0,0 +1,80 @@
+"""Server-side timestamp default tests (SQLite dialect)."""
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    insert,
+    select,
+    text,
+)
+
+from fund_lens_models.base import Base
+from fund_lens_models.silver import SilverTransformWatermark
+from fund_lens_models.timestamps import (
+    install_timestamp_defaults,
+    timestamp_defaults_ddl,
+    timestamp_tables,
+)
+
+
+def test_core_insert_gets_server_timestamps():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    watermark = SilverTransformWatermark.__table__
+    with engine.begin() as conn:
+        conn.execute(insert(watermark), [{"name": "a", "rows_processed": 0}])
+        created, updated = conn.execute(
+            select(watermark.c.created_at, watermark.c.updated_at)
+        ).one()
+        assert created is not None and created == updated
+
+        conn.execute(watermark.update().values(rows_processed=1))
+        assert conn.execute(select(watermark.c.updated_at)).scalar_one() >= updated
+
+
+def test_install_backfills_and_adds_trigger():
+    engine = create_engine("sqlite://")
+    # A table as an older schema created it: nullable timestamps, no defaults
+    legacy = Table(
+        "silver_transform_watermark",
+        MetaData(),
+        Column("name", String(100), primary_key=True),
+        Column("rows_processed", Integer),
+        Column("created_at", DateTime(timezone=True)),
+        Column("updated_at", DateTime(timezone=True)),
+    )
+    table = SilverTransformWatermark.__table__
+    with engine.begin() as conn:
+        legacy.create(conn)
+        conn.execute(insert(legacy), [{"name": "a", "rows_processed": 0}])
+        install_timestamp_defaults(conn, [table])
+        install_timestamp_defaults(conn, [table])  # Idempotent
+
+        created, updated = conn.execute(select(legacy.c.created_at, legacy.c.updated_at)).one()
+        assert created is not None and updated is not None
+
+        # Writes that bypass SQLAlchemy still move updated_at
+        conn.execute(text("UPDATE silver_transform_watermark SET updated_at = '2000-01-01'"))
+        conn.execute(text("UPDATE silver_transform_watermark SET rows_processed = 5"))
+        assert conn.execute(select(legacy.c.updated_at)).scalar_one() > updated
+
+
+def test_postgresql_ddl():
+    table = SilverTransformWatermark.__table__
+    statements = timestamp_defaults_ddl("postgresql", table, nullable=("updated_at",))
+    assert statements[0] == (
+        "UPDATE silver_transform_watermark SET updated_at = COALESCE(updated_at, now()) "
+        "WHERE updated_at IS NULL"
+    )
+    assert statements[1] == (
+        "ALTER TABLE silver_transform_watermark ALTER COLUMN created_at SET DEFAULT now(), "
+        "ALTER COLUMN updated_at SET DEFAULT now(), ALTER COLUMN updated_at SET NOT NULL"
+    )
+    assert "BEFORE UPDATE ON silver_transform_watermark" in statements[-1]
+    assert len(timestamp_defaults_ddl("postgresql", table, trigger=False)) == 1
+    assert table in timestamp_tables()
@@ -0,0 +1,67 @@
+"""Extraction work queue tests (SQLite compare-and-set path)."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from fund_lens_models.base import Base
+from fund_lens_models.bronze import BronzeFECExtractionState
+from fund_lens_models.bronze.work_queue import ExtractionWorkQueue
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory.begin() as session:
+        session.add_all(
+            BronzeFECExtractionState(
+                committee_id=f"C{i:08d}",
+                election_cycle=2024,
+                last_contribution_date=date(2023, 1, 1),
+                last_sub_id="",
+            )
+            for i in range(3)
+        )
+    return factory
+
+
+def test_workers_never_share_committees(session_factory):
+    first = ExtractionWorkQueue(session_factory, "worker-a")
+    second = ExtractionWorkQueue(session_factory, "worker-b")
+
+    leases_a = first.claim(2)
+    leases_b = second.claim(2)
+    assert len(leases_a) == 2
+    assert len(leases_b) == 1
+    assert not {lease.committee_id for lease in leases_a} & {
+        lease.committee_id for lease in leases_b
+    }
+    assert second.claim(2) == []
+
+    # Only the holder can checkpoint or complete
+    assert second.checkpoint(leases_a[0], "SUB1", date(2024, 1, 1), 1) is None
+    lease = first.checkpoint(leases_a[0], "SUB1", date(2024, 1, 1), 1, contributions_extracted=100)
+    assert lease is not None and lease.last_sub_id == "SUB1"
+    assert first.complete(lease)
+
+    with session_factory() as session:
+        state = session.get(BronzeFECExtractionState, (lease.committee_id, 2024))
+        assert state.is_complete
+        assert state.total_contributions_extracted == 100
+        assert state.lease_owner is None
+
+
+def test_expired_lease_is_reclaimed_from_checkpoint(session_factory):
+    crashed = ExtractionWorkQueue(session_factory, "crashed", lease_seconds=-1)
+    (lease,) = crashed.claim(1)
+    crashed.checkpoint(lease, "SUB9", date(2024, 3, 1), 4)
+
+    survivor = ExtractionWorkQueue(session_factory, "survivor")
+    reclaimed = [item for item in survivor.claim(3) if item.committee_id == lease.committee_id]
+    assert reclaimed[0].last_sub_id == "SUB9"
+    assert reclaimed[0].last_page_processed == 4
+    assert crashed.heartbeat(lease) is None